@@ -2,6 +2,8 @@
 This package provides various algorithms for traversing 2D grids.
 
 Modules:
-    algorithms: Contains the Algorithms class for implementing and managing different algorithms.
+    algorithms: Contains the Algorithms class for running the algorithms of the headless search package on the GUI.
+    replay: Contains the TraceReplay class for drawing recorded search traces frame by frame.
 """
 from .algorithms import Algorithms
+from .replay import TraceReplay
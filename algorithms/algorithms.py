@@ -1,9 +1,10 @@
+import os
 import pygame
-import time
-from collections import deque
-import heapq
-import csv
 import logging
+from search import SearchEngine, ResultCache, FieldCache
+from search.store import ResultStore
+from search.trace import TraceRecorder, TRACE_EXTENSION
+from .replay import TraceReplay
 
 class Algorithms:
     """
@@ -12,6 +13,14 @@ class Algorithms:
     Attributes:
         grid: An instance of the Grid class that contains the grid to be processed.
         visited_cubes: A set of visited cube coordinates during the algorithm's execution.
+        result_cache: A ResultCache with the results of previous runs on the same grid content.
+        use_result_cache: False to bypass the result cache (benchmark runs that have to measure cold searches).
+        field_cache: A FieldCache with the distance fields of the goals of previous Dist-Field runs.
+        count_operations: True to count expansions, pushes and stale pops (slows the search down, so these runs are left out of the runtime averages).
+        replan_path: The path of the last LPA* run, which is repaired after edits (None if LPA* was not run last).
+        expansions_per_frame: The number of visited cubes drawn per frame when a trace is replayed (0 == automatic).
+        last_trace: The SearchTrace of the last run (None before the first run).
+        results_store: The ResultStore the statistics are saved to (opened with the first run).
     """
     def __init__(self, grid):
         """
@@ -22,6 +31,14 @@ class Algorithms:
         """
         self.grid = grid
         self.visited_cubes = set()
+        self.result_cache = ResultCache()
+        self.use_result_cache = True
+        self.field_cache = FieldCache()
+        self.count_operations = False
+        self.replan_path = None
+        self.expansions_per_frame = 0
+        self.last_trace = None
+        self.results_store = None
     @staticmethod
     def generate_path(previous_cube, current_cube) -> list:
         """
@@ -34,17 +51,12 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from start to the current cube.
         """
-        path = [current_cube] # current cube is goal
-        while current_cube in previous_cube:
-            current_cube = previous_cube[current_cube]
-            path.append(current_cube)
-        path.reverse() # reverse list for correct order (start to goal)
-        return path
+        return SearchEngine.generate_path(previous_cube, current_cube)
 
     def clear_path(self) -> None:
         """Clears the path by resetting the color of all visited cubes to white."""
         for (x, y) in self.visited_cubes:
-            self.grid.grid[y][x].color = "white"
+            self.grid.set_color(x, y, "white")
         self.visited_cubes.clear()
 
     def get_neighbors(self, x: int, y: int):
@@ -58,50 +70,135 @@ class Algorithms:
         Returns:
             A list of tuples representing the coordinates of the neighboring traversable cubes.
         """
-        neighbors = []
-        for (move_x, move_y) in [(-1, 0), (1, 0), (0, -1), (0, 1)]: # left, right, up, down
-            new_x, new_y = x + move_x, y + move_y
-            # make sure new coordinates are within the grid + traversable
-            if 0 <= new_x < self.grid.cols and 0 <= new_y < self.grid.rows and self.grid.grid[new_y][new_x].traversable:
-                neighbors.append((new_x, new_y))
-        return neighbors
+        return SearchEngine(self.grid).get_neighbors(x, y)
 
-    @staticmethod
-    def save_statistics(path_length: int, visited_cubes: int, max_queue_size: int, runtime: float, found_goal: bool, algorithm: str, current_map_file, memory_tracing_enabled: bool) -> None:
+    def save_statistics(self, result, config: dict) -> None:
+        """
+        Adds the statistics (and the memory profile, if tracked) of a run to the results database.
+
+        The runs are buffered and written by flush_statistics, so a run does not wait for the disk.
+
+        Args:
+            result: The SearchResult of the run.
+            config: The configuration of the run (e.g. whether memory was tracked).
         """
-        Saves pathfinding statistics to a CSV file.
+        if self.results_store is None:
+            self.results_store = ResultStore(source="gui")
+        current_map_file = self.grid.current_map_file
+        self.results_store.add(result, current_map_file, config)
+        logging.info(f"Stats: {result.algorithm} => path_len: {result.path_length}, visited_cubes: {result.visited_cubes}, max_queue_size: {result.max_queue_size}, runtime: {result.runtime}, found_goal: {result.found_goal}, map: {current_map_file if current_map_file else 'na'}")
+        if result.memory is not None:
+            logging.info(f"Memory: {result.algorithm} => {result.memory}")
+
+    def flush_statistics(self) -> None:
+        """Writes the buffered runs to the results database."""
+        if self.results_store is not None:
+            self.results_store.flush()
+
+    def run(self, algorithm: str, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Runs an algorithm of the headless SearchEngine at full speed while recording its trace, then replays the trace on the screen.
+
+        The runtime in the statistics therefore only contains the search itself and not the drawing.
+        With memory tracing, the peak memory of the data structures is accounted after the same search, so runtime
+        and memory come from a single pass. Operations (expansions, pushes, stale pops) are only counted with
+        count_operations, because counting slows the search down.
 
         Args:
-            path_length: The length of the found path (excluding start and goal).
-            visited_cubes: The number of cubes visited during the search.
-            max_queue_size: The maximum size of the queue during the search.
-            runtime: The time taken to perform the search.
-            found_goal: Boolean flag indicating if the goal was found.
-            algorithm: The name of the algorithm used.
-            current_map_file: The name of the current map file used for the search.
-            memory_tracing_enabled: A boolean flag indicating if memory tracing is enabled.
-        """
-        # do not save stats with memory_tracing_enabled to not alter runs with higher runtime due to tracemalloc slowing the process down
-        if memory_tracing_enabled:
+            algorithm: The name of the algorithm (as shown in the dropdown).
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        recorder = TraceRecorder(self.grid)
+        self.visited_cubes = {self.grid.start_cube}
+        if algorithm == "LPA*" and not self.use_result_cache: # cold runs plan from scratch instead of repairing the last search
+            self.grid.incremental_planner().grid_reset()
+        engine = SearchEngine(self.grid, recorder, self.grid.component_index(), self.result_cache, trace_memory_enabled, self.count_operations,
+                              field_cache=self.field_cache if self.use_result_cache else None) # cold runs sweep with an empty cache
+        result = engine.search(algorithm, self.grid.start_cube, self.grid.goal_cube, self.use_result_cache)
+        self.replan_path = (result.path or []) if algorithm == "LPA*" else None
+        if engine.cache_hit: # same search on the same grid content: nothing new to measure
+            return result.path
+        self.save_statistics(result, {"engine": "SearchEngine", "track_memory": trace_memory_enabled, "count_operations": self.count_operations, "component_index": True})
+
+        self.last_trace = recorder.trace(result)
+        self.save_trace(self.last_trace)
+        if not self.replay(self.last_trace, screen, cube_size, offset_x, offset_y): # window closed during the replay
             return None
-        with open("results/Stats.csv", "a", newline="") as f:
-            writer = csv.writer(f, delimiter=";")
-            writer.writerow([algorithm, path_length, visited_cubes, max_queue_size, runtime, found_goal, current_map_file if current_map_file else 'not found'])
-        logging.info(f"Stats: {algorithm} => path_len: {path_length}, visited_cubes: {visited_cubes}, max_queue_size: {max_queue_size}, runtime: {runtime}, found_goal: {found_goal}, map: {current_map_file if current_map_file else 'na'}")
+        return result.path
+
+    def replay(self, trace, screen, cube_size: int, offset_x: int, offset_y: int) -> bool:
+        """
+        Replays the visited cubes of a trace with expansions_per_frame cubes per frame.
+
+        Args:
+            trace: The SearchTrace to replay (recorded on a grid of the same size).
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+
+        Returns:
+            False if the window was closed during the replay, True otherwise.
+        """
+        return TraceReplay(self.grid, screen, cube_size, offset_x, offset_y, self.expansions_per_frame).play(trace, self.visited_cubes)
 
     @staticmethod
-    def save_memory_statistics(stat, algorithm: str, map_file) -> None:
+    def save_trace(trace, trace_dir: str = "results/traces") -> str:
+        """
+        Saves a trace for later playback as `<map>_<algorithm>.trace` (overwriting the trace of the previous run).
+
+        Args:
+            trace: The SearchTrace to save.
+            trace_dir: The directory of the trace files.
+
+        Returns:
+            The path to the saved trace file.
         """
-        Saves memory consumption statistics to a CSV file.
+        map_name = os.path.splitext(trace.map_file)[0] if trace.map_file else "grid"
+        algorithm_name = trace.algorithm.replace("*", "-Star") # '*' is not allowed in filenames on Windows
+        filename = f"{trace_dir}/{map_name}_{algorithm_name}{TRACE_EXTENSION}"
+        trace.save(filename)
+        return filename
+
+    def replan(self, screen, cube_size: int, offset_x: int, offset_y: int):
+        """
+        Repairs the last LPA* search after the grid was edited and redraws its path.
 
         Args:
-            stat: An object containing memory usage statistics.
-            algorithm: The name of the algorithm used.
-            map_file: The name of the map file used.
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+
+        Returns:
+            A list of cubes representing the new path, or None if no path is found or LPA* was not run last.
         """
-        with open("results/Memory-Consumption.csv", "a", newline="") as f:
-            writer = csv.writer(f, delimiter=";")
-            writer.writerow([algorithm, map_file if map_file else 'not found', stat.size / 1024, stat.count, stat.size / stat.count])
+        if self.replan_path is None or not (self.grid.start_cube and self.grid.goal_cube):
+            return None
+        result = SearchEngine(self.grid, None, self.grid.component_index()).search("LPA*", self.grid.start_cube, self.grid.goal_cube)
+        logging.info(f"Replanned: path_len: {result.path_length}, expanded_cubes: {result.visited_cubes}, runtime: {result.runtime}, found_goal: {result.found_goal}")
+
+        # reset the old path and the cubes visited by the first search
+        for (x, y) in self.visited_cubes.union(self.replan_path):
+            if self.grid.is_traversable(x, y):
+                color = "green" if (x, y) == self.grid.start_cube else "red" if (x, y) == self.grid.goal_cube else "white"
+                self.grid.set_color(x, y, color)
+                self.grid.dirty_rects.append(self.grid.draw_cube(screen, x, y, cube_size, offset_x, offset_y))
+        self.visited_cubes.clear()
+        self.replan_path = result.path or []
+        if result.path:
+            self.grid.draw_path(result.path, screen, cube_size, offset_x, offset_y)
+        else:
+            pygame.display.update(self.grid.dirty_rects)
+            self.grid.dirty_rects.clear()
+        return result.path
 
     def bfs(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
         """
@@ -117,46 +214,7 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
         """
-        start_time = time.perf_counter() # get start_time for runtime-calculation
-        queue = deque([self.grid.start_cube]) # initialize queue with start_cube
-        previous_cube = {} # dictionary to track the path (cube to its predecessor)
-        self.visited_cubes = {self.grid.start_cube} # keep track of visited cubes
-        max_queue_size = 1 # track max size of queue
-        while queue:
-            # handle window close while algorithm is running
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            max_queue_size = max(1, len(queue)) # update max queue size
-            current_cube = queue.popleft() # get first element to process from queue
-
-            # goal found
-            if current_cube == self.grid.goal_cube:
-                path = self.generate_path(previous_cube, current_cube)
-                runtime = time.perf_counter() - start_time
-                self.save_statistics(len(path) - 2, len(self.visited_cubes) - 1, max_queue_size, runtime, True, "BFS", self.grid.current_map_file, trace_memory_enabled) # -1 to remove start
-                return path
-
-            # process neighbors of current_cube
-            for neighbor in self.get_neighbors(*current_cube):
-                if neighbor not in self.visited_cubes:
-                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
-                    queue.append(neighbor) # add neighbor to queue to get processed next
-                    self.visited_cubes.add(neighbor) # mark cube as visited
-                    self.grid.grid[neighbor[1]][neighbor[0]].color = "yellow" # update color of cube to yellow
-                    # add cube to list of dirty_rects for updating the screen
-                    self.grid.dirty_rects.append(self.grid.draw_cube(screen, neighbor[0], neighbor[1], cube_size, offset_x, offset_y))
-
-            pygame.display.update(self.grid.dirty_rects) # update parts of screen where dirty_rects are
-            self.grid.dirty_rects.clear() # clear dirty_rects
-
-        # if no path to goal is found
-        logging.info("No path found.")
-        runtime = time.perf_counter() - start_time
-        self.save_statistics(0, len(self.visited_cubes) - 1, max_queue_size, runtime, False, "BFS", self.grid.current_map_file, trace_memory_enabled) # -1 to remove start
-        return None
+        return self.run("BFS", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
 
     def dfs(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
         """
@@ -172,46 +230,7 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
         """
-        start_time = time.perf_counter() # get start_time for runtime-calculation
-        stack = [self.grid.start_cube] # initialize stack with start_cube
-        previous_cube = {}  # dictionary to track the path (cube to its predecessor)
-        self.visited_cubes = {self.grid.start_cube} # keep track of visited cubes
-        max_stack_size = 1 # track max size of stack
-        while stack:
-            # handle window close while algorithm is running
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            max_stack_size = max(1, len(stack)) # update max stack size
-            current_cube = stack.pop() # get top cube from stack
-
-            # goal found
-            if current_cube == self.grid.goal_cube:
-                path = self.generate_path(previous_cube, current_cube)
-                runtime = time.perf_counter() - start_time
-                self.save_statistics(len(path) - 2, len(self.visited_cubes) - 1, max_stack_size, runtime, True, "DFS", self.grid.current_map_file, trace_memory_enabled)  # -1 to remove start
-                return path
-
-            # process neighbors of current_cube
-            for neighbor in self.get_neighbors(*current_cube):
-                if neighbor not in self.visited_cubes:
-                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
-                    stack.append(neighbor) # add neighbor to stack to get processed next
-                    self.visited_cubes.add(neighbor) # mark cube as visited
-                    self.grid.grid[neighbor[1]][neighbor[0]].color = "yellow" # update color of cube to yellow
-                    # add cube to list of dirty_rects for updating the screen
-                    self.grid.dirty_rects.append(self.grid.draw_cube(screen, neighbor[0], neighbor[1], cube_size, offset_x, offset_y))
-
-            pygame.display.update(self.grid.dirty_rects) # update parts of screen where dirty_rects are
-            self.grid.dirty_rects.clear() # clear dirty_rects
-
-        # if no path to goal is found
-        logging.info("No path found.")
-        runtime = time.perf_counter() - start_time
-        self.save_statistics(0, len(self.visited_cubes) - 1, max_stack_size, runtime, False, "DFS", self.grid.current_map_file, trace_memory_enabled)  # -1 to remove start
-        return None
+        return self.run("DFS", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
 
     @staticmethod
     def heuristic(neighbor_cube, goal_cube):
@@ -225,7 +244,7 @@ class Algorithms:
         Returns:
             The Manhattan distance between the neighbor cube and the goal cube.
         """
-        return abs(neighbor_cube[0] - goal_cube[0]) + abs(neighbor_cube[1] - goal_cube[1])
+        return SearchEngine.heuristic(neighbor_cube, goal_cube)
 
     def a_star(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
         """
@@ -241,51 +260,7 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
         """
-        start_time = time.perf_counter() # get start_time for runtime-calculation
-        open_set = [] # initialize open_set to store cubes for exploration
-        heapq.heappush(open_set, (0, self.grid.start_cube))  # add start_cube to open_set with f_score of 0
-        previous_cube = {} # dictionary to track the path (cube to its predecessor)
-        g_score = {self.grid.start_cube: 0} # dictionary to track the cost of each cube
-        self.visited_cubes = {self.grid.start_cube} # keep track of visited cubes
-        max_queue_size = 1 # track max size of open_set during search
-        while open_set:
-            # handle window close while algorithm is running
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
-            current_cube = heapq.heappop(open_set)[1] # get cube with lowest f_score from open_set
-
-            # goal found
-            if current_cube == self.grid.goal_cube:
-                path = self.generate_path(previous_cube, current_cube)
-                runtime = time.perf_counter() - start_time
-                self.save_statistics(len(path) - 2, len(self.visited_cubes) - 1, max_queue_size ,runtime, True, "A*", self.grid.current_map_file, trace_memory_enabled)  # -2: remove start + goal || -1: remove start
-                return path
-
-            # process neighbors of current_cube
-            for neighbor in self.get_neighbors(*current_cube):
-                temp_g_score = g_score[current_cube] + 1  # calculate temp_g_score for neighbor (all edges have a weight of 1)
-                if neighbor not in g_score or temp_g_score < g_score[neighbor]:
-                    self.visited_cubes.add(neighbor) # mark cube as visited
-                    g_score[neighbor] = temp_g_score # set/update g_score of the neighbor
-                    f_score = temp_g_score + self.heuristic(neighbor, self.grid.goal_cube) # f_score = heuristic (h_score) + g_score
-                    heapq.heappush(open_set, (f_score, neighbor)) # push neighbor into open_set with its f_score
-                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
-                    self.grid.grid[neighbor[1]][neighbor[0]].color = "yellow" # update color of cube to yellow
-                    # add cube to list of dirty_rects for updating the screen
-                    self.grid.dirty_rects.append(self.grid.draw_cube(screen, neighbor[0], neighbor[1], cube_size, offset_x, offset_y))
-
-            pygame.display.update(self.grid.dirty_rects) # update parts of screen where dirty_rects are
-            self.grid.dirty_rects.clear() # clear dirty_rects
-
-        # if no path to goal is found
-        logging.info("No path found.")
-        runtime = time.perf_counter() - start_time
-        self.save_statistics(0, len(self.visited_cubes) - 1, max_queue_size, runtime, False, "A*", self.grid.current_map_file, trace_memory_enabled)  # -1 to remove start
-        return None
+        return self.run("A*", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
 
     def dijkstra(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
         """
@@ -301,50 +276,7 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
         """
-        start_time = time.perf_counter() # get start_time for runtime-calculation
-        open_set = [] # initialize open_set to store cubes for exploration
-        heapq.heappush(open_set, (0, self.grid.start_cube))  # add start_cube to open_set with f_score of 0
-        previous_cube = {} # dictionary to track the path (cube to its predecessor)
-        g_score = {self.grid.start_cube: 0} # dictionary to track the cost of each cube
-        self.visited_cubes = {self.grid.start_cube}  # keep track of visited cubes
-        max_queue_size = 1 # track max size of open_set during search
-        while open_set:
-            # handle window close while algorithm is running
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
-            current_cube = heapq.heappop(open_set)[1] # get cube with lowest g_score
-
-            # goal found
-            if current_cube == self.grid.goal_cube:
-                path = self.generate_path(previous_cube, current_cube)
-                runtime = time.perf_counter() - start_time
-                self.save_statistics(len(path) - 2, len(self.visited_cubes) - 1, max_queue_size, runtime, True, "Dijkstra", self.grid.current_map_file, trace_memory_enabled)
-                return path
-
-            # process neighbors of current_cube
-            for neighbor in self.get_neighbors(*current_cube):
-                temp_g_score = g_score[current_cube] + 1  # all edges have a weight of 1
-                if neighbor not in g_score or temp_g_score < g_score[neighbor]:
-                    self.visited_cubes.add(neighbor) # mark cube as visited
-                    g_score[neighbor] = temp_g_score # set/update g_score of the neighbor
-                    heapq.heappush(open_set, (temp_g_score, neighbor)) # push neighbor into open_set with its g_score
-                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
-                    self.grid.grid[neighbor[1]][neighbor[0]].color = "yellow" # update color of cube to yellow
-                    # add cube to list of dirty_rects for updating the screen
-                    self.grid.dirty_rects.append(self.grid.draw_cube(screen, neighbor[0], neighbor[1], cube_size, offset_x, offset_y))
-
-            pygame.display.update(self.grid.dirty_rects) # update parts of screen where dirty_rects are
-            self.grid.dirty_rects.clear() # clear dirty_rects
-
-        # if no path to goal is found
-        logging.info("No path found.")
-        runtime = time.perf_counter() - start_time
-        self.save_statistics(0, len(self.visited_cubes) - 1, max_queue_size, runtime, False, "Dijkstra", self.grid.current_map_file, trace_memory_enabled)
-        return None
+        return self.run("Dijkstra", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
 
     def greedy_best_first_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
         """
@@ -360,45 +292,148 @@ class Algorithms:
         Returns:
             A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
         """
-        start_time = time.perf_counter() # get start_time for runtime-calculation
-        open_set = [] # initialize open_set to store cubes for exploration
-        heapq.heappush(open_set, (0, self.grid.start_cube))  # add start_cube to open_set with h_score of 0
-        previous_cube = {} # dictionary to track the path (cube to its predecessor)
-        self.visited_cubes = {self.grid.start_cube} # keep track of visited cubes
-        max_queue_size = 1 # track max size of open_set during search
-        while open_set:
-            # handle window close while algorithm is running
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    return
-
-            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
-            current_cube = heapq.heappop(open_set)[1] # get cube with lowest h_score
-
-            # goal found
-            if current_cube == self.grid.goal_cube:
-                path = self.generate_path(previous_cube, current_cube)
-                runtime = time.perf_counter() - start_time
-                self.save_statistics(len(path) - 2, len(self.visited_cubes) - 1, max_queue_size, runtime, True, "Greedy-BeFs", self.grid.current_map_file, trace_memory_enabled)
-                return path
-
-            # process neighbors of current_cube
-            for neighbor in self.get_neighbors(*current_cube):
-                if neighbor not in self.visited_cubes:
-                    self.visited_cubes.add(neighbor) # mark cube as visited
-                    h_score = self.heuristic(neighbor, self.grid.goal_cube) # calculate heuristic score (h_score) from neighbor to goal_cube
-                    heapq.heappush(open_set, (h_score, neighbor)) # push neighbor into open_set with its h_score
-                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
-                    self.grid.grid[neighbor[1]][neighbor[0]].color = "yellow" # update color of cube to yellow
-                    # add cube to list of dirty_rects for updating the screen
-                    self.grid.dirty_rects.append(self.grid.draw_cube(screen, neighbor[0], neighbor[1], cube_size, offset_x, offset_y))
-
-            pygame.display.update(self.grid.dirty_rects) # update parts of screen where dirty_rects are
-            self.grid.dirty_rects.clear() # clear dirty_rects
-
-        # if no path to goal is found
-        logging.info("No path found.")
-        runtime = time.perf_counter() - start_time
-        self.save_statistics(0, len(self.visited_cubes) - 1, max_queue_size, runtime, False, "Greedy-BeFs", self.grid.current_map_file, trace_memory_enabled)
-        return None
\ No newline at end of file
+        return self.run("Greedy-BeFs", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def jump_point_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs Jump Point Search (JPS) to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("JPS", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def bidirectional_bfs(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs a bidirectional Breadth-First Search (BFS) from the start cube and the goal cube at the same time.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("Bi-BFS", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def bidirectional_a_star(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs a bidirectional A* search from the start cube and the goal cube at the same time.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("Bi-A*", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def hierarchical_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs Hierarchical Path-Finding A* (HPA*) on the cached cluster graph of the grid (near-optimal path).
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("HPA*", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def hierarchical_search_exact(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs HPA* with exact refinement to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("HPA*-Exact", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def incremental_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs Lifelong Planning A* (LPA*), whose path is repaired after every brush stroke (see replan).
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("LPA*", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def anytime_a_star(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs Anytime Repairing A* (ARA*), which improves a weighted A* path until it is optimal.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("ARA*", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def fringe_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Performs Fringe Search to find the shortest path from the start cube to the goal cube with little memory.
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("Fringe", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
+
+    def distance_field_search(self, screen, cube_size: int, offset_x: int, offset_y: int, trace_memory_enabled: bool):
+        """
+        Finds the shortest path from the start cube to the goal cube in the distance field of the goal (one sweep per goal).
+
+        Args:
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            trace_memory_enabled: A boolean flag indicating if memory tracing is enabled.
+
+        Returns:
+            A list of cubes representing the path from the start cube to the goal cube, or None if no path is found.
+        """
+        return self.run("Dist-Field", screen, cube_size, offset_x, offset_y, trace_memory_enabled)
@@ -0,0 +1,77 @@
+import pygame
+
+class TraceReplay:
+    """
+    Replays a recorded SearchTrace on the Pygame screen, independent of the speed of the search.
+
+    Every frame colors a fixed number of visited cubes yellow and updates the screen once for all of them,
+    so the length of the animation only depends on the number of visited cubes and the frame rate.
+
+    Attributes:
+        grid: An instance of the Grid class the trace is replayed on.
+        screen: The Pygame screen surface to draw the grid on.
+        cube_size: The size of each cube in the grid.
+        offset_x: The horizontal offset for drawing the cubes.
+        offset_y: The vertical offset for drawing the cubes.
+        expansions_per_frame: The number of visited cubes drawn per frame (0 == spread the trace across duration).
+        frames_per_second: The maximum frame rate of the replay.
+        duration: The length of the replay in seconds if expansions_per_frame is 0.
+    """
+    def __init__(self, grid, screen, cube_size: int, offset_x: int, offset_y: int, expansions_per_frame: int = 0,
+                 frames_per_second: int = 60, duration: float = 3.0):
+        """
+        Initializes the TraceReplay with the grid and the drawing settings.
+
+        Args:
+            grid: An instance of the Grid class the trace is replayed on.
+            screen: The Pygame screen surface to draw the grid on.
+            cube_size: The size of each cube in the grid.
+            offset_x: The horizontal offset for drawing the cubes.
+            offset_y: The vertical offset for drawing the cubes.
+            expansions_per_frame: The number of visited cubes drawn per frame (0 == spread the trace across duration).
+            frames_per_second: The maximum frame rate of the replay.
+            duration: The length of the replay in seconds if expansions_per_frame is 0.
+        """
+        self.grid = grid
+        self.screen = screen
+        self.cube_size = cube_size
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+        self.expansions_per_frame = expansions_per_frame
+        self.frames_per_second = frames_per_second
+        self.duration = duration
+
+    def play(self, trace, visited_cubes: set) -> bool:
+        """
+        Draws the visited cubes of a trace frame by frame.
+
+        Args:
+            trace: The SearchTrace to replay.
+            visited_cubes: A set the replayed cubes are added to (so they can be cleared later).
+
+        Returns:
+            False if the window was closed during the replay, True otherwise.
+
+        Raises:
+            ValueError: If the trace was recorded on a grid of a different size.
+        """
+        if (trace.rows, trace.cols) != (self.grid.rows, self.grid.cols):
+            raise ValueError(f"Trace of a {trace.rows}x{trace.cols} grid cannot be replayed on a {self.grid.rows}x{self.grid.cols} grid.")
+        per_frame = self.expansions_per_frame or max(1, -(-len(trace.cells) // int(self.frames_per_second * self.duration)))
+        clock = pygame.time.Clock()
+        for frame_start in range(0, len(trace.cells), per_frame):
+            # handle window close while the trace is replayed
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    return False
+
+            for index in trace.cells[frame_start:frame_start + per_frame]:
+                x, y = trace.coordinates(index)
+                visited_cubes.add((x, y))
+                self.grid.set_color(x, y, "yellow") # update color of cube to yellow
+                self.grid.dirty_rects.append(self.grid.draw_cube(self.screen, x, y, self.cube_size, self.offset_x, self.offset_y))
+            pygame.display.update(self.grid.dirty_rects) # one update per frame
+            self.grid.dirty_rects.clear()
+            clock.tick(self.frames_per_second)
+        return True
@@ -2,7 +2,7 @@
 This package provides functionality for managing and visualizing grids.
 
 Modules:
-    grid: Contains the Grid class for managing a grid of cubes (cells).
+    grid: Contains the Grid class for managing and drawing a grid of cubes (cells).
     gridview: Contains the GridView class for rendering and repositioning the grid.
 """
 from .grid import Grid
@@ -1,23 +1,30 @@
 import pygame
 import logging
 import datetime
-from .cube import Cube
+from search import GridMap
 
-class Grid:
+# colors of the visualization layer, a cube stores the index of its color (obstacles == 1 == "grey")
+COLOR_PALETTE = ("white", "grey", "yellow", "purple", "green", "red")
+COLOR_INDEX = {color: index for index, color in enumerate(COLOR_PALETTE)}
+
+class Grid(GridMap):
     """
-    A class representing a grid consisting of Cube objects.
+    A class representing a grid of cubes (cells) that can be drawn with pygame.
 
-    The Grid class manages a 2D grid of Cube objects, allowing for setting the start and
-    goal positions, adding obstacles, loading, exporting and resizing the grid and drawing paths.
+    The Grid class extends the headless GridMap (occupancy buffer) with a separate color layer,
+    allowing for setting the start and goal positions, adding obstacles, loading, exporting
+    and resizing the grid and drawing paths.
 
     Attributes:
         rows: Number of rows in the grid.
         cols: Number of columns in the grid.
-        grid: A 2D list representing the grid of cubes.
+        occupancy: A bytearray of size rows * cols marking obstacles with 1.
+        colors: A bytearray of size rows * cols storing the index of each cube's color in COLOR_PALETTE.
         start_cube: Coordinates of the start cube.
         goal_cube: Coordinates of the goal cube.
         dirty_rects: List of rectangles that need to be redrawn.
         current_map_file: Filename of the current map file.
+        surface: A pixel-per-cube 8-bit surface sharing its pixels with colors (created by grid_surface).
     """
 
     def __init__(self, rows: int, cols: int):
@@ -28,13 +35,34 @@ class Grid:
             rows (int): Number of rows in the grid.
             cols (int): Number of columns in the grid.
         """
-        self.rows = rows
-        self.cols = cols
-        self.grid = [[Cube() for _ in range(cols)] for _ in range(rows)]
-        self.start_cube = None
-        self.goal_cube = None
+        super().__init__(rows, cols)
+        self.colors = bytearray(rows * cols)
         self.dirty_rects = []
-        self.current_map_file = None
+        self.surface = None
+
+    def get_color(self, x: int, y: int) -> str:
+        """
+        Gets the color of the cube at the specified grid position.
+
+        Args:
+            x: The x-coordinate of the cube in the grid.
+            y: The y-coordinate of the cube in the grid.
+
+        Returns:
+            The color of the cube.
+        """
+        return COLOR_PALETTE[self.colors[y * self.cols + x]]
+
+    def set_color(self, x: int, y: int, color: str) -> None:
+        """
+        Sets the color of the cube at the specified grid position.
+
+        Args:
+            x: The x-coordinate of the cube in the grid.
+            y: The y-coordinate of the cube in the grid.
+            color: The new color of the cube (one of COLOR_PALETTE).
+        """
+        self.colors[y * self.cols + x] = COLOR_INDEX[color]
 
     def draw_cube(self, screen, x: int, y: int, cube_size: int, offset_x: int, offset_y: int):
         """
@@ -52,7 +80,7 @@ class Grid:
             pygame.Rect: The rectangle representing the drawn cube.
         """
         rect = pygame.Rect(offset_x + x * cube_size, offset_y + y * cube_size, cube_size, cube_size)
-        color = self.grid[y][x].color
+        color = COLOR_PALETTE[self.colors[y * self.cols + x]]
         if (x, y) == self.start_cube:
             color = "green"
         elif (x, y) == self.goal_cube:
@@ -63,6 +91,59 @@ class Grid:
             pygame.draw.rect(screen, "black", rect, 1)
         return rect
 
+    def grid_surface(self):
+        """
+        Gets the pixel-per-cube surface of the grid, which is created in bulk from the color layer.
+
+        The surface is an 8-bit surface with COLOR_PALETTE as palette whose pixels are the colors bytearray itself,
+        so every set_color updates the surface without any copy. It is only recreated when the color layer is
+        replaced (load_grid, resize_grid).
+
+        Returns:
+            pygame.Surface: The surface with one pixel per cube.
+        """
+        if self.surface is None:
+            self.surface = pygame.image.frombuffer(self.colors, (self.cols, self.rows), "P")
+            self.surface.set_palette([pygame.Color(color) for color in COLOR_PALETTE])
+        return self.surface
+
+    def draw_grid(self, screen, cube_size: int, offset_x: int, offset_y: int) -> None:
+        """
+        Draws the visible part of the grid by scaling the matching part of the cached grid surface.
+
+        Args:
+            screen: The Pygame surface to draw on.
+            cube_size: The size of each cube in pixels.
+            offset_x: The horizontal offset for drawing the grid on the screen.
+            offset_y: The vertical offset for drawing the grid on the screen.
+        """
+        view = screen.get_rect()
+        # range of the visible cubes (viewport culling)
+        first_x = max(0, (view.left - offset_x) // cube_size)
+        first_y = max(0, (view.top - offset_y) // cube_size)
+        last_x = min(self.cols, -(-(view.right - offset_x) // cube_size))
+        last_y = min(self.rows, -(-(view.bottom - offset_y) // cube_size))
+        if first_x >= last_x or first_y >= last_y:
+            return None
+
+        visible = self.grid_surface().subsurface(pygame.Rect(first_x, first_y, last_x - first_x, last_y - first_y))
+        if cube_size > 1:
+            visible = pygame.transform.scale(visible, ((last_x - first_x) * cube_size, (last_y - first_y) * cube_size))
+        screen.blit(visible, (offset_x + first_x * cube_size, offset_y + first_y * cube_size))
+
+        for cube in (self.start_cube, self.goal_cube): # start and goal are not always part of the color layer (e.g. after loading)
+            if cube and first_x <= cube[0] < last_x and first_y <= cube[1] < last_y:
+                self.draw_cube(screen, cube[0], cube[1], cube_size, offset_x, offset_y)
+        if cube_size > 9: # outline of every cube (both edges, like draw_cube)
+            top, bottom = offset_y + first_y * cube_size, offset_y + last_y * cube_size - 1
+            left, right = offset_x + first_x * cube_size, offset_x + last_x * cube_size - 1
+            for x in range(first_x, last_x):
+                for line_x in (offset_x + x * cube_size, offset_x + (x + 1) * cube_size - 1):
+                    pygame.draw.line(screen, "black", (line_x, top), (line_x, bottom))
+            for y in range(first_y, last_y):
+                for line_y in (offset_y + y * cube_size, offset_y + (y + 1) * cube_size - 1):
+                    pygame.draw.line(screen, "black", (left, line_y), (right, line_y))
+
     def handle_click(self, x: int, y: int, screen, cube_size: int, offset_x: int, offset_y: int, selected_tool: int) -> None:
         """
         Handles mouse click events on the grid and updates the grid state based on the selected tool.
@@ -84,35 +165,35 @@ class Grid:
                 if self.start_cube:
                     old_x, old_y = self.start_cube
                     self.start_cube = None
-                    self.grid[old_y][old_x].traversable = True
-                    self.grid[old_y][old_x].color = "white"
+                    self.set_traversable(old_x, old_y, True)
+                    self.set_color(old_x, old_y, "white")
                     self.dirty_rects.append(self.draw_cube(screen, old_x, old_y, cube_size, offset_x, offset_y))
                 self.start_cube = (grid_x, grid_y)
-                self.grid[grid_y][grid_x].traversable = True
-                self.grid[grid_y][grid_x].color = "green"
+                self.set_traversable(grid_x, grid_y, True)
+                self.set_color(grid_x, grid_y, "green")
                 self.dirty_rects.append(self.draw_cube(screen, grid_x, grid_y, cube_size, offset_x, offset_y))
             elif selected_tool == 1:
                 if self.goal_cube:
                     old_x, old_y = self.goal_cube
                     self.goal_cube = None
-                    self.grid[old_y][old_x].traversable = True
-                    self.grid[old_y][old_x].color = "white"
+                    self.set_traversable(old_x, old_y, True)
+                    self.set_color(old_x, old_y, "white")
                     self.dirty_rects.append(self.draw_cube(screen, old_x, old_y, cube_size, offset_x, offset_y))
                 self.goal_cube = (grid_x, grid_y)
-                self.grid[grid_y][grid_x].traversable = True
-                self.grid[grid_y][grid_x].color = "red"
+                self.set_traversable(grid_x, grid_y, True)
+                self.set_color(grid_x, grid_y, "red")
                 self.dirty_rects.append(self.draw_cube(screen, grid_x, grid_y, cube_size, offset_x, offset_y))
             elif selected_tool == 2:
-                self.grid[grid_y][grid_x].color = "grey"
-                self.grid[grid_y][grid_x].traversable = False
+                self.set_color(grid_x, grid_y, "grey")
+                self.set_traversable(grid_x, grid_y, False)
                 self.dirty_rects.append(self.draw_cube(screen, grid_x, grid_y, cube_size, offset_x, offset_y))
             elif selected_tool == 3:
                 if (grid_x, grid_y)  == self.start_cube:
                     self.start_cube = None
                 elif (grid_x, grid_y)  == self.goal_cube:
                     self.goal_cube = None
-                self.grid[grid_y][grid_x].color = "white"
-                self.grid[grid_y][grid_x].traversable = True
+                self.set_color(grid_x, grid_y, "white")
+                self.set_traversable(grid_x, grid_y, True)
                 self.dirty_rects.append(self.draw_cube(screen, grid_x, grid_y, cube_size, offset_x, offset_y))
 
     def export_grid(self) -> None:
@@ -122,28 +203,17 @@ class Grid:
         The file is saved with a timestamp and includes the grid dimensions,
         start and goal positions, and the grid layout.
         """
-        def generate_grid_data():
-            yield f"rows {self.rows}\n"
-            yield f"cols {self.cols}\n"
-            if self.start_cube:
-                yield f"start {self.start_cube[0]},{self.start_cube[1]}\n"
-            if self.goal_cube:
-                yield f"goal {self.goal_cube[0]},{self.goal_cube[1]}\n"
-
-            # Generate grid data
-            for row in self.grid:
-                yield ''.join('@' if not cube.traversable else '.' for cube in row) + '\n'
-
         current_time = datetime.datetime.now()
         timestamp = current_time.strftime("%Y_%m_%d-%H_%M_%S")
         filename = f"maps/{self.rows}x{self.cols}_{timestamp}.txt"
 
         with open(filename, 'w') as f:
-            for line in generate_grid_data():
+            for line in self.generate_map_data():
                 f.write(line)
 
         self.current_map_file = filename.rsplit('/',1)[1]
         logging.debug(f"Map saved under: {filename}")
+
     def load_grid(self, filename: str) -> None:
         """
         Loads a grid configuration from a specified file.
@@ -153,36 +223,9 @@ class Grid:
         Args:
             filename: The path to the file to be loaded.
         """
-        self.start_cube = None
-        self.goal_cube = None
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-
-            self.rows = int(lines[0].split()[1])
-            self.cols = int(lines[1].split()[1])
-            self.grid = [[Cube() for _ in range(self.cols)] for _ in range(self.rows)]
-            self.current_map_file = filename.rsplit('/',1)[1]
-
-            y = 0
-            for line in lines[2:]:
-                if line.startswith("start"):
-                    start_x, start_y = map(int, line.split()[1].split(','))
-                    self.start_cube = (start_x, start_y)
-                elif line.startswith("goal"):
-                    goal_x, goal_y = map(int, line.split()[1].split(','))
-                    self.goal_cube = (goal_x, goal_y)
-                else:
-                    row_data = line.strip()
-                    for x, char in enumerate(row_data):
-                        if char == '@':
-                            self.grid[y][x].traversable = False
-                            self.grid[y][x].color = "grey"
-                        elif char == '.':
-                            self.grid[y][x].traversable = True
-                            self.grid[y][x].color = "white"
-                    y += 1
-
-            logging.debug(f"Loaded map from: {filename}")
+        self.load_map(filename)
+        self.colors = bytearray(self.occupancy) # obstacles (1) are grey, traversable cubes (0) white
+        self.surface = None # surface of the old color layer
 
     def resize_grid(self, new_rows: int, new_cols: int) -> None:
         """
@@ -192,11 +235,9 @@ class Grid:
             new_rows: The new number of rows for the grid.
             new_cols: The new number of columns for the grid.
         """
-        self.rows = new_rows
-        self.cols = new_cols
-        self.grid = [[Cube() for _ in range(new_cols)] for _ in range(new_rows)]
-        self.start_cube = None
-        self.goal_cube = None
+        self.resize(new_rows, new_cols)
+        self.colors = bytearray(new_rows * new_cols)
+        self.surface = None # surface of the old color layer
 
     def draw_path(self, path, screen, cube_size: int, offset_x: int, offset_y: int) -> None:
         """
@@ -210,7 +251,7 @@ class Grid:
             offset_y: The vertical offset for drawing the grid on the screen.
         """
         for (x, y) in path:
-            self.grid[y][x].color = "purple"
+            self.set_color(x, y, "purple")
             self.dirty_rects.append(self.draw_cube(screen, x, y, cube_size, offset_x, offset_y))
         pygame.display.flip()
         self.dirty_rects.clear()
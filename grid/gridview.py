@@ -30,6 +30,17 @@ class GridView:
         self.center_x = 0
         self.center_y = 0
 
+    def cell_size(self) -> int:
+        """
+        Calculates the size of a cube in pixels for the current zoom factor.
+
+        The size is never smaller than one pixel, so cubes of large grids do not vanish when the zoomed size rounds down to 0.
+
+        Returns:
+            The size of a cube in pixels.
+        """
+        return max(1, int(self.cube_size * self.zoom_factor))
+
     def calculate_zoom_factor(self, grid_rows: int, grid_cols: int) -> None:
         """
         Calculates and sets the appropriate zoom factor based on the grid dimensions
@@ -51,7 +62,7 @@ class GridView:
             grid_rows: The number of rows in the grid.
             grid_cols: The number of columns in the grid.
         """
-        grid_width = grid_cols * int(self.cube_size * self.zoom_factor)
-        grid_height = grid_rows * int(self.cube_size * self.zoom_factor)
+        grid_width = grid_cols * self.cell_size()
+        grid_height = grid_rows * self.cell_size()
         self.center_x = (self.window_width - grid_width) // 2
         self.center_y = (self.window_height - grid_height) // 2
\ No newline at end of file
@@ -1,10 +1,10 @@
 import pygame
 from grid import Grid, GridView
 from algorithms import Algorithms
+from search import SearchTrace
 from ui import Toolbar, InputField, Dropdown, ToggleButton, DebugText
 from tkinter import filedialog
 import logging
-import tracemalloc
 import os
 
 def main() -> None:
@@ -33,9 +33,7 @@ def main() -> None:
         memory_tracing_toggle.draw(screen)
         run_ten_times_toggle.draw(screen)
         all_maps_toggle.draw(screen)
-        for y in range(grid.rows):
-            for x in range(grid.cols):
-                grid.draw_cube(screen, x, y, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y)
+        grid.draw_grid(screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y) # cached surface, visible part only
 
         if grid.current_map_file:
             debug_text.draw(screen, f"Current Map: {grid.current_map_file}", (10, grid_view.window_height - 30))
@@ -67,7 +65,7 @@ def main() -> None:
     input_field = InputField(window_width - 270, 10, 100, 30, 270, font_input_field, pygame.Color('grey75'), pygame.Color('grey0'), redraw_screen)
 
     # dropdown setup
-    dropdown = Dropdown(window_width - 400, 10, 120, 25, 400, font_drop_down, ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs", "Run all"])
+    dropdown = Dropdown(window_width - 400, 10, 120, 25, 400, font_drop_down, ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs", "JPS", "Bi-BFS", "Bi-A*", "HPA*", "HPA*-Exact", "LPA*", "ARA*", "Fringe", "Dist-Field", "Run all"])
 
     # toggle button setup
     memory_tracing_toggle = ToggleButton(window_width - 160, 10, 60, 30, 160, memory_tracing_toggle_button, "Trace-Memory")
@@ -132,29 +130,47 @@ def main() -> None:
             "BFS": algorithms.bfs,
             "A*": algorithms.a_star,
             "Dijkstra": algorithms.dijkstra,
-            "Greedy-BeFs": algorithms.greedy_best_first_search
+            "Greedy-BeFs": algorithms.greedy_best_first_search,
+            "JPS": algorithms.jump_point_search,
+            "Bi-BFS": algorithms.bidirectional_bfs,
+            "Bi-A*": algorithms.bidirectional_a_star,
+            "HPA*": algorithms.hierarchical_search,
+            "HPA*-Exact": algorithms.hierarchical_search_exact,
+            "LPA*": algorithms.incremental_search,
+            "ARA*": algorithms.anytime_a_star,
+            "Fringe": algorithms.fringe_search,
+            "Dist-Field": algorithms.distance_field_search
         }
         if algorithm in pathfinding_algorithms:
 
             algo_runs = 10 if run_ten_times_toggle.state else 1
+            # repeated runs and memory tracing are benchmarks: bypass the result cache to measure cold searches
+            algorithms.use_result_cache = not (run_ten_times_toggle.state or memory_tracing_toggle.state)
 
             for _ in range(algo_runs):
                 algorithms.clear_path() # clear previous path
                 redraw_screen(algorithm) # redraw screen with debug_text of current running algorithm
 
-                if memory_tracing_toggle.state:
-                    tracemalloc.start() # start memory tracing
+                path = pathfinding_algorithms[algorithm](screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y, memory_tracing_toggle.state)
 
-                path = pathfinding_algorithms[algorithm](screen, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y, memory_tracing_toggle.state)
+                if path:
+                    grid.draw_path(path, screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y)
+            algorithms.flush_statistics() # one write for all runs
 
-                if memory_tracing_toggle.state:
-                    snapshot = tracemalloc.take_snapshot()
-                    top_stats = snapshot.statistics('filename') # get memory stats grouped by filename
-                    algorithms.save_memory_statistics(top_stats[0], algorithm, grid.current_map_file)
-                    tracemalloc.stop()
+    def replay_trace(trace) -> None:
+        """Replay a recorded search trace on the current grid and draw its path.
 
-                if path:
-                    grid.draw_path(path, screen, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y)
+        Args:
+            trace: The SearchTrace to replay.
+        """
+        if (trace.rows, trace.cols) != (grid.rows, grid.cols):
+            logging.warning(f"Trace of a {trace.rows}x{trace.cols} grid ({trace.map_file}) cannot be replayed on a {grid.rows}x{grid.cols} grid.")
+            return None
+        algorithms.clear_path() # clear previous path
+        redraw_screen(trace.algorithm)
+        cube_size = grid_view.cell_size()
+        if algorithms.replay(trace, screen, cube_size, grid_view.center_x, grid_view.center_y) and trace.path is not None:
+            grid.draw_path(trace.path_cubes(), screen, cube_size, grid_view.center_x, grid_view.center_y)
 
     def run_all_algorithms(grid, algorithms, grid_view, screen) -> None:
         """Run all pathfinding algorithms in sequence.
@@ -165,7 +181,7 @@ def main() -> None:
             grid_view: The view settings for the grid.
             screen: The display surface object.
         """
-        algorithm_options = ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs"]
+        algorithm_options = ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs", "JPS", "Bi-BFS", "Bi-A*", "HPA*", "HPA*-Exact", "LPA*", "ARA*", "Fringe", "Dist-Field"]
         for algorithm in algorithm_options:
             run_algorithm(grid, algorithms, grid_view, screen, algorithm)
             pygame.time.wait(500)
@@ -217,7 +233,7 @@ def main() -> None:
             if toolbar.selected_tool == 7: # import map
                 toolbar.selected_tool = None
                 map_dir = os.getcwd() + "/maps"
-                filename = filedialog.askopenfilename(initialdir=map_dir, filetypes=[("Text files", "*.txt")]) # filedialog to select map to import
+                filename = filedialog.askopenfilename(initialdir=map_dir, filetypes=[("Text files", "*.txt"), ("Moving AI maps", "*.map")]) # filedialog to select map to import
                 if filename:
                     algorithms.visited_cubes.clear()
                     grid.load_grid(filename) # load new map
@@ -253,7 +269,7 @@ def main() -> None:
                             if all_maps_toggle.state:
                                 run_all_maps(grid, algorithms, grid_view, screen, dropdown.selected)
                             else:
-                                if dropdown.selected in ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs"] and grid.start_cube and grid.goal_cube:
+                                if dropdown.selected in ["DFS", "BFS", "A*", "Dijkstra", "Greedy-BeFs", "JPS", "Bi-BFS", "Bi-A*", "HPA*", "HPA*-Exact", "LPA*", "ARA*", "Fringe", "Dist-Field"] and grid.start_cube and grid.goal_cube:
                                     run_algorithm(grid, algorithms, grid_view, screen, dropdown.selected)
                                 elif dropdown.selected == "Run all" and grid.start_cube and grid.goal_cube:
                                     run_all_algorithms(grid, algorithms, grid_view, screen)
@@ -288,9 +304,11 @@ def main() -> None:
                             move_grid_x, move_grid_y = event.pos
                             move_grid = True
                         else:
-                            grid.handle_click(x, y, screen, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y, toolbar.selected_tool)
+                            grid.handle_click(x, y, screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y, toolbar.selected_tool)
 
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+                    if mouse_down and not move_grid and dropdown.selected == "LPA*": # brush stroke finished: repair the LPA* path
+                        algorithms.replan(screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y)
                     mouse_down = False
                     if move_grid:
                         redraw_screen()
@@ -310,22 +328,33 @@ def main() -> None:
                         move_grid_x = x
                         move_grid_y = y
                     else:
-                        grid.handle_click(x, y, screen, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y, toolbar.selected_tool)
+                        grid.handle_click(x, y, screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y, toolbar.selected_tool)
 
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_UP:
                     grid_view.zoom_factor += grid_view.zoom_increment # zoom in
-                    logging.debug(f"Zoomed in. New zoom factor: {grid_view.zoom_factor} + {int(grid_view.cube_size * grid_view.zoom_factor)}")
+                    logging.debug(f"Zoomed in. New zoom factor: {grid_view.zoom_factor} + {grid_view.cell_size()}")
                     grid_view.center_grid(grid.rows, grid.cols)
                     redraw_screen()
                 elif event.key == pygame.K_DOWN:
                     grid_view.zoom_factor = max(grid_view.zoom_increment, grid_view.zoom_factor - grid_view.zoom_increment) # zoom out (not below zoom increment)
-                    logging.debug(f"Zoomed out. New zoom factor: {grid_view.zoom_factor} + {int(grid_view.cube_size * grid_view.zoom_factor)}")
+                    logging.debug(f"Zoomed out. New zoom factor: {grid_view.zoom_factor} + {grid_view.cell_size()}")
                     grid_view.center_grid(grid.rows, grid.cols)
                     redraw_screen()
+                elif event.key == pygame.K_r and not input_field.active and algorithms.last_trace: # replay the trace of the last run
+                    replay_trace(algorithms.last_trace)
+                elif event.key == pygame.K_c and not input_field.active: # toggle counting of expansions, pushes and stale pops
+                    algorithms.count_operations = not algorithms.count_operations
+                    logging.info(f"Counting operations: {'on' if algorithms.count_operations else 'off'}")
+                elif event.key == pygame.K_t and not input_field.active: # replay a saved trace
+                    filename = filedialog.askopenfilename(initialdir=os.getcwd() + "/results/traces", filetypes=[("Search traces", "*.trace")])
+                    if filename:
+                        replay_trace(SearchTrace.load(filename))
                 input_field.handle_input(event, screen, grid, grid_view)
 
         # redraw only portions of the screen which need to be updated (dirty_rects)
-        grid.redraw_dirty_rects(screen, int(grid_view.cube_size * grid_view.zoom_factor), grid_view.center_x, grid_view.center_y)
+        grid.redraw_dirty_rects(screen, grid_view.cell_size(), grid_view.center_x, grid_view.center_y)
 
+    if algorithms.results_store is not None:
+        algorithms.results_store.close()
     pygame.quit()
\ No newline at end of file
@@ -0,0 +1,49 @@
+"""
+This package provides headless pathfinding that runs without pygame.
+
+Modules:
+    gridmap: Contains the GridMap class for loading and storing maps without rendering state.
+    mapcache: Contains functions for reading and writing the binary sidecar (one byte per cell) of map files.
+    engine: Contains the SearchEngine class implementing the algorithms (including the anytime ARA*) and the SearchObserver base class.
+    indexed: Contains the IndexedSearchEngine class running A* and Dijkstra on flat integer cell ids.
+    jps: Contains the JumpPointSearch class for uniform-cost, 4-connected grids.
+    fringe: Contains the FringeSearch class, an optimal search with a small, fixed memory footprint and an optional memory limit.
+    fields: Contains the DistanceField class (one-to-many distances and parents of one sweep) and the FieldCache class caching them per grid and sources.
+    bidirectional: Contains the BidirectionalSearch class with bidirectional variants of BFS and A*.
+    components: Contains the ComponentIndex class labelling the connected components of a grid.
+    wavefront: Contains the bitset wavefront (whole-frontier breadth-first flood on integers) for full-map distance transforms.
+    landmarks: Contains the LandmarkTable class (ALT heuristic) with distance tables saved next to the map (`python -m search.landmarks`).
+    pathdb: Contains the PathDatabase class, a compressed path database (first moves of all shortest paths) built offline (`python -m search.pathdb`).
+    hierarchical: Contains the ClusterGraph and HierarchicalSearch classes for HPA* on cached clusters.
+    incremental: Contains the IncrementalPlanner class (LPA*) that repairs its search after edits of the grid.
+    trace: Contains the SearchTrace class (recorded visited cubes, saved as .trace files) and the TraceRecorder observer.
+    openlist: Contains the BucketQueue class and create_open_list, the switchable open list backends (heap or buckets).
+    counters: Contains the SearchCounters class counting expansions, open list pushes and stale pops of a search.
+    memory: Contains the MemoryTracker class accounting the peak memory of a search per data structure (MemoryProfile).
+    cache: Contains the ResultCache class, an LRU cache of search results keyed by grid content and query.
+    result: Contains the SearchResult class holding the path and statistics of a search.
+    scenario: Command line runner (`python -m search.scenario`) for the queries of Moving AI scenario files (.scen).
+    store: Contains the ResultStore class, a buffered SQLite database of runs grouped into sessions with machine metadata.
+    environment: Contains functions collecting the interpreter, CPU and git metadata of benchmarks and result sessions.
+    batch: Command line runner (`python -m search.batch`) for sweeps of maps x algorithms on a process pool.
+    benchmark: Command line runner (`python -m search.benchmark`) timing maps x algorithms with warmup, repetitions and statistics (JSON report).
+"""
+from .gridmap import GridMap
+from .engine import SearchEngine, SearchObserver, find_path
+from .indexed import IndexedSearchEngine
+from .jps import JumpPointSearch
+from .bidirectional import BidirectionalSearch
+from .fringe import FringeSearch
+from .fields import DistanceField, FieldCache
+from .result import SearchResult
+from .cache import ResultCache
+from .memory import MemoryProfile, MemoryTracker
+from .counters import SearchCounters
+from .openlist import BucketQueue, create_open_list
+from .store import ResultStore
+from .incremental import IncrementalPlanner
+from .trace import SearchTrace, TraceRecorder
+from .components import ComponentIndex
+from .hierarchical import ClusterGraph, HierarchicalSearch
+from .landmarks import LandmarkTable
+from .pathdb import PathDatabase
@@ -0,0 +1,125 @@
+import os
+import argparse
+import logging
+import time
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from .gridmap import GridMap
+from .engine import SearchEngine
+from .store import ResultStore, DEFAULT_DATABASE
+from .openlist import OPEN_LISTS
+
+@lru_cache(maxsize=4)
+def load_cached_map(map_path: str) -> GridMap:
+    """
+    Loads a map once per worker process, so consecutive jobs on the same map reuse it.
+
+    Args:
+        map_path: The path to the map file.
+
+    Returns:
+        GridMap: The loaded map.
+    """
+    return GridMap.load(map_path)
+
+def run_job(job: tuple) -> tuple:
+    """
+    Runs a single (map, algorithm, repetition) job inside a worker process.
+
+    The peak memory is accounted after the search (see MemoryTracker), so it does not change the runtime.
+
+    Args:
+        job: A tuple of the map path, the algorithm name, the repetition number and the options of the SearchEngine.
+
+    Returns:
+        tuple: The name of the map file and the SearchResult (with its MemoryProfile).
+    """
+    map_path, algorithm, _, engine_options = job
+    grid_map = load_cached_map(map_path)
+    if algorithm == "LPA*": # the cached map keeps its planner: start every repetition from scratch
+        grid_map.incremental_planner().grid_reset()
+    result = SearchEngine(grid_map, track_memory=True, **engine_options).search(algorithm, grid_map.start_cube, grid_map.goal_cube)
+    return grid_map.current_map_file, result
+
+def collect_map_files(paths: list) -> list:
+    """
+    Collects all map files (.txt) from the given files and directories.
+
+    Args:
+        paths: A list of map files and/or directories containing map files.
+
+    Returns:
+        A sorted list of map file paths.
+    """
+    map_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            map_files.extend(os.path.join(path, f).replace("\\", "/") for f in os.listdir(path) if f.endswith('.txt'))
+        else:
+            map_files.append(path)
+    return sorted(map_files)
+
+def run_batch(map_files: list, algorithms: list, repetitions: int = 1, workers: int = None, engine_options: dict = None) -> list:
+    """
+    Runs every algorithm on every map repetitions times, spread across a process pool.
+
+    Jobs are ordered by map so each worker mostly reuses the map it has already loaded.
+
+    Args:
+        map_files: A list of map file paths.
+        algorithms: A list of algorithm names (see SearchEngine.ALGORITHMS).
+        repetitions: How often each algorithm is run on each map.
+        workers: The number of worker processes (default: number of CPUs).
+        engine_options: Keyword arguments of the SearchEngine (e.g. count_operations, open_list or time_budget).
+
+    Returns:
+        A list of (map file name, SearchResult) tuples in job order.
+    """
+    engine_options = engine_options or {}
+    jobs = [(map_file, algorithm, repetition, engine_options) for map_file in map_files for algorithm in algorithms for repetition in range(repetitions)]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_job, jobs, chunksize=chunksize))
+
+def main() -> None:
+    """Main function to parse the command line arguments and run the batch."""
+    parser = argparse.ArgumentParser(description="Run pathfinding algorithms on maps in parallel.")
+    parser.add_argument("--maps", nargs="+", default=["maps"], help="map files and/or directories (default: maps)")
+    parser.add_argument("--algorithms", nargs="+", default=list(SearchEngine.ALGORITHMS), choices=list(SearchEngine.ALGORITHMS), help="algorithms to run (default: all)")
+    parser.add_argument("--repetitions", type=int, default=1, help="runs per map and algorithm (default: 1)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: number of CPUs)")
+    parser.add_argument("--count-operations", action="store_true", help="count expansions, pushes and stale pops (slows the searches down)")
+    parser.add_argument("--open-list", choices=list(OPEN_LISTS), default="heap", help="open list of A*, Dijkstra, Greedy-BeFs and JPS (default: heap)")
+    parser.add_argument("--time-budget", type=float, default=None, help="seconds after which ARA* returns its best path (default: none)")
+    parser.add_argument("--expansion-budget", type=int, default=None, help="expansions after which ARA* returns its best path (default: none)")
+    parser.add_argument("--epsilon", type=float, default=3.0, help="initial heuristic weight of ARA* (default: 3.0)")
+    parser.add_argument("--memory-limit", type=int, default=None, help="bytes the structures of Fringe Search may hold (default: none)")
+    parser.add_argument("--landmarks", action="store_true", help="guide A*, Greedy-BeFs and ARA* with the ALT heuristic (landmark tables)")
+    parser.add_argument("--database", default=DEFAULT_DATABASE, help=f"results database to add the runs to (default: {DEFAULT_DATABASE})")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    map_files = collect_map_files(args.maps)
+    start_time = time.perf_counter()
+    engine_options = {"count_operations": args.count_operations, "open_list": args.open_list, "time_budget": args.time_budget,
+                      "expansion_budget": args.expansion_budget, "initial_epsilon": args.epsilon, "memory_limit": args.memory_limit,
+                      "use_landmarks": args.landmarks}
+    runs = run_batch(map_files, args.algorithms, args.repetitions, args.workers, engine_options)
+    config = {"maps": map_files, "algorithms": args.algorithms, "repetitions": args.repetitions, "workers": args.workers, **engine_options}
+    with ResultStore(args.database, "batch", config, buffer_size=len(runs) or 1) as store:
+        for map_file, result in runs:
+            run_config = {"engine": "SearchEngine", "track_memory": True, "count_operations": args.count_operations,
+                          "open_list": args.open_list if result.algorithm in SearchEngine.OPEN_LIST_ALGORITHMS else None}
+            if result.algorithm == "ARA*":
+                run_config.update(time_budget=args.time_budget, expansion_budget=args.expansion_budget, initial_epsilon=args.epsilon)
+            if result.algorithm in ("A*", "Greedy-BeFs", "ARA*"):
+                run_config.update(use_landmarks=args.landmarks)
+            if result.algorithm == "Fringe":
+                run_config.update(memory_limit=args.memory_limit)
+            store.add(result, map_file, run_config)
+    print(f"{len(runs)} runs on {len(map_files)} maps finished in {time.perf_counter() - start_time:.2f} s -> {args.database}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+import os
+import gc
+import json
+import math
+import time
+import argparse
+import logging
+import statistics
+from .gridmap import GridMap
+from .engine import SearchEngine
+from .openlist import OPEN_LISTS
+from .indexed import IndexedSearchEngine
+from .batch import collect_map_files
+from .environment import collect_metadata
+
+def percentile(sorted_values: list, fraction: float) -> float:
+    """
+    Calculates a percentile of sorted values with linear interpolation between the closest ranks.
+
+    Args:
+        sorted_values: The values in ascending order.
+        fraction: The percentile as a fraction (e.g. 0.25 for the first quartile).
+
+    Returns:
+        The percentile.
+    """
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+def median_confidence_interval(sorted_values: list, level: float = 0.95) -> tuple:
+    """
+    Calculates a distribution-free confidence interval of the median from the order statistics.
+
+    The number of values below the median is binomial(n, 0.5), so the interval between the k-th smallest and
+    the k-th largest value covers the median with probability 1 - 2 * P(X < k). The largest k that still reaches
+    the requested level is used; with too few values the interval is the full range (with a lower coverage).
+
+    Args:
+        sorted_values: The values in ascending order.
+        level: The requested confidence level.
+
+    Returns:
+        tuple: The lower bound, the upper bound and the actual coverage of the interval.
+    """
+    count = len(sorted_values)
+    cumulative = [0.0] # cumulative[k] = P(X < k) for X ~ binomial(count, 0.5)
+    for k in range(count):
+        cumulative.append(cumulative[-1] + math.comb(count, k) / 2 ** count)
+    best_k = 0
+    for k in range(count // 2):
+        if 1 - 2 * cumulative[k + 1] >= level:
+            best_k = k + 1
+    best_k = max(best_k, 1)
+    return sorted_values[best_k - 1], sorted_values[count - best_k], 1 - 2 * cumulative[best_k]
+
+def summarize(runtimes_ns: list, level: float = 0.95) -> dict:
+    """
+    Summarizes the runtimes of the repetitions of a benchmark.
+
+    Args:
+        runtimes_ns: The runtimes in nanoseconds.
+        level: The confidence level of the interval of the median.
+
+    Returns:
+        A dictionary with median, quartiles, IQR, mean, standard deviation, min, max and the confidence interval of the median (all in ns).
+    """
+    values = sorted(runtimes_ns)
+    first_quartile, third_quartile = percentile(values, 0.25), percentile(values, 0.75)
+    ci_low, ci_high, coverage = median_confidence_interval(values, level)
+    return {
+        "median_ns": statistics.median(values),
+        "q1_ns": first_quartile,
+        "q3_ns": third_quartile,
+        "iqr_ns": third_quartile - first_quartile,
+        "mean_ns": statistics.fmean(values),
+        "stdev_ns": statistics.stdev(values) if len(values) > 1 else 0.0,
+        "min_ns": values[0],
+        "max_ns": values[-1],
+        "ci_low_ns": ci_low,
+        "ci_high_ns": ci_high,
+        "ci_level": coverage
+    }
+
+def benchmark(grid_map, algorithm: str, warmup: int, repetitions: int, disable_gc: bool, indexed: bool, open_list: str = "heap") -> dict:
+    """
+    Runs one algorithm on one map: warmup runs first, then the timed repetitions.
+
+    Every repetition is timed with perf_counter_ns around the complete search call. With disable_gc, a full
+    collection runs before each repetition and the garbage collector is disabled while it is timed.
+    LPA* is reset before each run, so every repetition is a new search and not a repair, and the field cache of
+    Dist-Field is cleared, so every repetition sweeps the map instead of only extracting the path.
+
+    Args:
+        grid_map: The GridMap to search on (its start and goal are used).
+        algorithm: The name of the algorithm (see SearchEngine.ALGORITHMS).
+        warmup: The number of untimed runs before the repetitions.
+        repetitions: The number of timed runs.
+        disable_gc: Whether to disable the garbage collector during the timed runs.
+        indexed: Whether to use the IndexedSearchEngine.
+        open_list: The open list backend (see create_open_list).
+
+    Returns:
+        A dictionary with the result of the search and the runtimes in nanoseconds.
+    """
+    engine = IndexedSearchEngine(grid_map, open_list=open_list) if indexed else SearchEngine(grid_map, open_list=open_list)
+    runtimes_ns = []
+    result = None
+    gc_was_enabled = gc.isenabled()
+    try:
+        for run in range(warmup + repetitions):
+            if algorithm == "LPA*":
+                grid_map.incremental_planner().grid_reset()
+            if algorithm == "Dist-Field":
+                engine.field_cache.clear()
+            if disable_gc:
+                gc.collect()
+                gc.disable()
+            start_time = time.perf_counter_ns()
+            result = engine.search(algorithm, grid_map.start_cube, grid_map.goal_cube)
+            end_time = time.perf_counter_ns()
+            if gc_was_enabled:
+                gc.enable()
+            if run >= warmup:
+                runtimes_ns.append(end_time - start_time)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return {
+        "path_length": result.path_length,
+        "visited_cubes": result.visited_cubes,
+        "max_queue_size": result.max_queue_size,
+        "found_goal": result.found_goal,
+        "suboptimality": result.suboptimality,
+        "time_to_first_solution": result.time_to_first_solution,
+        "runtimes_ns": runtimes_ns
+    }
+
+def run_benchmarks(map_files: list, algorithms: list, warmup: int = 1, repetitions: int = 10, disable_gc: bool = True,
+                   indexed: bool = False, level: float = 0.95, open_lists: tuple = ("heap",)) -> dict:
+    """
+    Runs every algorithm on every map and summarizes the runtimes.
+
+    Algorithms with a switchable open list (see SearchEngine.OPEN_LIST_ALGORITHMS) run once per backend. The results
+    of the other backends have the speedup of their median over the median of the heap (if it is benchmarked too).
+
+    Args:
+        map_files: A list of map file paths (maps without start or goal are skipped).
+        algorithms: A list of algorithm names (see SearchEngine.ALGORITHMS).
+        warmup: The number of untimed runs before the repetitions.
+        repetitions: The number of timed runs.
+        disable_gc: Whether to disable the garbage collector during the timed runs.
+        indexed: Whether to use the IndexedSearchEngine.
+        level: The confidence level of the interval of the median.
+        open_lists: The open list backends to compare (see create_open_list).
+
+    Returns:
+        A dictionary with the metadata, the settings and one result per (map, algorithm, open list).
+    """
+    report = {
+        "metadata": collect_metadata(),
+        "settings": {"warmup": warmup, "repetitions": repetitions, "gc_disabled": disable_gc, "indexed": indexed, "confidence_level": level,
+                     "open_lists": list(open_lists)},
+        "results": []
+    }
+    for map_file in map_files:
+        grid_map = GridMap.load(map_file)
+        if not (grid_map.start_cube and grid_map.goal_cube):
+            logging.warning(f"Skipping {map_file}: start or goal is missing.")
+            continue
+        for algorithm in algorithms:
+            heap_median_ns = None
+            switchable = algorithm in SearchEngine.OPEN_LIST_ALGORITHMS
+            for open_list in open_lists if switchable else ("heap",):
+                measurement = benchmark(grid_map, algorithm, warmup, repetitions, disable_gc, indexed, open_list)
+                measurement.update(summarize(measurement["runtimes_ns"], level))
+                if open_list == "heap":
+                    heap_median_ns = measurement["median_ns"]
+                elif heap_median_ns:
+                    measurement["speedup_vs_heap"] = heap_median_ns / measurement["median_ns"]
+                report["results"].append({"map": grid_map.current_map_file, "algorithm": algorithm,
+                                          "open_list": open_list if switchable else None, **measurement})
+    return report
+
+def main() -> None:
+    """Main function to parse the command line arguments, run the benchmarks and write the JSON report."""
+    parser = argparse.ArgumentParser(description="Benchmark pathfinding algorithms on maps with the headless engines.")
+    parser.add_argument("--maps", nargs="+", default=["maps"], help="map files and/or directories (default: maps)")
+    parser.add_argument("--algorithms", nargs="+", default=list(SearchEngine.ALGORITHMS), choices=list(SearchEngine.ALGORITHMS), help="algorithms to run (default: all)")
+    parser.add_argument("--warmup", type=int, default=1, help="untimed runs before the repetitions (default: 1)")
+    parser.add_argument("--repetitions", type=int, default=10, help="timed runs per map and algorithm (default: 10)")
+    parser.add_argument("--gc", choices=["disable", "enable"], default="disable", help="garbage collector during timed runs (default: disable, with a collection before each run)")
+    parser.add_argument("--indexed", action="store_true", help="use the IndexedSearchEngine (integer cell ids for A* and Dijkstra)")
+    parser.add_argument("--open-lists", nargs="+", default=["heap"], choices=list(OPEN_LISTS), help="open list backends to compare (default: heap)")
+    parser.add_argument("--confidence", type=float, default=0.95, help="confidence level of the interval of the median (default: 0.95)")
+    parser.add_argument("--output", default="results/benchmark.json", help="JSON report to write (default: results/benchmark.json)")
+    args = parser.parse_args()
+    if args.repetitions < 1:
+        parser.error("--repetitions must be at least 1")
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    report = run_benchmarks(collect_map_files(args.maps), args.algorithms, args.warmup, args.repetitions,
+                            args.gc == "disable", args.indexed, args.confidence, tuple(dict.fromkeys(args.open_lists)))
+    directory = os.path.dirname(args.output)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'Map':<36} {'Algorithm':<12} {'Open list':<9} {'Median ms':>10} {'IQR ms':>9} {'CI ms':>19} {'Speedup':>8}")
+    for result in report["results"]:
+        speedup = f"{result['speedup_vs_heap']:.2f}x" if "speedup_vs_heap" in result else ""
+        print(f"{result['map']:<36} {result['algorithm']:<12} {result['open_list'] or '-':<9} {result['median_ns'] / 1e6:>10.3f} {result['iqr_ns'] / 1e6:>9.3f} "
+              f"{result['ci_low_ns'] / 1e6:>9.3f}-{result['ci_high_ns'] / 1e6:<9.3f} {speedup:>8}")
+    print(f"{len(report['results'])} benchmarks -> {args.output}")
+
+if __name__ == "__main__":
+    main()
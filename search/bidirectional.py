@@ -0,0 +1,225 @@
+import time
+import heapq
+import logging
+from array import array
+from .result import SearchResult
+
+class BidirectionalSearch:
+    """
+    Bidirectional variants of BFS and A* that search from the start and the goal at the same time.
+
+    Both searches work on the padded occupancy buffer of the grid (see GridMap.padded_occupancy)
+    and keep their own distance and predecessor arrays. The visited cubes of the result are the cubes
+    reached by either search and the max queue size is the largest combined size of both frontiers.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+        memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+    """
+    def __init__(self, grid, observer=None, memory_tracker=None):
+        """
+        Initializes the BidirectionalSearch with a grid and an optional observer.
+
+        Args:
+            grid: The grid to search on.
+            observer: An optional SearchObserver that is notified while searching.
+            memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+        """
+        self.grid = grid
+        self.observer = observer
+        self.memory_tracker = memory_tracker
+
+    @staticmethod
+    def generate_path(previous_forward, previous_backward, meeting_id: int, width: int) -> list:
+        """
+        Generates the path from the start to the goal through the cube where both searches met.
+
+        Args:
+            previous_forward: An array mapping each cell id to its predecessor of the forward search (-1 for the start).
+            previous_backward: An array mapping each cell id to its predecessor of the backward search (-1 for the goal).
+            meeting_id: The cell id where both searches met.
+            width: The width of the padded occupancy buffer.
+
+        Returns:
+            A list of cubes representing the path from start to goal.
+        """
+        cell_ids = []
+        current_id = meeting_id
+        while current_id != -1: # meeting cube back to start
+            cell_ids.append(current_id)
+            current_id = previous_forward[current_id]
+        cell_ids.reverse()
+        current_id = previous_backward[meeting_id]
+        while current_id != -1: # meeting cube to goal
+            cell_ids.append(current_id)
+            current_id = previous_backward[current_id]
+        return [(cell_id % width - 1, cell_id // width - 1) for cell_id in cell_ids] # remove border
+
+    def _visit(self, cell_id: int, width: int) -> None:
+        """Notifies the observer (if any) about a visited cube."""
+        if self.observer is not None:
+            self.observer.visit(cell_id % width - 1, cell_id // width - 1)
+
+    def bfs(self, start, goal):
+        """
+        Performs a bidirectional Breadth-First Search.
+
+        The searches alternately expand a complete layer of the smaller frontier. When a layer reaches
+        cubes of the other search, the best meeting cube of this layer forms a shortest path.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        occupancy, width = self.grid.padded_occupancy()
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        if occupancy[start_id] or occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult("Bi-BFS", None, 0, 0, time.perf_counter() - start_time)
+        if start_id == goal_id:
+            return SearchResult("Bi-BFS", [start], 0, 1, time.perf_counter() - start_time)
+
+        distance = (array('i', [-1]) * len(occupancy), array('i', [-1]) * len(occupancy)) # forward, backward
+        previous_cube = (array('i', [-1]) * len(occupancy), array('i', [-1]) * len(occupancy))
+        distance[0][start_id] = 0
+        distance[1][goal_id] = 0
+        frontiers = [[start_id], [goal_id]]
+        visited_cubes = 1 # goal (start is excluded)
+        max_queue_size = 2
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(tuple(frontiers), distance, previous_cube)
+        while frontiers[0] and frontiers[1]:
+            max_queue_size = max(max_queue_size, len(frontiers[0]) + len(frontiers[1]))
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1 # expand the smaller frontier
+            own_distance, other_distance = distance[side], distance[1 - side]
+            own_previous = previous_cube[side]
+            best_length, meeting_id = -1, -1
+            next_frontier = []
+            for current_id in frontiers[side]:
+                if self.observer is not None and not self.observer.step():
+                    return None
+                next_distance = own_distance[current_id] + 1
+                for offset in offsets:
+                    neighbor_id = current_id + offset
+                    if occupancy[neighbor_id] or own_distance[neighbor_id] != -1:
+                        continue
+                    own_distance[neighbor_id] = next_distance
+                    own_previous[neighbor_id] = current_id
+                    next_frontier.append(neighbor_id)
+                    if other_distance[neighbor_id] == -1:
+                        visited_cubes += 1
+                        self._visit(neighbor_id, width)
+                    elif best_length == -1 or next_distance + other_distance[neighbor_id] < best_length: # searches met
+                        best_length, meeting_id = next_distance + other_distance[neighbor_id], neighbor_id
+            frontiers[side] = next_frontier
+
+            if meeting_id != -1:
+                path = self.generate_path(previous_cube[0], previous_cube[1], meeting_id, width)
+                return SearchResult("Bi-BFS", path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("Bi-BFS", None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+    def a_star(self, start, goal):
+        """
+        Performs a bidirectional A* search with balanced (average) potentials.
+
+        With h_goal / h_start as the Manhattan distance to the goal / start, the forward search orders its
+        open_set by 2 * g + h_goal - h_start and the backward search by 2 * g + h_start - h_goal. Whenever a
+        cube is reached by both searches, the length of the path through it is a candidate. The search
+        stops as soon as the lowest keys of both open_sets add up to at least twice the best candidate,
+        which guarantees that no shorter path exists.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        occupancy, width = self.grid.padded_occupancy()
+        cell_count = len(occupancy)
+        key_offset = width + self.grid.rows + 2 # keeps keys (potentials can be negative) positive
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        if occupancy[start_id] or occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult("Bi-A*", None, 0, 0, time.perf_counter() - start_time)
+        start_y, start_x = divmod(start_id, width)
+        goal_y, goal_x = divmod(goal_id, width)
+
+        def potential(cell_id: int, side: int) -> int:
+            """Returns h_goal - h_start for the forward (0) and h_start - h_goal for the backward (1) search."""
+            cell_y, cell_x = divmod(cell_id, width)
+            difference = abs(cell_x - goal_x) + abs(cell_y - goal_y) - abs(cell_x - start_x) - abs(cell_y - start_y)
+            return difference if side == 0 else -difference
+
+        g_score = (array('i', [-1]) * cell_count, array('i', [-1]) * cell_count) # forward, backward
+        previous_cube = (array('i', [-1]) * cell_count, array('i', [-1]) * cell_count)
+        g_score[0][start_id] = 0
+        g_score[1][goal_id] = 0
+        open_sets = ([(potential(start_id, 0) + key_offset) * cell_count + start_id],
+                     [(potential(goal_id, 1) + key_offset) * cell_count + goal_id]) # entries are key * cell_count + cell_id
+        best_length, meeting_id = (0, start_id) if start_id == goal_id else (-1, -1)
+        visited_cubes = 0 if start_id == goal_id else 1 # goal (start is excluded)
+        max_queue_size = 2
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_sets, g_score, previous_cube)
+        while True:
+            # remove outdated entries and read the lowest key of both open_sets
+            lowest_keys = []
+            for side in (0, 1):
+                open_set, own_g_score = open_sets[side], g_score[side]
+                while open_set:
+                    key, cell_id = divmod(open_set[0], cell_count)
+                    if key - key_offset <= 2 * own_g_score[cell_id] + potential(cell_id, side):
+                        break
+                    heapq.heappop(open_set)
+                lowest_keys.append(open_set[0] // cell_count - key_offset if open_set else None)
+            if None in lowest_keys or (best_length != -1 and lowest_keys[0] + lowest_keys[1] >= 2 * best_length):
+                break
+
+            if self.observer is not None and not self.observer.step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_sets[0]) + len(open_sets[1]))
+            side = 0 if lowest_keys[0] <= lowest_keys[1] else 1 # expand the open_set with the lower key
+            open_set, own_g_score, other_g_score = open_sets[side], g_score[side], g_score[1 - side]
+            own_previous = previous_cube[side]
+            current_id = heapq.heappop(open_set) % cell_count
+
+            # process neighbors of current_cube
+            temp_g_score = own_g_score[current_id] + 1 # all edges have a weight of 1
+            for offset in offsets:
+                neighbor_id = current_id + offset
+                if occupancy[neighbor_id]:
+                    continue
+                neighbor_g_score = own_g_score[neighbor_id]
+                if neighbor_g_score == -1 or temp_g_score < neighbor_g_score:
+                    if neighbor_g_score == -1 and other_g_score[neighbor_id] == -1:
+                        visited_cubes += 1
+                        self._visit(neighbor_id, width)
+                    own_g_score[neighbor_id] = temp_g_score
+                    own_previous[neighbor_id] = current_id
+                    heapq.heappush(open_set, (2 * temp_g_score + potential(neighbor_id, side) + key_offset) * cell_count + neighbor_id)
+                    # searches met: candidate path through the neighbor
+                    if other_g_score[neighbor_id] != -1 and (best_length == -1 or temp_g_score + other_g_score[neighbor_id] < best_length):
+                        best_length, meeting_id = temp_g_score + other_g_score[neighbor_id], neighbor_id
+
+        if meeting_id != -1:
+            path = self.generate_path(previous_cube[0], previous_cube[1], meeting_id, width)
+            return SearchResult("Bi-A*", path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("Bi-A*", None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
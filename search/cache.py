@@ -0,0 +1,82 @@
+from collections import OrderedDict
+
+class ResultCache:
+    """
+    A bounded LRU cache of search results.
+
+    Results are keyed by the content hash of the grid (see GridMap.content_hash) plus algorithm, start, goal
+    and the options of the engine that change the result (e.g. the open list or the memory profile). The hash
+    changes with every edit of the grid, so a result is only ever returned for exactly the grid and engine
+    configuration it was computed with, while results for unchanged content (e.g. after undoing an edit) stay valid.
+
+    Attributes:
+        maxsize: The maximum number of cached results.
+        entries: An OrderedDict mapping keys to results (least recently used first).
+        hits: The number of lookups that returned a cached result.
+        misses: The number of lookups that did not find a cached result.
+    """
+    def __init__(self, maxsize: int = 128):
+        """
+        Initializes an empty ResultCache.
+
+        Args:
+            maxsize: The maximum number of cached results.
+        """
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(grid, algorithm: str, start, goal, options: tuple = ()) -> tuple:
+        """
+        Builds the cache key of a search.
+
+        Args:
+            grid: The grid that is searched.
+            algorithm: The name of the algorithm.
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            options: The options of the engine that change the result (see SearchEngine.cache_options).
+
+        Returns:
+            tuple: The key of the search.
+        """
+        return grid.content_hash(), algorithm, tuple(start), tuple(goal), options
+
+    def get(self, key: tuple):
+        """
+        Looks up a result and marks it as recently used.
+
+        Args:
+            key: The key of the search (see key).
+
+        Returns:
+            SearchResult: The cached result, or None if it is not cached.
+        """
+        result = self.entries.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def put(self, key: tuple, result) -> None:
+        """
+        Stores a result, evicting the least recently used result if the cache is full.
+
+        Args:
+            key: The key of the search (see key).
+            result: The SearchResult to store.
+        """
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all cached results and resets the counters."""
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
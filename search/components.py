@@ -0,0 +1,200 @@
+from array import array
+
+# the 8 cubes around a cube in circular order (N, NE, E, SE, S, SW, W, NW), 4-neighbors at even positions
+RING = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+class ComponentIndex:
+    """
+    Labels the connected components (4-connected) of the traversable cubes of a grid.
+
+    Two cubes are connected if and only if their components have the same root label, so a query
+    whose start and goal are in different components can be rejected without a search.
+    The index listens to the edits of the grid (see GridMap.add_listener): removing an obstacle merges
+    the adjacent components (union-find), adding an obstacle only invalidates the index if it might
+    split a component. An invalid index is rebuilt on the next query.
+
+    Attributes:
+        grid: The GridMap that is indexed.
+        labels: An array with the component label of each cube (-1 for obstacles).
+        parent: The union-find parent of each label.
+        valid: False if the index has to be rebuilt before the next query.
+    """
+    def __init__(self, grid):
+        """
+        Initializes the ComponentIndex and registers it as a listener of the grid.
+
+        Args:
+            grid: The GridMap to index.
+        """
+        self.grid = grid
+        self.labels = array('i')
+        self.parent = []
+        self.valid = False
+        grid.add_listener(self)
+
+    def find(self, label: int) -> int:
+        """
+        Finds the root label of a label (with path compression).
+
+        Args:
+            label: The label of a component.
+
+        Returns:
+            The root label of the component.
+        """
+        parent = self.parent
+        root = label
+        while parent[root] != root:
+            root = parent[root]
+        while parent[label] != root: # path compression
+            parent[label], label = root, parent[label]
+        return root
+
+    def union(self, label_a: int, label_b: int) -> None:
+        """
+        Merges the components of two labels.
+
+        Args:
+            label_a: The label of the first component.
+            label_b: The label of the second component.
+        """
+        root_a, root_b = self.find(label_a), self.find(label_b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    def build(self) -> None:
+        """
+        Labels all components of the grid.
+
+        Every row is split into runs of traversable cubes (found with bytes.find), runs overlapping a run
+        of the previous row are merged and each run is filled with the root label of its component.
+        """
+        rows, cols, occupancy = self.grid.rows, self.grid.cols, self.grid.occupancy
+        self.parent = []
+        all_runs = []
+        previous_runs = []
+        for y in range(rows):
+            row = occupancy[y * cols:(y + 1) * cols]
+            runs = []
+            run_start = row.find(0)
+            while run_start != -1:
+                run_end = row.find(1, run_start)
+                if run_end == -1:
+                    run_end = cols
+                label = len(self.parent)
+                self.parent.append(label)
+                runs.append((run_start, run_end, label))
+                run_start = row.find(0, run_end) if run_end < cols else -1
+
+            # merge with overlapping runs of the previous row
+            i = j = 0
+            while i < len(runs) and j < len(previous_runs):
+                start_a, end_a, label_a = runs[i]
+                start_b, end_b, label_b = previous_runs[j]
+                if start_a < end_b and start_b < end_a:
+                    self.union(label_a, label_b)
+                if end_a <= end_b:
+                    i += 1
+                else:
+                    j += 1
+            all_runs.append(runs)
+            previous_runs = runs
+
+        self.labels = array('i', [-1]) * (rows * cols)
+        for y, runs in enumerate(all_runs):
+            for run_start, run_end, label in runs:
+                self.labels[y * cols + run_start:y * cols + run_end] = array('i', [self.find(label)]) * (run_end - run_start)
+        self.valid = True
+
+    def component(self, x: int, y: int) -> int:
+        """
+        Gets the root label of the component of a cube (rebuilds the index if necessary).
+
+        Args:
+            x: The x-coordinate of the cube.
+            y: The y-coordinate of the cube.
+
+        Returns:
+            The root label of the component, or -1 for obstacles.
+        """
+        if not self.valid:
+            self.build()
+        label = self.labels[y * self.grid.cols + x]
+        return self.find(label) if label != -1 else -1
+
+    def connected(self, start, goal) -> bool:
+        """
+        Checks whether a path between two cubes exists.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            True if start and goal are traversable and in the same component, False otherwise.
+        """
+        start_component = self.component(*start)
+        return start_component != -1 and start_component == self.component(*goal)
+
+    def might_split(self, x: int, y: int) -> bool:
+        """
+        Checks whether blocking a cube might split its component.
+
+        Blocking cannot split the component if all traversable 4-neighbors of the cube are connected
+        through the ring of the 8 cubes around it.
+
+        Args:
+            x: The x-coordinate of the cube.
+            y: The y-coordinate of the cube.
+
+        Returns:
+            True if the component might be split, False if it certainly stays connected.
+        """
+        rows, cols, occupancy = self.grid.rows, self.grid.cols, self.grid.occupancy
+        free = [0 <= x + move_x < cols and 0 <= y + move_y < rows and not occupancy[(y + move_y) * cols + x + move_x]
+                for (move_x, move_y) in RING]
+        if all(free):
+            return False
+        # count the runs of free cubes around the ring that contain a 4-neighbor
+        first_blocked = free.index(False)
+        runs_with_neighbor = 0
+        in_run = has_neighbor = False
+        for step in range(1, 9):
+            position = (first_blocked + step) % 8
+            if free[position]:
+                in_run = True
+                has_neighbor = has_neighbor or position % 2 == 0
+            elif in_run:
+                runs_with_neighbor += has_neighbor
+                in_run = has_neighbor = False
+        return runs_with_neighbor > 1
+
+    def cell_changed(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Updates the index after a cube of the grid was changed (called by the grid).
+
+        Args:
+            x: The x-coordinate of the changed cube.
+            y: The y-coordinate of the changed cube.
+            traversable: True if the cube became traversable, False if it became an obstacle.
+        """
+        if not self.valid:
+            return
+        rows, cols = self.grid.rows, self.grid.cols
+        index = y * cols + x
+        if traversable: # new cube joins (and merges) the components of its neighbors
+            label = len(self.parent)
+            self.parent.append(label)
+            self.labels[index] = label
+            for (move_x, move_y) in RING[::2]:
+                new_x, new_y = x + move_x, y + move_y
+                if 0 <= new_x < cols and 0 <= new_y < rows and self.labels[new_y * cols + new_x] != -1:
+                    self.union(label, self.labels[new_y * cols + new_x])
+        else:
+            self.labels[index] = -1
+            if self.might_split(x, y):
+                self.valid = False
+
+    def grid_reset(self) -> None:
+        """Invalidates the index after the whole grid was replaced (called by the grid)."""
+        self.valid = False
@@ -0,0 +1,112 @@
+class SearchCounters:
+    """
+    Counts the work done by a search: expansions, generated successors, open list pushes, stale pops and re-expansions.
+
+    The searches do not check whether counting is enabled. They bind the operations of their open list
+    (push and pop) and their successor function to local names once, and only if counters are enabled
+    these are replaced by the counting wrappers of instrument. Without counters, the searches call the
+    original functions directly, so counting costs nothing when it is disabled.
+
+    A stale pop takes an entry of a cube that was already taken from the open list before (the cube was
+    pushed again with a better score, so the older entry is outdated). A re-expansion processes the
+    neighbors of a cube that was already expanded before (a stale pop that is not skipped).
+
+    Attributes:
+        expansions: The number of cubes whose successors were generated (including re-expansions).
+        generated: The number of generated successors (traversable neighbors or jump points).
+        pushes: The number of entries pushed onto the open list (including the start).
+        stale_pops: The number of entries taken from the open list for a cube that was taken before.
+        reexpansions: The number of expansions of a cube that was already expanded.
+        popped: The cubes taken from the open list during the current search.
+        expanded: The cubes expanded during the current search.
+        grid: The padded occupancy and the neighbor offsets if the successors are counted after the search, else None.
+        active: True if the current search is instrumented (Bi-BFS, HPA* and LPA* are not).
+    """
+    FIELDS = ("expansions", "generated", "pushes", "stale_pops", "reexpansions")
+
+    def __init__(self):
+        """Initializes the SearchCounters with all counters at zero."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Sets all counters to zero for the next search."""
+        self.expansions = 0
+        self.generated = 0
+        self.pushes = 0
+        self.stale_pops = 0
+        self.reexpansions = 0
+        self.popped = set()
+        self.expanded = set()
+        self.grid = None
+        self.active = False
+
+    def instrument(self, push, pop, successors=None, cell_of=None, pushed: int = 1, occupancy=None, offsets=None, expanded_cell=None) -> tuple:
+        """
+        Wraps the operations of a search with counting functions.
+
+        Searches that generate successors inline (without a successor function) pass their padded occupancy and
+        neighbor offsets instead: every first pop of a cube is an expansion (later pops are skipped as stale) and
+        the successors are counted from the expanded cubes after the search.
+
+        Args:
+            push: The push function of the open list.
+            pop: The pop function of the open list.
+            successors: The successor function (called once per expansion with the cube), or None.
+            cell_of: A function returning the cube of an open list entry (default: the entry is the cube).
+            pushed: The number of entries already on the open list.
+            occupancy: The padded occupancy buffer of a search without successor function.
+            offsets: The neighbor offsets in the padded occupancy buffer.
+            expanded_cell: A function returning the cube of the arguments of successors (default: the arguments are the cube).
+
+        Returns:
+            tuple: The counting push, pop and successor functions (successors stays None if it is None).
+        """
+        self.active = True
+        self.pushes += pushed
+        popped, expanded = self.popped, self.expanded
+        if successors is None:
+            self.grid = (occupancy, offsets)
+
+        def counting_push(*args):
+            self.pushes += 1
+            return push(*args)
+
+        def counting_pop(*args):
+            entry = pop(*args)
+            cell = cell_of(entry) if cell_of is not None else entry
+            if cell in popped:
+                self.stale_pops += 1
+            else:
+                popped.add(cell)
+            return entry
+
+        def counting_successors(*args):
+            cell = expanded_cell(*args) if expanded_cell is not None else args
+            self.expansions += 1
+            if cell in expanded:
+                self.reexpansions += 1
+            else:
+                expanded.add(cell)
+            result = successors(*args)
+            self.generated += len(result)
+            return result
+
+        return counting_push, counting_pop, counting_successors if successors is not None else None
+
+    def collect(self):
+        """
+        Finishes the counting of the current search and resets the counters.
+
+        Returns:
+            A dictionary mapping the names of the counters (see FIELDS) to their values, or None if the search was not instrumented.
+        """
+        if not self.active:
+            self.reset()
+            return None
+        if self.grid is not None: # inline successors: every first pop is an expansion
+            occupancy, offsets = self.grid
+            self.expansions = len(self.popped)
+            self.generated = sum(not occupancy[cell + offset] for cell in self.popped for offset in offsets)
+        counts = {field: getattr(self, field) for field in self.FIELDS}
+        self.reset()
+        return counts
@@ -0,0 +1,768 @@
+import time
+from collections import deque
+import heapq
+import logging
+from .result import SearchResult
+from .jps import JumpPointSearch
+from .bidirectional import BidirectionalSearch
+from .hierarchical import HierarchicalSearch
+from .fringe import FringeSearch
+from .fields import FieldCache
+from .memory import MemoryTracker
+from .counters import SearchCounters
+from .openlist import OPEN_LISTS, create_open_list
+
+class SearchObserver:
+    """
+    Base class for observers that want to follow a search while it is running (e.g. to draw it).
+
+    The engine never requires an observer. All methods are no-ops, so subclasses only
+    override what they need.
+    """
+    def visit(self, x: int, y: int) -> None:
+        """
+        Called when a cube is visited for the first time or its score is improved.
+
+        Args:
+            x: The x-coordinate of the visited cube.
+            y: The y-coordinate of the visited cube.
+        """
+
+    def step(self) -> bool:
+        """
+        Called before every cube that is taken from the queue.
+
+        Returns:
+            False to abort the search, True to continue.
+        """
+        return True
+
+    def solution(self, result) -> None:
+        """
+        Called when an anytime search (ARA*) finds an improved path, before it continues to improve it.
+
+        Args:
+            result: The SearchResult of the improved path with its suboptimality bound.
+        """
+
+class SearchEngine:
+    """
+    A headless implementation of the pathfinding algorithms that does not depend on pygame.
+
+    The engine works on any GridMap, e.g. a map loaded headless or the Grid of the GUI.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+        component_index: An optional ComponentIndex used to reject queries between unconnected cubes without a search.
+        result_cache: An optional ResultCache that returns the results of repeated searches without searching.
+        cache_hit: True if the last search returned a cached result.
+        memory_tracker: A MemoryTracker that adds a MemoryProfile to every result, or None if memory is not tracked.
+        counters: The SearchCounters that add the operation counts to every result, or None if operations are not counted.
+        open_list: The open list backend of A*, Dijkstra, Greedy-BeFs and JPS ("heap" or "bucket", see create_open_list).
+        time_budget: The time in seconds after which ARA* returns its best path, or None to run until the path is optimal.
+        expansion_budget: The number of expansions after which ARA* returns its best path, or None for no limit.
+        initial_epsilon: The heuristic weight of the first search of ARA*.
+        memory_limit: The maximum number of bytes the structures of Fringe Search may hold (without the path), or None for no limit.
+        use_landmarks: True to guide A*, Greedy-BeFs and ARA* with the ALT heuristic (landmark distance tables) instead of the Manhattan distance.
+        field_cache: The FieldCache of the distance fields of Dist-Field (one sweep per goal, later queries only extract the path).
+    """
+    ALGORITHMS = {
+        "DFS": "dfs",
+        "BFS": "bfs",
+        "A*": "a_star",
+        "Dijkstra": "dijkstra",
+        "Greedy-BeFs": "greedy_best_first_search",
+        "JPS": "jump_point_search",
+        "Bi-BFS": "bidirectional_bfs",
+        "Bi-A*": "bidirectional_a_star",
+        "HPA*": "hierarchical_search",
+        "HPA*-Exact": "hierarchical_search_exact",
+        "LPA*": "incremental_search",
+        "ARA*": "anytime_a_star",
+        "Fringe": "fringe_search",
+        "Dist-Field": "distance_field_search"
+    }
+    # algorithms whose open list backend can be switched (see create_open_list)
+    OPEN_LIST_ALGORITHMS = ("A*", "Dijkstra", "Greedy-BeFs", "JPS")
+    # decrease of the heuristic weight of ARA* after every solution
+    EPSILON_STEP = 0.5
+
+    def __init__(self, grid, observer: SearchObserver = None, component_index=None, result_cache=None, track_memory: bool = False,
+                 count_operations: bool = False, open_list: str = "heap", time_budget: float = None, expansion_budget: int = None,
+                 initial_epsilon: float = 3.0, memory_limit: int = None, use_landmarks: bool = False,
+                 field_cache=None):
+        """
+        Initializes the SearchEngine with a grid and an optional observer.
+
+        Args:
+            grid: The grid to search on.
+            observer: An optional SearchObserver that is notified while searching.
+            component_index: An optional ComponentIndex (see GridMap.component_index) to reject unreachable queries.
+            result_cache: An optional ResultCache for the results of repeated searches.
+            track_memory: True to account the peak memory of the data structures of every search (see SearchResult.memory).
+            count_operations: True to count expansions, pushes and stale pops of every search (see SearchResult.counters).
+            open_list: The open list backend of A*, Dijkstra, Greedy-BeFs and JPS: "heap" (binary heap) or "bucket" (bucket queue).
+            time_budget: The time in seconds after which ARA* returns its best path, or None to run until the path is optimal.
+            expansion_budget: The number of expansions after which ARA* returns its best path, or None for no limit.
+            initial_epsilon: The heuristic weight of the first search of ARA* (at least 1).
+            memory_limit: The maximum number of bytes the structures of Fringe Search may hold (without the path), or None for no limit.
+            use_landmarks: True to guide A*, Greedy-BeFs and ARA* with the ALT heuristic (see LandmarkTable).
+            field_cache: An optional FieldCache shared between engines (default: a new FieldCache of this engine).
+
+        Raises:
+            ValueError: If the open list backend is unknown or initial_epsilon is less than 1.
+        """
+        if open_list not in OPEN_LISTS:
+            raise ValueError(f"Unknown open list: {open_list}")
+        if initial_epsilon < 1:
+            raise ValueError(f"initial_epsilon must be at least 1: {initial_epsilon}")
+        self.grid = grid
+        self.observer = observer
+        self.component_index = component_index
+        self.result_cache = result_cache
+        self.cache_hit = False
+        self.memory_tracker = MemoryTracker() if track_memory else None
+        self.counters = SearchCounters() if count_operations else None
+        self.open_list = open_list
+        self.time_budget = time_budget
+        self.expansion_budget = expansion_budget
+        self.initial_epsilon = initial_epsilon
+        self.memory_limit = memory_limit
+        self.use_landmarks = use_landmarks
+        self.field_cache = field_cache if field_cache is not None else FieldCache()
+
+    def search(self, algorithm: str, start, goal, use_cache: bool = True):
+        """
+        Runs the algorithm with the given name (as shown in the dropdown) from start to goal.
+
+        Args:
+            algorithm: The name of the algorithm (e.g. "A*").
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            use_cache: False to bypass the result cache (e.g. for benchmarks that have to measure cold searches).
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        if algorithm not in self.ALGORITHMS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        self.cache_hit = False
+        if algorithm == "ARA*" and self.time_budget is not None:
+            use_cache = False # the result depends on the speed of the machine
+        if self.result_cache is not None and use_cache:
+            key = self.result_cache.key(self.grid, algorithm, start, goal, self.cache_options())
+            result = self.result_cache.get(key)
+            if result is not None:
+                self.cache_hit = True
+                logging.info(f"Cached result for {algorithm} (hits: {self.result_cache.hits}, misses: {self.result_cache.misses})")
+                return result
+
+        if self.memory_tracker is not None:
+            self.memory_tracker.reset()
+        if self.counters is not None:
+            self.counters.reset()
+        start_time = time.perf_counter()
+        if self.component_index is not None and not self.component_index.connected(start, goal):
+            logging.info("No path found (start and goal are not connected).")
+            result = SearchResult(algorithm, None, 0, 0, time.perf_counter() - start_time)
+        else:
+            result = getattr(self, self.ALGORITHMS[algorithm])(start, goal)
+        if result is not None and self.memory_tracker is not None:
+            result.memory = self.memory_tracker.measure(result) # after the search, so the runtime is not affected
+        if result is not None and self.counters is not None:
+            result.counters = self.counters.collect()
+        if result is not None and self.result_cache is not None and use_cache:
+            self.result_cache.put(key, result)
+        return result
+
+    def cache_options(self) -> tuple:
+        """
+        Gets the options of the engine that change its results, the part of the result cache key besides grid and query.
+
+        Returns:
+            tuple: The engine class, open list, landmarks, ARA* weight and expansion budget, Fringe memory limit,
+            memory tracking and operation counting.
+        """
+        return (type(self).__name__, self.open_list, self.use_landmarks, self.initial_epsilon, self.expansion_budget, self.memory_limit,
+                self.memory_tracker is not None, self.counters is not None)
+
+    @staticmethod
+    def generate_path(previous_cube, current_cube) -> list:
+        """
+        Generates a path from the start to the current cube using the previous_cube mapping.
+
+        Args:
+            previous_cube: A dictionary mapping each cube to the cube it came from.
+            current_cube: The ending cube from which the path is generated.
+
+        Returns:
+            A list of cubes representing the path from start to the current cube.
+        """
+        path = [current_cube] # current cube is goal
+        while current_cube in previous_cube:
+            current_cube = previous_cube[current_cube]
+            path.append(current_cube)
+        path.reverse() # reverse list for correct order (start to goal)
+        return path
+
+    @staticmethod
+    def heuristic(neighbor_cube, goal_cube):
+        """
+        Calculates the heuristic value (Manhattan distance) between the neighbor cube and the goal cube.
+
+        Args:
+            neighbor_cube: The coordinates of the neighbor cube.
+            goal_cube: The coordinates of the goal cube.
+
+        Returns:
+            The Manhattan distance between the neighbor cube and the goal cube.
+        """
+        return abs(neighbor_cube[0] - goal_cube[0]) + abs(neighbor_cube[1] - goal_cube[1])
+
+    def get_neighbors(self, x: int, y: int):
+        """
+        Gets the neighboring cubes of a given cube that are traversable.
+
+        Args:
+            x: The x-coordinate of the current cube.
+            y: The y-coordinate of the current cube.
+
+        Returns:
+            A list of tuples representing the coordinates of the neighboring traversable cubes.
+        """
+        neighbors = []
+        rows, cols, occupancy = self.grid.rows, self.grid.cols, self.grid.occupancy
+        for (move_x, move_y) in [(-1, 0), (1, 0), (0, -1), (0, 1)]: # left, right, up, down
+            new_x, new_y = x + move_x, y + move_y
+            # make sure new coordinates are within the grid + traversable
+            if 0 <= new_x < cols and 0 <= new_y < rows and not occupancy[new_y * cols + new_x]:
+                neighbors.append((new_x, new_y))
+        return neighbors
+
+    def _heuristic(self, start, goal):
+        """
+        Gets the heuristic of A*, Greedy-BeFs and ARA* for a query: the ALT heuristic of the landmark tables of the grid
+        (see GridMap.landmark_table) with use_landmarks, else the Manhattan distance.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            A function (cube, goal_cube) -> lower bound of the distance from cube to goal_cube.
+        """
+        if self.use_landmarks:
+            return self.grid.landmark_table().heuristic(start, goal)
+        return self.heuristic
+
+    def _visit(self, cube) -> None:
+        """Notifies the observer (if any) about a visited cube."""
+        if self.observer is not None:
+            self.observer.visit(cube[0], cube[1])
+
+    def _step(self) -> bool:
+        """Notifies the observer (if any) about the next step and returns False if the search should stop."""
+        return self.observer is None or self.observer.step()
+
+    def bfs(self, start, goal):
+        """
+        Performs Breadth-First Search (BFS) to find a path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        queue = deque([start]) # initialize queue with start_cube
+        previous_cube = {} # dictionary to track the path (cube to its predecessor)
+        visited_cubes = {start} # keep track of visited cubes
+        max_queue_size = 1 # track max size of queue
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(queue, visited_cubes, previous_cube)
+        push, pop, get_neighbors = queue.append, queue.popleft, self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors)
+        while queue:
+            if not self._step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(queue)) # update max queue size
+            current_cube = pop() # get first element to process from queue
+
+            # goal found
+            if current_cube == goal:
+                path = self.generate_path(previous_cube, current_cube)
+                return SearchResult("BFS", path, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time) # -1 to remove start
+
+            # process neighbors of current_cube
+            for neighbor in get_neighbors(*current_cube):
+                if neighbor not in visited_cubes:
+                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                    push(neighbor) # add neighbor to queue to get processed next
+                    visited_cubes.add(neighbor) # mark cube as visited
+                    self._visit(neighbor)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("BFS", None, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time) # -1 to remove start
+
+    def dfs(self, start, goal):
+        """
+        Performs Depth-First Search (DFS) to find a path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        stack = [start] # initialize stack with start_cube
+        previous_cube = {}  # dictionary to track the path (cube to its predecessor)
+        visited_cubes = {start} # keep track of visited cubes
+        max_stack_size = 1 # track max size of stack
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(stack, visited_cubes, previous_cube)
+        push, pop, get_neighbors = stack.append, stack.pop, self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors)
+        while stack:
+            if not self._step():
+                return None
+
+            max_stack_size = max(max_stack_size, len(stack)) # update max stack size
+            current_cube = pop() # get top cube from stack
+
+            # goal found
+            if current_cube == goal:
+                path = self.generate_path(previous_cube, current_cube)
+                return SearchResult("DFS", path, len(visited_cubes) - 1, max_stack_size, time.perf_counter() - start_time) # -1 to remove start
+
+            # process neighbors of current_cube
+            for neighbor in get_neighbors(*current_cube):
+                if neighbor not in visited_cubes:
+                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                    push(neighbor) # add neighbor to stack to get processed next
+                    visited_cubes.add(neighbor) # mark cube as visited
+                    self._visit(neighbor)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("DFS", None, len(visited_cubes) - 1, max_stack_size, time.perf_counter() - start_time) # -1 to remove start
+
+    def a_star(self, start, goal):
+        """
+        Performs A* search algorithm to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        heuristic = self._heuristic(start, goal) # before start_time: loading or building the landmark tables is not part of the search
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        open_set, push, pop = create_open_list(self.open_list) # initialize open_set to store cubes for exploration
+        push(open_set, (0, start))  # add start_cube to open_set with f_score of 0
+        previous_cube = {} # dictionary to track the path (cube to its predecessor)
+        g_score = {start: 0} # dictionary to track the cost of each cube
+        visited_cubes = {start} # keep track of visited cubes
+        max_queue_size = 1 # track max size of open_set during search
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, (visited_cubes, g_score), previous_cube)
+        get_neighbors = self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors, lambda entry: entry[1])
+        while open_set:
+            if not self._step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+            current_cube = pop(open_set)[1] # get cube with lowest f_score from open_set
+
+            # goal found
+            if current_cube == goal:
+                path = self.generate_path(previous_cube, current_cube)
+                return SearchResult("A*", path, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time) # -1 to remove start
+
+            # process neighbors of current_cube
+            for neighbor in get_neighbors(*current_cube):
+                temp_g_score = g_score[current_cube] + 1  # calculate temp_g_score for neighbor (all edges have a weight of 1)
+                if neighbor not in g_score or temp_g_score < g_score[neighbor]:
+                    visited_cubes.add(neighbor) # mark cube as visited
+                    g_score[neighbor] = temp_g_score # set/update g_score of the neighbor
+                    f_score = temp_g_score + heuristic(neighbor, goal) # f_score = heuristic (h_score) + g_score
+                    push(open_set, (f_score, neighbor)) # push neighbor into open_set with its f_score
+                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                    self._visit(neighbor)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("A*", None, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time) # -1 to remove start
+
+    def dijkstra(self, start, goal):
+        """
+        Performs Dijkstra's algorithm to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        open_set, push, pop = create_open_list(self.open_list) # initialize open_set to store cubes for exploration
+        push(open_set, (0, start))  # add start_cube to open_set with g_score of 0
+        previous_cube = {} # dictionary to track the path (cube to its predecessor)
+        g_score = {start: 0} # dictionary to track the cost of each cube
+        visited_cubes = {start}  # keep track of visited cubes
+        max_queue_size = 1 # track max size of open_set during search
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, (visited_cubes, g_score), previous_cube)
+        get_neighbors = self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors, lambda entry: entry[1])
+        while open_set:
+            if not self._step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+            current_cube = pop(open_set)[1] # get cube with lowest g_score
+
+            # goal found
+            if current_cube == goal:
+                path = self.generate_path(previous_cube, current_cube)
+                return SearchResult("Dijkstra", path, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time)
+
+            # process neighbors of current_cube
+            for neighbor in get_neighbors(*current_cube):
+                temp_g_score = g_score[current_cube] + 1  # all edges have a weight of 1
+                if neighbor not in g_score or temp_g_score < g_score[neighbor]:
+                    visited_cubes.add(neighbor) # mark cube as visited
+                    g_score[neighbor] = temp_g_score # set/update g_score of the neighbor
+                    push(open_set, (temp_g_score, neighbor)) # push neighbor into open_set with its g_score
+                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                    self._visit(neighbor)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("Dijkstra", None, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time)
+
+    def greedy_best_first_search(self, start, goal):
+        """
+        Performs Greedy Best-First Search to find a path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        heuristic = self._heuristic(start, goal) # before start_time: loading or building the landmark tables is not part of the search
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        open_set, push, pop = create_open_list(self.open_list) # initialize open_set to store cubes for exploration
+        push(open_set, (0, start))  # add start_cube to open_set with h_score of 0
+        previous_cube = {} # dictionary to track the path (cube to its predecessor)
+        visited_cubes = {start} # keep track of visited cubes
+        max_queue_size = 1 # track max size of open_set during search
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, visited_cubes, previous_cube)
+        get_neighbors = self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors, lambda entry: entry[1])
+        while open_set:
+            if not self._step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+            current_cube = pop(open_set)[1] # get cube with lowest h_score
+
+            # goal found
+            if current_cube == goal:
+                path = self.generate_path(previous_cube, current_cube)
+                return SearchResult("Greedy-BeFs", path, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time)
+
+            # process neighbors of current_cube
+            for neighbor in get_neighbors(*current_cube):
+                if neighbor not in visited_cubes:
+                    visited_cubes.add(neighbor) # mark cube as visited
+                    h_score = heuristic(neighbor, goal) # calculate heuristic score (h_score) from neighbor to goal_cube
+                    push(open_set, (h_score, neighbor)) # push neighbor into open_set with its h_score
+                    previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                    self._visit(neighbor)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("Greedy-BeFs", None, len(visited_cubes) - 1, max_queue_size, time.perf_counter() - start_time)
+
+    def anytime_a_star(self, start, goal):
+        """
+        Performs Anytime Repairing A* (ARA*), a weighted A* that lowers its weight after every solution.
+
+        The first search expands by f = g + epsilon * h (initial_epsilon) and finds an epsilon-suboptimal path
+        quickly. Afterwards, epsilon is lowered by EPSILON_STEP and the search continues with the cubes of the
+        open_set and the inconsistent cubes (expanded cubes whose g_score improved) instead of starting over.
+        Every improved path is published to the observer (see SearchObserver.solution) with its suboptimality
+        bound, until the bound reaches 1 (the path is optimal) or the time or expansion budget runs out.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The best path found with its suboptimality bound and time to first solution, or None if the observer aborted the search.
+        """
+        heuristic = self._heuristic(start, goal) # before start_time: loading or building the landmark tables is not part of the search
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        if not (self.grid.is_traversable(*start) and self.grid.is_traversable(*goal)):
+            logging.info("No path found.")
+            return SearchResult("ARA*", None, 0, 0, time.perf_counter() - start_time)
+        deadline = start_time + self.time_budget if self.time_budget is not None else None
+        expansion_budget = self.expansion_budget
+        epsilon = self.initial_epsilon
+        open_set = [(epsilon * heuristic(start, goal), start)] # entries are (g_score + epsilon * h_score, cube)
+        previous_cube = {} # dictionary to track the path (cube to its predecessor)
+        g_score = {start: 0} # dictionary to track the cost of each cube (visited cubes)
+        closed_set = set() # cubes expanded with the current epsilon
+        inconsistent = set() # expanded cubes whose g_score improved, expanded again with the next epsilon
+        max_queue_size = 1 # track max size of open_set during search
+        expansions = 0
+        best_result = None
+        first_solution_time = None
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, (g_score, closed_set, inconsistent), previous_cube)
+        push, pop, get_neighbors = heapq.heappush, heapq.heappop, self.get_neighbors
+        if self.counters is not None:
+            push, pop, get_neighbors = self.counters.instrument(push, pop, get_neighbors, lambda entry: entry[1])
+        while True:
+            # improve the path until no cube of the open_set can lead to a shorter path to the goal
+            out_of_budget = False
+            while open_set and (goal not in g_score or open_set[0][0] < g_score[goal]):
+                if not self._step():
+                    return None
+                if (deadline is not None and time.perf_counter() > deadline) or (expansion_budget is not None and expansions >= expansion_budget):
+                    out_of_budget = True
+                    break
+
+                max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+                current_cube = pop(open_set)[1] # get cube with lowest inflated f_score from open_set
+                if current_cube in closed_set: # outdated entry (cube was pushed again with a lower score)
+                    continue
+                closed_set.add(current_cube)
+                expansions += 1
+
+                # process neighbors of current_cube
+                temp_g_score = g_score[current_cube] + 1 # all edges have a weight of 1
+                for neighbor in get_neighbors(*current_cube):
+                    if neighbor not in g_score or temp_g_score < g_score[neighbor]:
+                        g_score[neighbor] = temp_g_score # set/update g_score of the neighbor
+                        previous_cube[neighbor] = current_cube # map current_cube to previous_cube
+                        if neighbor in closed_set:
+                            inconsistent.add(neighbor) # expanded with a worse g_score, repaired with the next epsilon
+                        else:
+                            push(open_set, (temp_g_score + epsilon * heuristic(neighbor, goal), neighbor))
+                        self._visit(neighbor)
+
+            if goal in g_score:
+                # every shorter path passes a cube of the open_set or an inconsistent cube, so their lowest f_score bounds the optimum
+                goal_g_score = g_score[goal]
+                lower_bound = min([g_score[cube] + heuristic(cube, goal) for _, cube in open_set if cube not in closed_set] +
+                                  [g_score[cube] + heuristic(cube, goal) for cube in inconsistent] + [goal_g_score])
+                bound = goal_g_score / lower_bound if lower_bound else 1.0
+                if not out_of_budget:
+                    bound = min(bound, epsilon)
+                if best_result is None or goal_g_score < len(best_result.path) - 1:
+                    runtime = time.perf_counter() - start_time
+                    if first_solution_time is None:
+                        first_solution_time = runtime
+                    best_result = SearchResult("ARA*", self.generate_path(previous_cube, goal), len(g_score) - 1, max_queue_size, runtime)
+                    best_result.suboptimality = bound
+                    best_result.time_to_first_solution = first_solution_time
+                    if self.observer is not None:
+                        self.observer.solution(best_result)
+                else:
+                    best_result.suboptimality = min(best_result.suboptimality, bound)
+                if best_result.suboptimality <= 1.0:
+                    break
+            if out_of_budget or not (open_set or inconsistent):
+                break
+
+            # lower epsilon and continue with the open_set and the inconsistent cubes
+            epsilon = max(1.0, epsilon - self.EPSILON_STEP)
+            cubes = {cube for _, cube in open_set if cube not in closed_set} | inconsistent
+            open_set[:] = [(g_score[cube] + epsilon * heuristic(cube, goal), cube) for cube in cubes]
+            heapq.heapify(open_set)
+            closed_set.clear()
+            inconsistent.clear()
+
+        runtime = time.perf_counter() - start_time
+        if best_result is None: # if no path to goal is found (or the budget ran out first)
+            logging.info("No path found.")
+            return SearchResult("ARA*", None, len(g_score) - 1, max_queue_size, runtime)
+        result = SearchResult("ARA*", best_result.path, len(g_score) - 1, max_queue_size, runtime)
+        result.suboptimality = best_result.suboptimality
+        result.time_to_first_solution = first_solution_time
+        return result
+
+    def jump_point_search(self, start, goal):
+        """
+        Performs Jump Point Search (JPS) to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return JumpPointSearch(self.grid, self.observer, self.memory_tracker, self.counters, self.open_list).search(start, goal)
+
+    def fringe_search(self, start, goal):
+        """
+        Performs Fringe Search, an optimal search with a small, fixed memory footprint (see FringeSearch).
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+
+        Raises:
+            ValueError: If the memory limit is smaller than the g-scores of the map.
+        """
+        return FringeSearch(self.grid, self.observer, self.memory_tracker, self.memory_limit).search(start, goal)
+
+    def distance_field(self, sources):
+        """
+        Gets the distance field of one or more sources (one breadth-first sweep, cached in the field cache).
+
+        A field of a goal gives the paths of all starts to it (DistanceField.path_to_source), a field of a start
+        the paths to all goals (DistanceField.path_from_source).
+
+        Args:
+            sources: The (x, y) coordinates of the sources.
+
+        Returns:
+            DistanceField: The field of the sources, or None if the observer aborted the sweep.
+        """
+        return self.field_cache.field(self.grid, sources, self.observer)[0]
+
+    def distance_field_search(self, start, goal):
+        """
+        Finds the shortest path from the start cube to the goal cube in the distance field of the goal.
+
+        The first query to a goal sweeps the whole map from the goal, later queries to the same goal (from any
+        start) only follow the parents of the cached field and visit no cubes.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        field, cached = self.field_cache.field(self.grid, (goal,), self.observer, self.memory_tracker)
+        if field is None:
+            return None
+        path = field.path_to_source(start) # from start to goal
+        visited_cubes, max_queue_size = (0, 0) if cached else (field.visited_cubes, field.max_queue_size)
+        if path is None:
+            logging.info("No path found.")
+        return SearchResult("Dist-Field", path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+    def bidirectional_bfs(self, start, goal):
+        """
+        Performs a bidirectional Breadth-First Search from the start cube and the goal cube at the same time.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return BidirectionalSearch(self.grid, self.observer, self.memory_tracker).bfs(start, goal)
+
+    def bidirectional_a_star(self, start, goal):
+        """
+        Performs a bidirectional A* search from the start cube and the goal cube at the same time.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return BidirectionalSearch(self.grid, self.observer, self.memory_tracker).a_star(start, goal)
+
+    def hierarchical_search(self, start, goal):
+        """
+        Performs HPA* on the cached cluster graph of the grid (near-optimal path).
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return HierarchicalSearch(self.grid, self.observer, memory_tracker=self.memory_tracker).search(start, goal)
+
+    def hierarchical_search_exact(self, start, goal):
+        """
+        Performs HPA* with exact refinement on the cached cluster graph of the grid (optimal path).
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return HierarchicalSearch(self.grid, self.observer, memory_tracker=self.memory_tracker).search(start, goal, exact=True)
+
+    def incremental_search(self, start, goal):
+        """
+        Performs Lifelong Planning A* (LPA*), which repairs its previous search after edits of the grid.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return self.grid.incremental_planner().plan(start, goal, self.observer, self.memory_tracker)
+
+def find_path(grid, start, goal, algorithm: str = "A*", indexed: bool = False):
+    """
+    Convenience function to run a single headless search.
+
+    Args:
+        grid: The grid to search on (e.g. a GridMap).
+        start: The (x, y) coordinates of the start cube.
+        goal: The (x, y) coordinates of the goal cube.
+        algorithm: The name of the algorithm (as shown in the dropdown).
+        indexed: Whether to use the IndexedSearchEngine (integer cell ids for A* and Dijkstra).
+
+    Returns:
+        SearchResult: The result of the search.
+    """
+    if indexed:
+        from .indexed import IndexedSearchEngine
+        return IndexedSearchEngine(grid).search(algorithm, start, goal)
+    return SearchEngine(grid).search(algorithm, start, goal)
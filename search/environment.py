@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import platform
+import subprocess
+
+def cpu_model() -> str:
+    """
+    Gets the model name of the CPU.
+
+    Returns:
+        The model name, or the processor string of the platform module if it is not available.
+    """
+    try:
+        with open("/proc/cpuinfo", "r") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or platform.machine()
+
+def git_revision():
+    """
+    Gets the current git commit of the project.
+
+    Returns:
+        The commit hash, or None if it is not available.
+    """
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def collect_metadata() -> dict:
+    """
+    Collects the interpreter, CPU and timer information of the benchmark environment.
+
+    Returns:
+        A dictionary with the metadata.
+    """
+    clock = time.get_clock_info("perf_counter")
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "python_compiler": platform.python_compiler(),
+        "executable": sys.executable,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_model": cpu_model(),
+        "cpu_count": os.cpu_count(),
+        "timer": "perf_counter_ns",
+        "timer_resolution_s": clock.resolution,
+        "git_revision": git_revision()
+    }
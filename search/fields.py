@@ -0,0 +1,242 @@
+import sys
+import time
+from array import array
+from collections import OrderedDict
+
+# default memory limit of a FieldCache (a field of a 512x512 map takes about 2 MB)
+DEFAULT_FIELD_MEMORY = 64 * 2 ** 20
+
+class DistanceField:
+    """
+    The distances of all cubes to their nearest source and the next step towards it, from one breadth-first sweep.
+
+    A field of a goal answers the queries of all starts to that goal (follow the parents from the start), a field
+    of a start the queries to all goals (follow the parents from the goal and reverse the path). The arrays are
+    indexed by the cell ids of the padded occupancy buffer (see GridMap.padded_occupancy).
+
+    Attributes:
+        sources: The (x, y) coordinates of the sources.
+        width: The width of the padded occupancy buffer.
+        distances: The distance of each cell id to the nearest source (-1 for obstacles and unreachable cubes).
+        parents: The next cell id towards the nearest source (-1 for the sources, obstacles and unreachable cubes).
+        visited_cubes: The number of cubes the sweep reached (excluding the sources).
+        max_queue_size: The maximum size of the frontier during the sweep.
+        runtime: The time taken by the sweep in seconds.
+    """
+    def __init__(self, sources: tuple, width: int, distances: array, parents: array, visited_cubes: int, max_queue_size: int, runtime: float):
+        """
+        Initializes the DistanceField.
+
+        Args:
+            sources: The (x, y) coordinates of the sources.
+            width: The width of the padded occupancy buffer.
+            distances: The distance of each cell id to the nearest source (-1 for obstacles and unreachable cubes).
+            parents: The next cell id towards the nearest source (-1 for the sources, obstacles and unreachable cubes).
+            visited_cubes: The number of cubes the sweep reached (excluding the sources).
+            max_queue_size: The maximum size of the frontier during the sweep.
+            runtime: The time taken by the sweep in seconds.
+        """
+        self.sources = sources
+        self.width = width
+        self.distances = distances
+        self.parents = parents
+        self.visited_cubes = visited_cubes
+        self.max_queue_size = max_queue_size
+        self.runtime = runtime
+
+    @property
+    def nbytes(self) -> int:
+        """The bytes of the distance and parent arrays."""
+        return sys.getsizeof(self.distances) + sys.getsizeof(self.parents)
+
+    def distance(self, cube):
+        """
+        Gets the distance of a cube to the nearest source.
+
+        Args:
+            cube: The (x, y) coordinates of the cube.
+
+        Returns:
+            The distance, or None if no source is reachable.
+        """
+        distance = self.distances[(cube[1] + 1) * self.width + cube[0] + 1]
+        return distance if distance != -1 else None
+
+    def path_to_source(self, cube):
+        """
+        Extracts the shortest path from a cube to its nearest source by following the parents.
+
+        Args:
+            cube: The (x, y) coordinates of the cube.
+
+        Returns:
+            A list of cubes from cube to the source, or None if no source is reachable.
+        """
+        width, parents = self.width, self.parents
+        cell_id = (cube[1] + 1) * width + cube[0] + 1
+        if self.distances[cell_id] == -1:
+            return None
+        path = []
+        while cell_id != -1:
+            y, x = divmod(cell_id, width)
+            path.append((x - 1, y - 1)) # remove border
+            cell_id = parents[cell_id]
+        return path
+
+    def path_from_source(self, cube):
+        """
+        Extracts the shortest path from the nearest source to a cube.
+
+        Args:
+            cube: The (x, y) coordinates of the cube.
+
+        Returns:
+            A list of cubes from the source to cube, or None if no source is reachable.
+        """
+        path = self.path_to_source(cube)
+        if path is not None:
+            path.reverse() # reverse list for correct order (source to cube)
+        return path
+
+def compute_distance_field(grid, sources, observer=None, memory_tracker=None):
+    """
+    Runs one breadth-first sweep from all sources over the whole map (all edges have a weight of 1).
+
+    Args:
+        grid: The grid to sweep.
+        sources: The (x, y) coordinates of the sources (obstacles are ignored).
+        observer: An optional SearchObserver that is notified while sweeping.
+        memory_tracker: An optional MemoryTracker the structures of the sweep are registered with.
+
+    Returns:
+        DistanceField: The field of the sources, or None if the observer aborted the sweep.
+    """
+    start_time = time.perf_counter() # get start_time for runtime-calculation
+    occupancy, width = grid.padded_occupancy()
+    offsets = (-1, 1, -width, width) # left, right, up, down
+    distances = array('i', [-1]) * len(occupancy) # -1 == not reached yet
+    parents = array('i', [-1]) * len(occupancy)
+    frontier = []
+    for x, y in sources:
+        source_id = (y + 1) * width + x + 1
+        if not occupancy[source_id] and distances[source_id] == -1:
+            distances[source_id] = 0
+            frontier.append(source_id)
+    visited_cubes = 0
+    max_queue_size = len(frontier)
+    if memory_tracker is not None:
+        memory_tracker.track(frontier, distances, parents)
+    distance = 0
+    while frontier:
+        distance += 1
+        max_queue_size = max(max_queue_size, len(frontier)) # update max queue size
+        next_frontier = []
+        for cell_id in frontier:
+            if observer is not None and not observer.step():
+                return None
+            for offset in offsets:
+                neighbor_id = cell_id + offset
+                if not occupancy[neighbor_id] and distances[neighbor_id] == -1:
+                    distances[neighbor_id] = distance
+                    parents[neighbor_id] = cell_id # the neighbor steps back to cell_id
+                    next_frontier.append(neighbor_id)
+                    if observer is not None:
+                        neighbor_y, neighbor_x = divmod(neighbor_id, width)
+                        observer.visit(neighbor_x - 1, neighbor_y - 1)
+        visited_cubes += len(next_frontier)
+        frontier = next_frontier
+    return DistanceField(tuple(sources), width, distances, parents, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+class FieldCache:
+    """
+    A memory-bounded LRU cache of distance fields.
+
+    Fields are keyed by the content hash of the grid (see GridMap.content_hash) plus the set of sources, so a field
+    is only ever returned for exactly the grid it was computed on (like the ResultCache). The least recently used
+    fields are evicted while the fields hold more than memory_limit bytes; a field larger than the limit is
+    returned but not cached.
+
+    Attributes:
+        memory_limit: The maximum number of bytes of the cached fields.
+        entries: An OrderedDict mapping keys to fields (least recently used first).
+        nbytes: The bytes of the cached fields.
+        hits: The number of lookups that returned a cached field.
+        misses: The number of lookups that had to sweep.
+    """
+    def __init__(self, memory_limit: int = DEFAULT_FIELD_MEMORY):
+        """
+        Initializes an empty FieldCache.
+
+        Args:
+            memory_limit: The maximum number of bytes of the cached fields.
+        """
+        self.memory_limit = memory_limit
+        self.entries = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(grid, sources) -> tuple:
+        """
+        Builds the cache key of a field.
+
+        Args:
+            grid: The grid of the field.
+            sources: The (x, y) coordinates of the sources.
+
+        Returns:
+            tuple: The key of the field.
+        """
+        return grid.content_hash(), tuple(sorted(set(map(tuple, sources))))
+
+    def field(self, grid, sources, observer=None, memory_tracker=None) -> tuple:
+        """
+        Gets the field of the sources from the cache or sweeps and caches it.
+
+        Args:
+            grid: The grid of the field.
+            sources: The (x, y) coordinates of the sources.
+            observer: An optional SearchObserver that is notified while sweeping.
+            memory_tracker: An optional MemoryTracker the structures of a sweep are registered with.
+
+        Returns:
+            tuple: The DistanceField (None if the observer aborted the sweep) and True if it was cached.
+        """
+        key = self.key(grid, sources)
+        field = self.entries.get(key)
+        if field is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return field, True
+        self.misses += 1
+        field = compute_distance_field(grid, key[1], observer, memory_tracker)
+        if field is not None:
+            self.put(key, field)
+        return field, False
+
+    def put(self, key: tuple, field: DistanceField) -> None:
+        """
+        Stores a field, evicting the least recently used fields until the limit is kept.
+
+        Args:
+            key: The key of the field (see key).
+            field: The DistanceField to store.
+        """
+        if field.nbytes > self.memory_limit:
+            return
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= previous.nbytes
+        self.entries[key] = field
+        self.nbytes += field.nbytes
+        while self.nbytes > self.memory_limit:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Removes all cached fields and resets the counters."""
+        self.entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
@@ -0,0 +1,183 @@
+import sys
+import time
+import logging
+from array import array
+from .result import SearchResult
+
+# bytes per entry of the fringe lists: a 4 byte cell id plus the over-allocation of a growing array (1/8)
+ENTRY_BYTES = 5
+
+class FringeSearch:
+    """
+    Fringe Search for uniform-cost, 4-connected grids with a small, fixed memory footprint.
+
+    Like IDA*, the search expands the cubes whose f-score is within a threshold in depth-first order, and the
+    threshold is raised to the lowest f-score above it after every iteration. Instead of starting over from the
+    start, the fringe (the cubes above the threshold) is kept in a later list, which becomes the list of the next
+    iteration. The returned paths are optimal.
+
+    There is no heap, no set of visited cubes and no predecessor map: the g-scores are kept in an array of the
+    padded occupancy buffer (4 bytes per cube, see GridMap.padded_occupancy), the lists hold cell ids as 4 byte
+    integers and the path is read back from the g-scores (from the goal, each step goes to a neighbor whose
+    g-score is lower by one). With a memory limit, the structures of the search (not the returned path) never
+    hold more than memory_limit bytes; if the fringe would grow beyond it, the search stops without a path.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+        memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+        memory_limit: The maximum number of bytes of the structures of a search, or None for no limit.
+    """
+    def __init__(self, grid, observer=None, memory_tracker=None, memory_limit: int = None):
+        """
+        Initializes the FringeSearch with a grid and an optional observer.
+
+        Args:
+            grid: The grid to search on.
+            observer: An optional SearchObserver that is notified while searching.
+            memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+            memory_limit: The maximum number of bytes of the structures of a search, or None for no limit.
+        """
+        self.grid = grid
+        self.observer = observer
+        self.memory_tracker = memory_tracker
+        self.memory_limit = memory_limit
+
+    @staticmethod
+    def generate_path(g_score, occupancy, offsets: tuple, start_id: int, goal_id: int, width: int) -> list:
+        """
+        Generates the path from the start to the goal by descending the g-scores from the goal.
+
+        Every g-score is the length of a path from the start and the g-score of the goal is optimal, so each
+        cube of the path has a neighbor with a g-score lower by one, down to the start (g-score 0).
+
+        Args:
+            g_score: An array mapping each cell id to its g-score (-1 for cubes that were not visited).
+            occupancy: The padded occupancy buffer.
+            offsets: The offsets of the neighbors in the padded occupancy buffer.
+            start_id: The cell id of the start.
+            goal_id: The cell id of the goal.
+            width: The width of the padded occupancy buffer.
+
+        Returns:
+            A list of cubes representing the path from start to goal.
+        """
+        path = []
+        current_id = goal_id
+        while current_id != start_id:
+            y, x = divmod(current_id, width)
+            path.append((x - 1, y - 1)) # remove border
+            previous_g_score = g_score[current_id] - 1
+            for offset in offsets:
+                neighbor_id = current_id + offset
+                if not occupancy[neighbor_id] and g_score[neighbor_id] == previous_g_score:
+                    current_id = neighbor_id
+                    break
+            else: # no neighbor on a shortest path (cannot happen for a g-score set by the search)
+                raise RuntimeError(f"Broken g-scores at cell {current_id}")
+        y, x = divmod(start_id, width)
+        path.append((x - 1, y - 1))
+        path.reverse() # reverse list for correct order (start to goal)
+        return path
+
+    def search(self, start, goal):
+        """
+        Performs Fringe Search to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search (no path if the memory limit is reached), or None if the observer aborted the search.
+
+        Raises:
+            ValueError: If the memory limit is smaller than the g-scores of the map.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        occupancy, width = self.grid.padded_occupancy()
+        cell_count = len(occupancy)
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        goal_x, goal_y = goal[0] + 1, goal[1] + 1
+        if occupancy[start_id] or occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult("Fringe", None, 0, 0, time.perf_counter() - start_time)
+
+        g_score = array('i', [-1]) * cell_count # -1 == not visited yet
+        location = bytearray(cell_count) # 0 == in no list, 1 == in now, 2 == in later
+        now, later = array('i', [start_id]), array('i') # the cubes of this and of the next iteration
+        max_entries = None
+        if self.memory_limit is not None:
+            fixed_bytes = sys.getsizeof(g_score) + sys.getsizeof(location) + 2 * sys.getsizeof(array('i'))
+            if fixed_bytes > self.memory_limit:
+                raise ValueError(f"Memory limit of {self.memory_limit} bytes is smaller than the {fixed_bytes} bytes of the map")
+            max_entries = (self.memory_limit - fixed_bytes) // ENTRY_BYTES
+        g_score[start_id] = 0
+        location[start_id] = 1
+        threshold = abs(start[0] - goal[0]) + abs(start[1] - goal[1])
+        visited_cubes = 0 # visited cubes (excluding start)
+        max_queue_size = 1 # track max size of both lists during search
+        observer = self.observer
+        if self.memory_tracker is not None:
+            self.memory_tracker.track((now, later), (g_score, location))
+        while now:
+            next_threshold = -1 # lowest f_score above the threshold
+            while now:
+                if observer is not None and not observer.step():
+                    return None
+
+                queue_size = len(now) + len(later)
+                if queue_size > max_queue_size:
+                    max_queue_size = queue_size # update max queue size
+                    if max_entries is not None and queue_size > max_entries:
+                        logging.warning(f"No path found (memory limit of {self.memory_limit} bytes reached).")
+                        return SearchResult("Fringe", None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+                current_id = now.pop()
+                if location[current_id] != 1: # outdated entry (cube was added again or moved back from later)
+                    continue
+                location[current_id] = 0
+                current_g_score = g_score[current_id]
+                current_y, current_x = divmod(current_id, width)
+                f_score = current_g_score + abs(current_x - goal_x) + abs(current_y - goal_y)
+                if f_score > threshold: # defer to the next iteration
+                    later.append(current_id)
+                    location[current_id] = 2
+                    if next_threshold == -1 or f_score < next_threshold:
+                        next_threshold = f_score
+                    continue
+
+                # goal found
+                if current_id == goal_id:
+                    path = self.generate_path(g_score, occupancy, offsets, start_id, goal_id, width)
+                    return SearchResult("Fringe", path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+                # process neighbors of current_cube (depth-first: they are expanded next)
+                temp_g_score = current_g_score + 1 # all edges have a weight of 1
+                for offset in offsets:
+                    neighbor_id = current_id + offset
+                    if occupancy[neighbor_id]:
+                        continue
+                    neighbor_g_score = g_score[neighbor_id]
+                    if neighbor_g_score == -1 or temp_g_score < neighbor_g_score:
+                        if neighbor_g_score == -1:
+                            visited_cubes += 1
+                        g_score[neighbor_id] = temp_g_score
+                        if location[neighbor_id] != 1:
+                            now.append(neighbor_id)
+                            location[neighbor_id] = 1
+                        if observer is not None:
+                            neighbor_y, neighbor_x = divmod(neighbor_id, width)
+                            observer.visit(neighbor_x - 1, neighbor_y - 1)
+
+            # the fringe becomes the list of the next iteration
+            threshold = next_threshold
+            now, later = later, now
+            for cell_id in now:
+                if location[cell_id] == 2:
+                    location[cell_id] = 1
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("Fringe", None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
@@ -0,0 +1,362 @@
+import logging
+import hashlib
+from .mapcache import read_map_cache, write_map_cache
+from .components import ComponentIndex
+from .hierarchical import ClusterGraph
+from .incremental import IncrementalPlanner
+from .landmarks import LandmarkTable
+from .pathdb import PathDatabase
+
+# translation table for map rows: '@' is an obstacle (1), every other character is traversable (0)
+MAP_CHARS_TO_OCCUPANCY = bytes(1 if char == ord('@') else 0 for char in range(256))
+OCCUPANCY_TO_MAP_CHARS = bytes.maketrans(b"\x00\x01", b".@")
+# Moving AI maps (.map): '.', 'G' (ground) and 'S' (swamp) are passable, '@', 'O' (out of bounds), 'T' (trees) and 'W' (water) are not
+MOVINGAI_CHARS_TO_OCCUPANCY = bytes(0 if char in b".GS" else 1 for char in range(256))
+
+class GridMap:
+    """
+    A headless representation of a grid map without any rendering state.
+
+    The cells are stored row-major in a flat bytearray (`occupancy`), where the cell (x, y)
+    is found at index `y * cols + x`. A value of 0 marks a traversable cell and a value of 1 an obstacle.
+
+    Attributes:
+        rows: Number of rows in the grid.
+        cols: Number of columns in the grid.
+        occupancy: A bytearray of size rows * cols marking obstacles with 1.
+        start_cube: Coordinates of the start cube.
+        goal_cube: Coordinates of the goal cube.
+        current_map_file: Filename of the current map file.
+        map_path: Path to the loaded map file (None after a resize), used for the files stored next to the map.
+        listeners: Objects that are notified about changes of the grid (see add_listener).
+    """
+    def __init__(self, rows: int, cols: int):
+        """
+        Initializes a new GridMap where every cell is traversable.
+
+        Args:
+            rows: Number of rows in the grid.
+            cols: Number of columns in the grid.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.occupancy = bytearray(rows * cols)
+        self.start_cube = None
+        self.goal_cube = None
+        self.current_map_file = None
+        self.map_path = None
+        self.listeners = []
+        self._component_index = None
+        self._cluster_graphs = {}
+        self._incremental_planner = None
+        self._landmark_table = None
+        self._path_database = None
+        self._content_hash = None
+
+    def add_listener(self, listener) -> None:
+        """
+        Registers a listener that is notified about changes of the grid.
+
+        A listener provides `cell_changed(x, y, traversable)`, called when a single cell changes through
+        set_traversable, and `grid_reset()`, called when the whole grid is replaced (resize, load_map).
+
+        Args:
+            listener: The listener to register.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """
+        Removes a registered listener.
+
+        Args:
+            listener: The listener to remove.
+        """
+        self.listeners.remove(listener)
+
+    def notify_reset(self) -> None:
+        """Notifies all listeners that the whole grid was replaced."""
+        self._content_hash = None
+        for listener in self.listeners:
+            listener.grid_reset()
+
+    def content_hash(self) -> bytes:
+        """
+        Gets a hash of the size and the obstacles of the grid, which is recomputed only after the grid changed.
+
+        Returns:
+            bytes: The BLAKE2b digest (16 bytes) of the grid content.
+        """
+        if self._content_hash is None:
+            digest = hashlib.blake2b(f"{self.rows}x{self.cols}".encode("ascii"), digest_size=16)
+            digest.update(self.occupancy)
+            self._content_hash = digest.digest()
+        return self._content_hash
+
+    def component_index(self) -> ComponentIndex:
+        """
+        Gets the ComponentIndex of the grid, which is created on the first call and kept up to date with all edits.
+
+        Returns:
+            ComponentIndex: The component index of the grid.
+        """
+        if self._component_index is None:
+            self._component_index = ComponentIndex(self)
+        return self._component_index
+
+    def cluster_graph(self, cluster_size: int = 16) -> ClusterGraph:
+        """
+        Gets the ClusterGraph (HPA*) of the grid for a cluster size, which is created on the first call and
+        rebuilt only for the clusters touched by edits.
+
+        Args:
+            cluster_size: The width and height of a cluster in cubes.
+
+        Returns:
+            ClusterGraph: The cluster graph of the grid.
+        """
+        if cluster_size not in self._cluster_graphs:
+            self._cluster_graphs[cluster_size] = ClusterGraph(self, cluster_size)
+        return self._cluster_graphs[cluster_size]
+
+    def incremental_planner(self) -> IncrementalPlanner:
+        """
+        Gets the IncrementalPlanner (LPA*) of the grid, which is created on the first call and keeps its search state between edits.
+
+        Returns:
+            IncrementalPlanner: The incremental planner of the grid.
+        """
+        if self._incremental_planner is None:
+            self._incremental_planner = IncrementalPlanner(self)
+        return self._incremental_planner
+
+    def landmark_table(self) -> LandmarkTable:
+        """
+        Gets the LandmarkTable (ALT heuristic) of the grid, which is created on the first call, loaded from or saved
+        next to the map file and rebuilt after edits.
+
+        Returns:
+            LandmarkTable: The landmark table of the grid.
+        """
+        if self._landmark_table is None:
+            self._landmark_table = LandmarkTable(self)
+        return self._landmark_table
+
+    def path_database(self) -> PathDatabase:
+        """
+        Gets the PathDatabase (compressed first moves) of the grid, which is created on the first call, loaded from
+        or saved next to the map file and rebuilt after edits.
+
+        Returns:
+            PathDatabase: The path database of the grid.
+        """
+        if self._path_database is None:
+            self._path_database = PathDatabase(self)
+        return self._path_database
+
+    def index(self, x: int, y: int) -> int:
+        """
+        Converts coordinates into the index of the cell in the occupancy buffer.
+
+        Args:
+            x: The x-coordinate of the cell.
+            y: The y-coordinate of the cell.
+
+        Returns:
+            The row-major index of the cell.
+        """
+        return y * self.cols + x
+
+    def coordinates(self, index: int) -> tuple:
+        """
+        Converts an index of the occupancy buffer into coordinates.
+
+        Args:
+            index: The row-major index of the cell.
+
+        Returns:
+            The (x, y) coordinates of the cell.
+        """
+        y, x = divmod(index, self.cols)
+        return x, y
+
+    def is_traversable(self, x: int, y: int) -> bool:
+        """
+        Checks whether the cell at the given coordinates can be traversed.
+
+        Args:
+            x: The x-coordinate of the cell.
+            y: The y-coordinate of the cell.
+
+        Returns:
+            True if the cell is traversable, False otherwise.
+        """
+        return not self.occupancy[y * self.cols + x]
+
+    def set_traversable(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Marks the cell at the given coordinates as traversable or blocked.
+
+        Args:
+            x: The x-coordinate of the cell.
+            y: The y-coordinate of the cell.
+            traversable: True to make the cell traversable, False to block it.
+        """
+        index = y * self.cols + x
+        if self.occupancy[index] == (0 if traversable else 1):
+            return
+        self.occupancy[index] = 0 if traversable else 1
+        self._content_hash = None
+        for listener in self.listeners:
+            listener.cell_changed(x, y, traversable)
+
+    def resize(self, rows: int, cols: int) -> None:
+        """
+        Resizes the grid map to new dimensions and resets all cells, start and goal.
+
+        Args:
+            rows: The new number of rows.
+            cols: The new number of columns.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.occupancy = bytearray(rows * cols)
+        self.start_cube = None
+        self.goal_cube = None
+        self.map_path = None
+        self.notify_reset()
+
+    def padded_occupancy(self) -> tuple:
+        """
+        Copies the occupancy into a buffer with a one-cell border of obstacles.
+
+        With the border every cell has four neighbors inside the buffer, so neighbors can be found
+        by adding index offsets (-1, 1, -width, width) without any bounds checks.
+        The cell (x, y) is found at index `(y + 1) * width + x + 1`.
+
+        Returns:
+            tuple: The padded occupancy (bytearray) and its width (cols + 2).
+        """
+        width = self.cols + 2
+        padded = bytearray(b"\x01") * (width * (self.rows + 2))
+        for y in range(self.rows):
+            row_start = (y + 1) * width + 1
+            padded[row_start:row_start + self.cols] = self.occupancy[y * self.cols:(y + 1) * self.cols]
+        return padded, width
+
+    def generate_map_data(self):
+        """
+        Generates the lines of the map file format for the current grid map.
+
+        Yields:
+            The lines of the map file (including line breaks).
+        """
+        yield f"rows {self.rows}\n"
+        yield f"cols {self.cols}\n"
+        if self.start_cube:
+            yield f"start {self.start_cube[0]},{self.start_cube[1]}\n"
+        if self.goal_cube:
+            yield f"goal {self.goal_cube[0]},{self.goal_cube[1]}\n"
+
+        for y in range(self.rows):
+            yield self.occupancy[y * self.cols:(y + 1) * self.cols].translate(OCCUPANCY_TO_MAP_CHARS).decode("ascii") + '\n'
+
+    def parse_map(self, data: bytes) -> None:
+        """
+        Parses the content of a map file into this grid map.
+
+        The map rows are converted in bulk: all rows are joined and '@' / '.' are translated
+        into occupancy bytes with a single bytes.translate call.
+
+        Args:
+            data: The content of the map file.
+        """
+        lines = data.splitlines()
+        rows = int(lines[0].split()[1])
+        cols = int(lines[1].split()[1])
+        start_cube = None
+        goal_cube = None
+
+        map_rows = []
+        for line in lines[2:]:
+            if line.startswith(b"start"):
+                start_x, start_y = map(int, line.split()[1].split(b','))
+                start_cube = (start_x, start_y)
+            elif line.startswith(b"goal"):
+                goal_x, goal_y = map(int, line.split()[1].split(b','))
+                goal_cube = (goal_x, goal_y)
+            elif len(map_rows) < rows:
+                map_rows.append(line.strip()[:cols].ljust(cols, b'.')) # missing cubes are traversable
+
+        self.resize(rows, cols)
+        self.occupancy[:len(map_rows) * cols] = b"".join(map_rows).translate(MAP_CHARS_TO_OCCUPANCY)
+        self.start_cube = start_cube
+        self.goal_cube = goal_cube
+
+    def parse_movingai_map(self, data: bytes) -> None:
+        """
+        Parses the content of a Moving AI map file (.map) into this grid map.
+
+        The file starts with a header (type, height, width) followed by a line "map" and the rows.
+        Moving AI maps have no start and goal, those are defined by scenario files (see scenario).
+
+        Args:
+            data: The content of the map file.
+        """
+        lines = data.splitlines()
+        rows = cols = 0
+        for line_number, line in enumerate(lines):
+            parts = line.split()
+            if parts[:1] == [b"height"]:
+                rows = int(parts[1])
+            elif parts[:1] == [b"width"]:
+                cols = int(parts[1])
+            elif parts[:1] == [b"map"]:
+                break
+        map_rows = [line.strip()[:cols].ljust(cols, b'@') for line in lines[line_number + 1:line_number + 1 + rows]]
+
+        self.resize(rows, cols)
+        self.occupancy[:] = b"".join(map_rows).ljust(rows * cols, b'@').translate(MOVINGAI_CHARS_TO_OCCUPANCY)
+
+    def load_map(self, filename: str, use_cache: bool = True) -> None:
+        """
+        Loads a map file into this grid map.
+
+        Files ending with .map are read as Moving AI maps, all other files in the format of Grid.export_grid.
+        If use_cache is enabled, the map is read from its binary sidecar (see mapcache), which is
+        written on the first load and rebuilt whenever the map file changes.
+
+        Args:
+            filename: The path to the file to be loaded.
+            use_cache: Whether the binary sidecar should be used.
+        """
+        if use_cache and read_map_cache(self, filename):
+            logging.debug(f"Loaded map from cache: {filename}")
+        else:
+            with open(filename, 'rb') as f:
+                if filename.endswith(".map"):
+                    self.parse_movingai_map(f.read())
+                else:
+                    self.parse_map(f.read())
+            if use_cache:
+                write_map_cache(self, filename)
+            logging.debug(f"Loaded map from: {filename}")
+        self.map_path = filename
+        self.notify_reset()
+        self.current_map_file = filename.replace("\\", "/").rsplit('/', 1)[-1]
+
+    @classmethod
+    def load(cls, filename: str, use_cache: bool = True):
+        """
+        Creates a grid map from a map file.
+
+        Args:
+            filename: The path to the file to be loaded.
+            use_cache: Whether the binary sidecar should be used.
+
+        Returns:
+            GridMap: The loaded grid map.
+        """
+        grid_map = cls(0, 0)
+        grid_map.load_map(filename, use_cache)
+        return grid_map
@@ -0,0 +1,489 @@
+import time
+import heapq
+import logging
+from array import array
+from collections import deque
+from .result import SearchResult
+
+# border segments of at least this length get two transitions (one at each end) instead of one in the middle
+LONG_SEGMENT = 6
+
+class ClusterGraph:
+    """
+    The abstract graph of HPA*: the grid is split into square clusters, each free segment of a border between
+    two clusters gets one or two transitions (pairs of adjacent cubes on both sides of the border) and the
+    cubes of these transitions are the nodes of the graph. Nodes of the same cluster are connected by their
+    distance inside the cluster, the two nodes of a transition by an edge of length 1.
+
+    Nodes are identified by their index in the occupancy of the grid (`y * cols + x`). The graph listens to
+    the edits of the grid (see GridMap.add_listener) and only rebuilds the clusters touched by an edit
+    (and the neighbors whose nodes changed) on the next query.
+
+    Attributes:
+        grid: The GridMap the graph is built for.
+        cluster_size: The width and height of a cluster in cubes.
+        cluster_cols: The number of clusters per row.
+        cluster_rows: The number of clusters per column.
+        transitions: A dictionary mapping a border (pair of clusters) to its list of transitions (node pairs).
+        partners: A dictionary mapping a node to the nodes on the other side of its transitions.
+        edges: A list with a dictionary per cluster mapping each node to its (node, distance) edges inside the cluster.
+        dirty_clusters: The clusters that were edited since the last update.
+        valid: False if the whole graph has to be rebuilt before the next query.
+    """
+    def __init__(self, grid, cluster_size: int = 16):
+        """
+        Initializes the ClusterGraph and registers it as a listener of the grid.
+
+        Args:
+            grid: The GridMap to build the graph for.
+            cluster_size: The width and height of a cluster in cubes.
+        """
+        self.grid = grid
+        self.cluster_size = cluster_size
+        self.cluster_cols = 0
+        self.cluster_rows = 0
+        self.transitions = {}
+        self.partners = {}
+        self.edges = []
+        self.dirty_clusters = set()
+        self.valid = False
+        grid.add_listener(self)
+
+    def cluster_of(self, cell: int) -> int:
+        """
+        Gets the cluster of a cube.
+
+        Args:
+            cell: The index of the cube (`y * cols + x`).
+
+        Returns:
+            The index of the cluster (`cluster_y * cluster_cols + cluster_x`).
+        """
+        y, x = divmod(cell, self.grid.cols)
+        return (y // self.cluster_size) * self.cluster_cols + x // self.cluster_size
+
+    def cluster_bounds(self, cluster: int) -> tuple:
+        """
+        Gets the cubes covered by a cluster.
+
+        Args:
+            cluster: The index of the cluster.
+
+        Returns:
+            tuple: The first x, first y, last x + 1 and last y + 1 of the cluster.
+        """
+        cluster_y, cluster_x = divmod(cluster, self.cluster_cols)
+        start_x, start_y = cluster_x * self.cluster_size, cluster_y * self.cluster_size
+        return start_x, start_y, min(start_x + self.cluster_size, self.grid.cols), min(start_y + self.cluster_size, self.grid.rows)
+
+    def borders(self, cluster: int) -> list:
+        """
+        Gets the borders of a cluster to its (up to four) neighbors.
+
+        Args:
+            cluster: The index of the cluster.
+
+        Returns:
+            A list of borders, each a (left/upper cluster, right/lower cluster) tuple.
+        """
+        cluster_y, cluster_x = divmod(cluster, self.cluster_cols)
+        borders = []
+        if cluster_x > 0:
+            borders.append((cluster - 1, cluster))
+        if cluster_x < self.cluster_cols - 1:
+            borders.append((cluster, cluster + 1))
+        if cluster_y > 0:
+            borders.append((cluster - self.cluster_cols, cluster))
+        if cluster_y < self.cluster_rows - 1:
+            borders.append((cluster, cluster + self.cluster_cols))
+        return borders
+
+    def find_transitions(self, border: tuple) -> list:
+        """
+        Finds the transitions of a border by scanning both sides for segments of free cubes.
+
+        Args:
+            border: A (left/upper cluster, right/lower cluster) tuple.
+
+        Returns:
+            A list of (node in the first cluster, node in the second cluster) tuples.
+        """
+        cols, occupancy = self.grid.cols, self.grid.occupancy
+        start_x, start_y, end_x, end_y = self.cluster_bounds(border[0])
+        if border[1] == border[0] + self.cluster_cols: # horizontal border: cells along the last row of the first cluster
+            first_cell, step, other_offset, length = (end_y - 1) * cols + start_x, 1, cols, end_x - start_x
+        else: # vertical border: cells along the last column of the first cluster
+            first_cell, step, other_offset, length = start_y * cols + end_x - 1, cols, 1, end_y - start_y
+
+        transitions = []
+        segment_start = -1
+        for position in range(length + 1):
+            cell = first_cell + position * step
+            free = position < length and not occupancy[cell] and not occupancy[cell + other_offset]
+            if free and segment_start == -1:
+                segment_start = position
+            elif not free and segment_start != -1:
+                if position - segment_start >= LONG_SEGMENT:
+                    positions = (segment_start, position - 1)
+                else:
+                    positions = ((segment_start + position - 1) // 2,)
+                for transition_position in positions:
+                    cell = first_cell + transition_position * step
+                    transitions.append((cell, cell + other_offset))
+                segment_start = -1
+        return transitions
+
+    def set_transitions(self, border: tuple, transitions: list) -> None:
+        """
+        Replaces the transitions of a border and updates the partners of their nodes.
+
+        Args:
+            border: A (left/upper cluster, right/lower cluster) tuple.
+            transitions: The new list of transitions of the border.
+        """
+        for node_a, node_b in self.transitions.get(border, ()):
+            for node, partner in ((node_a, node_b), (node_b, node_a)):
+                self.partners[node].remove(partner)
+                if not self.partners[node]:
+                    del self.partners[node]
+        for node_a, node_b in transitions:
+            self.partners.setdefault(node_a, []).append(node_b)
+            self.partners.setdefault(node_b, []).append(node_a)
+        self.transitions[border] = transitions
+
+    def cluster_nodes(self, cluster: int) -> list:
+        """
+        Gets the nodes of a cluster (its cubes of the transitions of all its borders).
+
+        Args:
+            cluster: The index of the cluster.
+
+        Returns:
+            A sorted list of the nodes of the cluster.
+        """
+        nodes = set()
+        for border in self.borders(cluster):
+            side = 0 if border[0] == cluster else 1
+            nodes.update(transition[side] for transition in self.transitions.get(border, ()))
+        return sorted(nodes)
+
+    def local_buffer(self, cluster: int) -> tuple:
+        """
+        Copies a cluster into a small buffer with a one-cell border of obstacles (see GridMap.padded_occupancy).
+
+        Args:
+            cluster: The index of the cluster.
+
+        Returns:
+            tuple: The buffer (bytearray), its width, and the x and y of the first cube of the cluster.
+        """
+        cols, occupancy = self.grid.cols, self.grid.occupancy
+        start_x, start_y, end_x, end_y = self.cluster_bounds(cluster)
+        width = end_x - start_x + 2
+        buffer = bytearray(b"\x01") * (width * (end_y - start_y + 2))
+        for y in range(start_y, end_y):
+            row_start = (y - start_y + 1) * width + 1
+            buffer[row_start:row_start + end_x - start_x] = occupancy[y * cols + start_x:y * cols + end_x]
+        return buffer, width, start_x, start_y
+
+    def local_search(self, cluster: int, source: int, buffer_data: tuple = None) -> tuple:
+        """
+        Runs a BFS from a cube that never leaves its cluster.
+
+        Args:
+            cluster: The index of the cluster.
+            source: The index of the cube to start from.
+            buffer_data: The result of local_buffer for the cluster (created if not given).
+
+        Returns:
+            tuple: The buffer data, the distance array and the predecessor array (both indexed by local id, -1 == not reached).
+        """
+        buffer, width, start_x, start_y = buffer_data or self.local_buffer(cluster)
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        distance = array('i', [-1]) * len(buffer)
+        previous_cube = array('i', [-1]) * len(buffer)
+        source_id = self.local_id(source, width, start_x, start_y)
+        distance[source_id] = 0
+        queue = deque([source_id])
+        while queue:
+            current_id = queue.popleft()
+            next_distance = distance[current_id] + 1
+            for offset in offsets:
+                neighbor_id = current_id + offset
+                if buffer[neighbor_id] or distance[neighbor_id] != -1:
+                    continue
+                distance[neighbor_id] = next_distance
+                previous_cube[neighbor_id] = current_id
+                queue.append(neighbor_id)
+        return (buffer, width, start_x, start_y), distance, previous_cube
+
+    def local_id(self, cell: int, width: int, start_x: int, start_y: int) -> int:
+        """
+        Converts the index of a cube into its id in the local buffer of its cluster.
+
+        Args:
+            cell: The index of the cube.
+            width: The width of the local buffer.
+            start_x: The x of the first cube of the cluster.
+            start_y: The y of the first cube of the cluster.
+
+        Returns:
+            The id of the cube in the local buffer.
+        """
+        y, x = divmod(cell, self.grid.cols)
+        return (y - start_y + 1) * width + x - start_x + 1
+
+    def build_cluster(self, cluster: int) -> None:
+        """
+        Computes the distances between all nodes of a cluster with one local BFS per node.
+
+        Args:
+            cluster: The index of the cluster.
+        """
+        nodes = self.cluster_nodes(cluster)
+        cluster_edges = {}
+        buffer_data = None
+        for node in nodes:
+            buffer_data, distance, _ = self.local_search(cluster, node, buffer_data)
+            _, width, start_x, start_y = buffer_data
+            cluster_edges[node] = [(other, distance[self.local_id(other, width, start_x, start_y)]) for other in nodes
+                                   if other != node and distance[self.local_id(other, width, start_x, start_y)] != -1]
+        self.edges[cluster] = cluster_edges
+
+    def update(self) -> None:
+        """Rebuilds the whole graph if it is invalid, otherwise only the edited clusters and the neighbors whose nodes changed."""
+        if not self.valid:
+            start_time = time.perf_counter()
+            self.cluster_cols = -(-self.grid.cols // self.cluster_size)
+            self.cluster_rows = -(-self.grid.rows // self.cluster_size)
+            self.transitions = {}
+            self.partners = {}
+            self.edges = [{} for _ in range(self.cluster_cols * self.cluster_rows)]
+            for cluster in range(len(self.edges)):
+                for border in self.borders(cluster):
+                    if border[0] == cluster:
+                        self.set_transitions(border, self.find_transitions(border))
+            for cluster in range(len(self.edges)):
+                self.build_cluster(cluster)
+            self.valid = True
+            self.dirty_clusters.clear()
+            logging.debug(f"Built cluster graph with {len(self.edges)} clusters in {time.perf_counter() - start_time:.3f} s")
+            return
+
+        if not self.dirty_clusters:
+            return
+        rebuild = set(self.dirty_clusters)
+        for cluster in self.dirty_clusters:
+            for border in self.borders(cluster):
+                neighbor = border[1] if border[0] == cluster else border[0]
+                old_nodes = self.cluster_nodes(neighbor)
+                self.set_transitions(border, self.find_transitions(border))
+                if self.cluster_nodes(neighbor) != old_nodes:
+                    rebuild.add(neighbor)
+        for cluster in rebuild:
+            self.build_cluster(cluster)
+        self.dirty_clusters.clear()
+        logging.debug(f"Rebuilt {len(rebuild)} clusters of the cluster graph")
+
+    def cell_changed(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Marks the cluster of a changed cube for a rebuild (called by the grid).
+
+        Args:
+            x: The x-coordinate of the changed cube.
+            y: The y-coordinate of the changed cube.
+            traversable: True if the cube became traversable, False if it became an obstacle.
+        """
+        if self.valid:
+            self.dirty_clusters.add((y // self.cluster_size) * self.cluster_cols + x // self.cluster_size)
+
+    def grid_reset(self) -> None:
+        """Invalidates the whole graph after the grid was replaced (called by the grid)."""
+        self.valid = False
+
+class HierarchicalSearch:
+    """
+    Hierarchical Path-Finding A* (HPA*) on the ClusterGraph of a grid.
+
+    A query connects the start and the goal to the nodes of their clusters (local BFS), searches the
+    abstract graph with A* and refines each abstract edge into cubes with a local BFS inside its cluster.
+    The refined path is near-optimal. With exact refinement, the length of the refined path is used as an
+    upper bound for an A* on the grid that never pushes cubes with a larger f-score, which returns an
+    optimal path.
+
+    The runtime of the result does not include (re)building the cluster graph, which is done once per
+    map and after edits. The visited cubes are the abstract nodes reached plus the cubes reached by the
+    local searches.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+        cluster_graph: The ClusterGraph of the grid.
+        memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+    """
+    def __init__(self, grid, observer=None, cluster_graph: ClusterGraph = None, memory_tracker=None):
+        """
+        Initializes the HierarchicalSearch.
+
+        Args:
+            grid: The grid to search on.
+            observer: An optional SearchObserver that is notified about reached abstract nodes.
+            cluster_graph: The ClusterGraph to use (default: the cached graph of the grid, see GridMap.cluster_graph).
+            memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+        """
+        self.grid = grid
+        self.observer = observer
+        self.cluster_graph = cluster_graph if cluster_graph is not None else grid.cluster_graph()
+        self.memory_tracker = memory_tracker
+
+    def connect(self, cell: int, other: int) -> tuple:
+        """
+        Connects a cube to the nodes of its cluster (and to another cube in the same cluster).
+
+        Args:
+            cell: The index of the cube.
+            other: The index of the other query cube.
+
+        Returns:
+            tuple: A dictionary mapping the reached nodes (and other) to their distance, and the number of reached cubes.
+        """
+        graph = self.cluster_graph
+        cluster = graph.cluster_of(cell)
+        (_, width, start_x, start_y), distance, _ = graph.local_search(cluster, cell)
+        targets = graph.cluster_nodes(cluster)
+        if graph.cluster_of(other) == cluster:
+            targets.append(other)
+        distances = {}
+        for target in targets:
+            target_distance = distance[graph.local_id(target, width, start_x, start_y)]
+            if target_distance != -1:
+                distances[target] = target_distance
+        return distances, len(distance) - distance.count(-1) - 1
+
+    def refine(self, abstract_path: list) -> tuple:
+        """
+        Refines an abstract path into cubes with a local BFS for each abstract edge.
+
+        Args:
+            abstract_path: The nodes of the abstract path from start to goal.
+
+        Returns:
+            tuple: The path as a list of (x, y) tuples and the number of cubes reached by the local searches.
+        """
+        graph = self.cluster_graph
+        cols = self.grid.cols
+        cells = [abstract_path[0]]
+        visited_cubes = 0
+        for node, next_node in zip(abstract_path, abstract_path[1:]):
+            node_y, node_x = divmod(node, cols)
+            next_y, next_x = divmod(next_node, cols)
+            if abs(node_x - next_x) + abs(node_y - next_y) <= 1: # transition (or adjacent nodes)
+                if next_node != node:
+                    cells.append(next_node)
+                continue
+            cluster = graph.cluster_of(node)
+            (_, width, start_x, start_y), distance, previous_cube = graph.local_search(cluster, node)
+            visited_cubes += len(distance) - distance.count(-1) - 1
+            segment = []
+            current_id = graph.local_id(next_node, width, start_x, start_y)
+            while previous_cube[current_id] != -1:
+                local_y, local_x = divmod(current_id, width)
+                segment.append((local_y + start_y - 1) * cols + local_x + start_x - 1)
+                current_id = previous_cube[current_id]
+            segment.reverse()
+            cells.extend(segment)
+        return [(cell % cols, cell // cols) for cell in cells], visited_cubes
+
+    def search(self, start, goal, exact: bool = False):
+        """
+        Finds a path from the start cube to the goal cube on the abstract graph.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            exact: False for the near-optimal refined path, True for an optimal path (bounded A* on the grid).
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        algorithm = "HPA*-Exact" if exact else "HPA*"
+        graph = self.cluster_graph
+        graph.update()
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        cols = self.grid.cols
+        cell_count = self.grid.rows * cols
+        start_id = start[1] * cols + start[0]
+        goal_id = goal[1] * cols + goal[0]
+        if self.grid.occupancy[start_id] or self.grid.occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult(algorithm, None, 0, 0, time.perf_counter() - start_time)
+        if start_id == goal_id:
+            return SearchResult(algorithm, [start], 0, 1, time.perf_counter() - start_time)
+
+        start_edges, visited_cubes = self.connect(start_id, goal_id)
+        goal_edges, reached_cubes = self.connect(goal_id, start_id) # symmetric: distances from the goal
+        visited_cubes += reached_cubes
+
+        # A* on the abstract graph
+        g_score = {start_id: 0}
+        previous_node = {start_id: -1}
+        open_set = [start_id] # entries are f_score * cell_count + node
+        max_queue_size = 1
+        found = False
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, g_score, previous_node)
+        while open_set:
+            if self.observer is not None and not self.observer.step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set))
+            score, current = divmod(heapq.heappop(open_set), cell_count)
+            current_y, current_x = divmod(current, cols)
+            if score > g_score[current] + abs(current_x - goal[0]) + abs(current_y - goal[1]): # outdated entry
+                continue
+            if current == goal_id:
+                found = True
+                break
+
+            if current == start_id:
+                neighbors = list(start_edges.items())
+            else:
+                neighbors = list(graph.edges[graph.cluster_of(current)].get(current, ()))
+                if current in goal_edges:
+                    neighbors.append((goal_id, goal_edges[current]))
+            neighbors.extend((partner, 1) for partner in graph.partners.get(current, ()))
+
+            for neighbor, distance in neighbors:
+                temp_g_score = g_score[current] + distance
+                if neighbor not in g_score or temp_g_score < g_score[neighbor]:
+                    if neighbor not in g_score:
+                        visited_cubes += 1
+                        if self.observer is not None:
+                            self.observer.visit(neighbor % cols, neighbor // cols)
+                    g_score[neighbor] = temp_g_score
+                    previous_node[neighbor] = current
+                    neighbor_y, neighbor_x = divmod(neighbor, cols)
+                    heapq.heappush(open_set, (temp_g_score + abs(neighbor_x - goal[0]) + abs(neighbor_y - goal[1])) * cell_count + neighbor)
+
+        if not found:
+            logging.info("No path found.")
+            return SearchResult(algorithm, None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+        abstract_path = []
+        current = goal_id
+        while current != -1:
+            abstract_path.append(current)
+            current = previous_node[current]
+        abstract_path.reverse()
+        path, reached_cubes = self.refine(abstract_path)
+        visited_cubes += reached_cubes
+
+        if exact:
+            from .indexed import IndexedSearchEngine
+            engine = IndexedSearchEngine(self.grid)
+            engine.memory_tracker = self.memory_tracker
+            bounded = engine.bounded_a_star(start, goal, len(path) - 1)
+            path = bounded.path
+            visited_cubes += bounded.visited_cubes
+            max_queue_size = max(max_queue_size, bounded.max_queue_size)
+        return SearchResult(algorithm, path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
@@ -0,0 +1,261 @@
+import time
+import heapq
+import logging
+from array import array
+from .result import SearchResult
+
+# g-score / rhs of cubes that are not reachable (yet)
+INFINITY = 1 << 30
+
+class IncrementalPlanner:
+    """
+    Lifelong Planning A* (LPA*) that keeps its search state between edits of the grid.
+
+    Every cube has a g-score (its distance as found by the last expansion) and an rhs-value (one step
+    more than the best g-score of its neighbors). Cubes where both differ are inconsistent and are kept
+    in the open_set. The planner listens to the edits of the grid (see GridMap.add_listener) and, on the
+    next plan, only updates the cubes next to the edited ones, so a replan only expands the cubes whose
+    distance actually changed. As long as start and goal stay the same, the previous search is repaired
+    instead of being repeated; a new start or goal (or a resized / loaded grid) starts a new search.
+
+    The planner works on its own copy of the padded occupancy buffer (see GridMap.padded_occupancy),
+    which is kept in sync with the edits. The visited cubes of a result are the cubes expanded by this plan.
+
+    Attributes:
+        grid: The grid to plan on.
+        occupancy: The padded occupancy buffer of the planner.
+        width: The width of the padded occupancy buffer.
+        g_score: An array with the g-score of each cell id.
+        rhs: An array with the rhs-value of each cell id.
+        open_set: A heap of the inconsistent cubes (entries are key * cell_count + cell_id, outdated entries are skipped).
+        start_id: The cell id of the start of the current search.
+        goal_id: The cell id of the goal of the current search.
+        changed_cells: The cell ids edited since the last plan.
+        search_size: The number of cubes expanded by the last new search (repairs are limited to half of it).
+        valid: False if the next plan has to start a new search.
+    """
+    def __init__(self, grid):
+        """
+        Initializes the IncrementalPlanner and registers it as a listener of the grid.
+
+        Args:
+            grid: The GridMap to plan on.
+        """
+        self.grid = grid
+        self.occupancy = None
+        self.width = 0
+        self.g_score = None
+        self.rhs = None
+        self.open_set = []
+        self.start_id = -1
+        self.goal_id = -1
+        self.changed_cells = set()
+        self.search_size = 0
+        self.valid = False
+        grid.add_listener(self)
+
+    def reset(self, start, goal) -> None:
+        """
+        Starts a new search from start to goal, dropping all previous state.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+        """
+        self.occupancy, self.width = self.grid.padded_occupancy()
+        self.g_score = array('i', [INFINITY]) * len(self.occupancy)
+        self.rhs = array('i', [INFINITY]) * len(self.occupancy)
+        self.start_id = (start[1] + 1) * self.width + start[0] + 1
+        self.goal_id = (goal[1] + 1) * self.width + goal[0] + 1
+        self.rhs[self.start_id] = 0
+        self.open_set = [self.key(self.start_id) * len(self.occupancy) + self.start_id]
+        self.changed_cells.clear()
+        self.valid = True
+
+    def key(self, cell_id: int) -> int:
+        """
+        Calculates the priority of a cube: min(g, rhs) + h as primary and min(g, rhs) as secondary key, combined into one integer.
+
+        Args:
+            cell_id: The cell id of the cube.
+
+        Returns:
+            The priority of the cube (lower is expanded first).
+        """
+        score = min(self.g_score[cell_id], self.rhs[cell_id])
+        cell_y, cell_x = divmod(cell_id, self.width)
+        goal_y, goal_x = divmod(self.goal_id, self.width)
+        return (score + abs(cell_x - goal_x) + abs(cell_y - goal_y)) * len(self.occupancy) + score
+
+    def update_vertex(self, cell_id: int) -> None:
+        """
+        Recomputes the rhs-value of a cube from its neighbors and queues the cube if it is inconsistent.
+
+        Args:
+            cell_id: The cell id of the cube.
+        """
+        occupancy, g_score = self.occupancy, self.g_score
+        if cell_id != self.start_id:
+            best = INFINITY
+            for offset in (-1, 1, -self.width, self.width):
+                neighbor_id = cell_id + offset
+                if not occupancy[neighbor_id] and g_score[neighbor_id] + 1 < best:
+                    best = g_score[neighbor_id] + 1
+            self.rhs[cell_id] = best
+        if g_score[cell_id] != self.rhs[cell_id]:
+            heapq.heappush(self.open_set, self.key(cell_id) * len(occupancy) + cell_id)
+
+    def apply_changes(self) -> None:
+        """Updates the cubes around the cells edited since the last plan."""
+        occupancy, width = self.occupancy, self.width
+        for cell_id in self.changed_cells:
+            if occupancy[cell_id]: # new obstacle: cube is unreachable, its neighbors lose a predecessor
+                self.g_score[cell_id] = self.rhs[cell_id] = INFINITY
+                for offset in (-1, 1, -width, width):
+                    if not occupancy[cell_id + offset]:
+                        self.update_vertex(cell_id + offset)
+            else: # removed obstacle: cube may now be reached from its neighbors
+                self.update_vertex(cell_id)
+        self.changed_cells.clear()
+
+    def compute_shortest_path(self, observer=None, max_expansions: int = None):
+        """
+        Expands inconsistent cubes until the goal is consistent and no cube with a lower key is left.
+
+        Args:
+            observer: An optional SearchObserver that is notified about expanded cubes.
+            max_expansions: An optional limit of expanded cubes, the search stops unfinished when it is reached.
+
+        Returns:
+            tuple: The number of expanded cubes, the max size of the open_set and whether the search finished,
+            or None if the observer aborted the search.
+        """
+        occupancy, g_score, rhs, open_set = self.occupancy, self.g_score, self.rhs, self.open_set
+        cell_count, width, goal_id = len(occupancy), self.width, self.goal_id
+        goal_y, goal_x = divmod(goal_id, width)
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        expanded_cubes = 0
+        max_queue_size = len(open_set)
+        while open_set:
+            key, current_id = divmod(open_set[0], cell_count)
+            current_g_score, current_rhs = g_score[current_id], rhs[current_id]
+            score = min(current_g_score, current_rhs)
+            current_y, current_x = divmod(current_id, width)
+            if current_g_score == current_rhs or key != (score + abs(current_x - goal_x) + abs(current_y - goal_y)) * cell_count + score: # outdated entry
+                heapq.heappop(open_set)
+                continue
+            if g_score[goal_id] == rhs[goal_id] and key >= self.key(goal_id):
+                break
+            if max_expansions is not None and expanded_cubes >= max_expansions:
+                return expanded_cubes, max_queue_size, False
+            if observer is not None and not observer.step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set))
+            heapq.heappop(open_set)
+            expanded_cubes += 1
+            if observer is not None:
+                observer.visit(current_x - 1, current_y - 1)
+            if current_g_score > current_rhs: # overconsistent: distance got shorter
+                g_score[current_id] = current_rhs
+                temp_g_score = current_rhs + 1
+                for offset in offsets:
+                    neighbor_id = current_id + offset
+                    if not occupancy[neighbor_id] and temp_g_score < rhs[neighbor_id]:
+                        rhs[neighbor_id] = temp_g_score
+                        if g_score[neighbor_id] != temp_g_score:
+                            neighbor_score = min(g_score[neighbor_id], temp_g_score)
+                            neighbor_y, neighbor_x = divmod(neighbor_id, width)
+                            heapq.heappush(open_set, ((neighbor_score + abs(neighbor_x - goal_x) + abs(neighbor_y - goal_y)) * cell_count + neighbor_score) * cell_count + neighbor_id)
+            else: # underconsistent: distance got longer, reevaluate the cube and its neighbors
+                g_score[current_id] = INFINITY
+                self.update_vertex(current_id)
+                for offset in offsets:
+                    if not occupancy[current_id + offset]:
+                        self.update_vertex(current_id + offset)
+        return expanded_cubes, max_queue_size, True
+
+    def generate_path(self) -> list:
+        """
+        Generates the path by walking from the goal to the neighbor with the lowest g-score until the start is reached.
+
+        Returns:
+            A list of cubes representing the path from start to goal.
+        """
+        occupancy, g_score, width = self.occupancy, self.g_score, self.width
+        cell_ids = [self.goal_id]
+        current_id = self.goal_id
+        while current_id != self.start_id:
+            current_id = min((current_id + offset for offset in (-1, 1, -width, width) if not occupancy[current_id + offset]),
+                             key=g_score.__getitem__)
+            cell_ids.append(current_id)
+        cell_ids.reverse()
+        return [(cell_id % width - 1, cell_id // width - 1) for cell_id in cell_ids] # remove border
+
+    def plan(self, start, goal, observer=None, memory_tracker=None):
+        """
+        Finds the shortest path from start to goal, repairing the previous search if start and goal are unchanged.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            observer: An optional SearchObserver that is notified about expanded cubes.
+            memory_tracker: An optional MemoryTracker the structures of the planner are registered with.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        width = self.grid.cols + 2
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        repair = True
+        if not self.valid or (start_id, goal_id) != (self.start_id, self.goal_id) or start_id in self.changed_cells:
+            self.reset(start, goal)
+            repair = False
+        else:
+            self.apply_changes()
+        if memory_tracker is not None:
+            memory_tracker.track(self.open_set, (self.g_score, self.rhs))
+
+        if self.occupancy[start_id] or self.occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult("LPA*", None, 0, 0, time.perf_counter() - start_time)
+        # a repair that costs more than half of the last new search (e.g. a wall right next to the start) is replaced by a new search
+        outcome = self.compute_shortest_path(observer, self.search_size // 2 + 1 if repair else None)
+        if outcome is not None and not outcome[2]:
+            logging.debug(f"Repair exceeded {self.search_size // 2 + 1} expansions, starting a new search")
+            self.reset(start, goal)
+            repair_expansions, repair_queue_size, _ = outcome
+            outcome = self.compute_shortest_path(observer)
+            if outcome is not None:
+                self.search_size = max(outcome[0], 1)
+                outcome = (outcome[0] + repair_expansions, max(outcome[1], repair_queue_size), True)
+        elif outcome is not None and not repair:
+            self.search_size = max(outcome[0], 1)
+        if outcome is None:
+            self.valid = False # open_set is incomplete after an abort
+            return None
+        expanded_cubes, max_queue_size, _ = outcome
+        if self.g_score[goal_id] >= INFINITY:
+            logging.info("No path found.")
+            return SearchResult("LPA*", None, expanded_cubes, max_queue_size, time.perf_counter() - start_time)
+        return SearchResult("LPA*", self.generate_path(), expanded_cubes, max_queue_size, time.perf_counter() - start_time)
+
+    def cell_changed(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Records an edited cube, which is repaired on the next plan (called by the grid).
+
+        Args:
+            x: The x-coordinate of the changed cube.
+            y: The y-coordinate of the changed cube.
+            traversable: True if the cube became traversable, False if it became an obstacle.
+        """
+        if self.valid:
+            cell_id = (y + 1) * self.width + x + 1
+            self.occupancy[cell_id] = 0 if traversable else 1
+            self.changed_cells.add(cell_id)
+
+    def grid_reset(self) -> None:
+        """Drops the search state after the grid was replaced (called by the grid)."""
+        self.valid = False
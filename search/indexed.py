@@ -0,0 +1,173 @@
+import time
+import logging
+from array import array
+from .engine import SearchEngine
+from .result import SearchResult
+from .openlist import create_open_list
+
+class IndexedSearchEngine(SearchEngine):
+    """
+    A SearchEngine whose A* and Dijkstra work on flat integer cell ids instead of (x, y) tuples.
+
+    The g-scores and predecessors are kept in preallocated arrays indexed by the cell id of the
+    padded occupancy buffer (see GridMap.padded_occupancy), neighbors are found by adding index
+    offsets and the open_set stores plain integers (`score * cell_count + cell_id`). Tuples are
+    only created for the final path (with the "bucket" open list, the entries are kept in an IndexedBucketQueue).
+    All other algorithms are inherited from the SearchEngine.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+    """
+    def generate_index_path(self, previous_cube, goal_id: int, width: int) -> list:
+        """
+        Generates a path of (x, y) tuples from the start to the goal using the array of predecessors.
+
+        Args:
+            previous_cube: An array mapping each cell id to the id it came from (-1 for the start).
+            goal_id: The cell id of the goal.
+            width: The width of the padded occupancy buffer.
+
+        Returns:
+            A list of cubes representing the path from start to goal.
+        """
+        path = []
+        current_id = goal_id
+        while current_id != -1:
+            y, x = divmod(current_id, width)
+            path.append((x - 1, y - 1)) # remove border
+            current_id = previous_cube[current_id]
+        path.reverse() # reverse list for correct order (start to goal)
+        return path
+
+    def _indexed_search(self, algorithm: str, start, goal, use_heuristic: bool, max_f_score: int = None):
+        """
+        Shared implementation of the indexed A* (use_heuristic) and Dijkstra.
+
+        Args:
+            algorithm: The name of the algorithm used for the result.
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            use_heuristic: True for A* (f = g + h), False for Dijkstra (f = g).
+            max_f_score: An optional upper bound of the path length, cubes with a larger f-score are never pushed.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        occupancy, width = self.grid.padded_occupancy()
+        cell_count = len(occupancy)
+        offsets = (-1, 1, -width, width) # left, right, up, down
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        goal_x, goal_y = goal[0] + 1, goal[1] + 1
+        if occupancy[start_id] or occupancy[goal_id]:
+            logging.info("No path found.")
+            return SearchResult(algorithm, None, 0, 0, time.perf_counter() - start_time)
+
+        g_score = array('i', [-1]) * cell_count # -1 == not visited yet
+        previous_cube = array('i', [-1]) * cell_count # -1 == no predecessor
+        g_score[start_id] = 0
+        open_set, push, pop = create_open_list(self.open_list, cell_count) # entries are score * cell_count + cell_id
+        push(open_set, start_id) # score of start is irrelevant
+        visited_cubes = 0 # visited cubes (excluding start)
+        max_queue_size = 1 # track max size of open_set during search
+        observer = self.observer
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, g_score, previous_cube)
+        if self.counters is not None:
+            push, pop, _ = self.counters.instrument(push, pop, None, lambda entry: entry % cell_count, occupancy=occupancy, offsets=offsets)
+        while open_set:
+            if observer is not None and not observer.step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+            score, current_id = divmod(pop(open_set), cell_count)
+            current_g_score = g_score[current_id]
+
+            # goal found
+            if current_id == goal_id:
+                path = self.generate_index_path(previous_cube, goal_id, width)
+                return SearchResult(algorithm, path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+            # skip outdated entries (cube was pushed again with a lower score)
+            if use_heuristic:
+                current_y, current_x = divmod(current_id, width)
+                if score > current_g_score + abs(current_x - goal_x) + abs(current_y - goal_y):
+                    continue
+            elif score > current_g_score:
+                continue
+
+            # process neighbors of current_cube
+            temp_g_score = current_g_score + 1 # all edges have a weight of 1
+            for offset in offsets:
+                neighbor_id = current_id + offset
+                if occupancy[neighbor_id]:
+                    continue
+                neighbor_g_score = g_score[neighbor_id]
+                if neighbor_g_score == -1 or temp_g_score < neighbor_g_score:
+                    if use_heuristic:
+                        neighbor_y, neighbor_x = divmod(neighbor_id, width)
+                        f_score = temp_g_score + abs(neighbor_x - goal_x) + abs(neighbor_y - goal_y)
+                    else:
+                        f_score = temp_g_score
+                    if max_f_score is not None and f_score > max_f_score:
+                        continue
+                    if neighbor_g_score == -1:
+                        visited_cubes += 1
+                    g_score[neighbor_id] = temp_g_score
+                    previous_cube[neighbor_id] = current_id
+                    push(open_set, f_score * cell_count + neighbor_id)
+                    if observer is not None:
+                        neighbor_y, neighbor_x = divmod(neighbor_id, width)
+                        observer.visit(neighbor_x - 1, neighbor_y - 1)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult(algorithm, None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+    def a_star(self, start, goal):
+        """
+        Performs A* on integer cell ids to find the shortest path from the start cube to the goal cube.
+
+        With use_landmarks, the A* of the SearchEngine runs instead (the indexed search uses the Manhattan distance).
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        if self.use_landmarks:
+            return super().a_star(start, goal)
+        return self._indexed_search("A*", start, goal, True)
+
+    def dijkstra(self, start, goal):
+        """
+        Performs Dijkstra's algorithm on integer cell ids to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return self._indexed_search("Dijkstra", start, goal, False)
+
+    def bounded_a_star(self, start, goal, max_length: int):
+        """
+        Performs A* on integer cell ids that never pushes cubes whose f-score exceeds a known upper bound.
+
+        The bound (e.g. the length of a path found by HPA*) keeps the open_set small, the path stays optimal.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            max_length: An upper bound of the length (number of moves) of the shortest path.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        return self._indexed_search("A*", start, goal, True, max_length)
@@ -0,0 +1,225 @@
+import time
+import logging
+from array import array
+from .result import SearchResult
+from .openlist import create_open_list
+
+class JumpPointSearch:
+    """
+    Jump Point Search (JPS) for uniform-cost, 4-connected grids.
+
+    Symmetric paths are pruned by only allowing paths in a canonical order: a horizontal run
+    may only turn at a forced neighbor (an obstacle corner) or the goal, while a vertical run may
+    turn anywhere. A vertical jump therefore stops as soon as a horizontal jump from the current
+    cube finds a jump point. Only jump points are pushed onto the open_set, so far fewer heap
+    operations are needed than with A*, while the returned paths stay optimal.
+
+    The search works on the padded occupancy buffer of the grid (see GridMap.padded_occupancy).
+    The visited cubes of the result are the generated jump points.
+
+    Attributes:
+        grid: The grid to search on.
+        observer: An optional SearchObserver that is notified while searching.
+        memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+        counters: Optional SearchCounters that count the operations of a search.
+        open_list: The open list backend ("heap" or "bucket", see create_open_list).
+    """
+    def __init__(self, grid, observer=None, memory_tracker=None, counters=None, open_list: str = "heap"):
+        """
+        Initializes the JumpPointSearch with a grid and an optional observer.
+
+        Args:
+            grid: The grid to search on.
+            observer: An optional SearchObserver that is notified about generated jump points.
+            memory_tracker: An optional MemoryTracker the structures of a search are registered with.
+            counters: Optional SearchCounters that count the operations of a search.
+            open_list: The open list backend ("heap" or "bucket", see create_open_list).
+        """
+        self.grid = grid
+        self.observer = observer
+        self.memory_tracker = memory_tracker
+        self.counters = counters
+        self.open_list = open_list
+        self.occupancy = None
+        self.width = 0
+        self.goal_id = -1
+
+    def jump_horizontal(self, current_id: int, direction: int) -> int:
+        """
+        Moves horizontally from a cube until a jump point (goal or forced neighbor) or an obstacle is reached.
+
+        Args:
+            current_id: The cell id to start from.
+            direction: -1 to move left, 1 to move right.
+
+        Returns:
+            The cell id of the jump point, or -1 if an obstacle is reached first.
+        """
+        occupancy, width, goal_id = self.occupancy, self.width, self.goal_id
+        while True:
+            current_id += direction
+            if occupancy[current_id]:
+                return -1
+            if current_id == goal_id:
+                return current_id
+            # forced neighbor: cube above/below is free but the one behind it is blocked
+            if (not occupancy[current_id - width] and occupancy[current_id - width - direction]) or \
+                    (not occupancy[current_id + width] and occupancy[current_id + width - direction]):
+                return current_id
+
+    def jump_vertical(self, current_id: int, direction: int) -> int:
+        """
+        Moves vertically from a cube until a jump point or an obstacle is reached.
+
+        A cube is a jump point if it is the goal, has a forced neighbor or if a horizontal
+        jump from it finds a jump point.
+
+        Args:
+            current_id: The cell id to start from.
+            direction: -width to move up, width to move down.
+
+        Returns:
+            The cell id of the jump point, or -1 if an obstacle is reached first.
+        """
+        occupancy, goal_id = self.occupancy, self.goal_id
+        while True:
+            current_id += direction
+            if occupancy[current_id]:
+                return -1
+            if current_id == goal_id:
+                return current_id
+            if (not occupancy[current_id - 1] and occupancy[current_id - 1 - direction]) or \
+                    (not occupancy[current_id + 1] and occupancy[current_id + 1 - direction]):
+                return current_id
+            if self.jump_horizontal(current_id, 1) != -1 or self.jump_horizontal(current_id, -1) != -1:
+                return current_id
+
+    def get_successors(self, current_id: int, parent_id: int):
+        """
+        Gets the jump points reachable from a cube in the directions allowed by the canonical order.
+
+        Args:
+            current_id: The cell id of the current cube.
+            parent_id: The cell id of the previous jump point (-1 for the start).
+
+        Returns:
+            A list of the cell ids of the successor jump points.
+        """
+        width = self.width
+        if parent_id == -1: # start: every direction
+            horizontal, vertical = (-1, 1), (-width, width)
+        elif current_id // width == parent_id // width: # arrived horizontally: keep going or turn
+            horizontal, vertical = (1 if current_id > parent_id else -1,), (-width, width)
+        else: # arrived vertically: keep going or turn
+            horizontal, vertical = (-1, 1), (width if current_id > parent_id else -width,)
+
+        successors = []
+        for direction in horizontal:
+            jump_point = self.jump_horizontal(current_id, direction)
+            if jump_point != -1:
+                successors.append(jump_point)
+        for direction in vertical:
+            jump_point = self.jump_vertical(current_id, direction)
+            if jump_point != -1:
+                successors.append(jump_point)
+        return successors
+
+    def generate_path(self, previous_cube, goal_id: int) -> list:
+        """
+        Generates the full path (every cube) from the start to the goal by connecting the jump points.
+
+        Args:
+            previous_cube: An array mapping each jump point to the previous jump point (-1 for the start).
+            goal_id: The cell id of the goal.
+
+        Returns:
+            A list of cubes representing the path from start to goal.
+        """
+        width = self.width
+        path = []
+        current_id = goal_id
+        while previous_cube[current_id] != -1:
+            parent_id = previous_cube[current_id]
+            if current_id // width == parent_id // width:
+                step = 1 if current_id > parent_id else -1
+            else:
+                step = width if current_id > parent_id else -width
+            while current_id != parent_id: # walk back to the previous jump point
+                y, x = divmod(current_id, width)
+                path.append((x - 1, y - 1)) # remove border
+                current_id -= step
+        y, x = divmod(current_id, width)
+        path.append((x - 1, y - 1))
+        path.reverse() # reverse list for correct order (start to goal)
+        return path
+
+    def search(self, start, goal):
+        """
+        Performs Jump Point Search to find the shortest path from the start cube to the goal cube.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the search, or None if the observer aborted the search.
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        self.occupancy, self.width = self.grid.padded_occupancy()
+        width = self.width
+        cell_count = len(self.occupancy)
+        start_id = (start[1] + 1) * width + start[0] + 1
+        self.goal_id = (goal[1] + 1) * width + goal[0] + 1
+        goal_y, goal_x = divmod(self.goal_id, width)
+        if self.occupancy[start_id] or self.occupancy[self.goal_id]:
+            logging.info("No path found.")
+            return SearchResult("JPS", None, 0, 0, time.perf_counter() - start_time)
+
+        g_score = array('i', [-1]) * cell_count # -1 == not generated yet
+        previous_cube = array('i', [-1]) * cell_count # -1 == no previous jump point
+        g_score[start_id] = 0
+        open_set, push, pop = create_open_list(self.open_list, cell_count) # entries are f_score * cell_count + cell_id
+        push(open_set, start_id)
+        visited_cubes = 0 # generated jump points (excluding start)
+        max_queue_size = 1 # track max size of open_set during search
+        observer = self.observer
+        if self.memory_tracker is not None:
+            self.memory_tracker.track(open_set, g_score, previous_cube)
+        get_successors = self.get_successors
+        if self.counters is not None:
+            push, pop, get_successors = self.counters.instrument(push, pop, get_successors, lambda entry: entry % cell_count,
+                                                                 expanded_cell=lambda current_id, parent_id: current_id)
+        while open_set:
+            if observer is not None and not observer.step():
+                return None
+
+            max_queue_size = max(max_queue_size, len(open_set)) # update max queue size
+            f_score, current_id = divmod(pop(open_set), cell_count)
+            current_g_score = g_score[current_id]
+
+            # goal found
+            if current_id == self.goal_id:
+                path = self.generate_path(previous_cube, current_id)
+                return SearchResult("JPS", path, visited_cubes, max_queue_size, time.perf_counter() - start_time)
+
+            # skip outdated entries (jump point was pushed again with a lower score)
+            current_y, current_x = divmod(current_id, width)
+            if f_score > current_g_score + abs(current_x - goal_x) + abs(current_y - goal_y):
+                continue
+
+            for jump_point in get_successors(current_id, previous_cube[current_id]):
+                jump_y, jump_x = divmod(jump_point, width)
+                temp_g_score = current_g_score + abs(jump_x - current_x) + abs(jump_y - current_y) # distance along a straight line
+                jump_g_score = g_score[jump_point]
+                if jump_g_score == -1 or temp_g_score < jump_g_score:
+                    if jump_g_score == -1:
+                        visited_cubes += 1
+                    g_score[jump_point] = temp_g_score
+                    previous_cube[jump_point] = current_id
+                    push(open_set, (temp_g_score + abs(jump_x - goal_x) + abs(jump_y - goal_y)) * cell_count + jump_point)
+                    if observer is not None:
+                        observer.visit(jump_x - 1, jump_y - 1)
+
+        # if no path to goal is found
+        logging.info("No path found.")
+        return SearchResult("JPS", None, visited_cubes, max_queue_size, time.perf_counter() - start_time)
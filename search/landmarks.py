@@ -0,0 +1,322 @@
+import os
+import zlib
+import struct
+import time
+import logging
+import argparse
+from array import array
+from .wavefront import wavefront_distances, prefers_wavefront
+
+# header: magic, version, rows, cols, landmark count, typecode of the tables, content hash of the grid, crc32 of the data
+HEADER = struct.Struct("<5sBIIIc16sI")
+MAGIC = b"PFALT"
+VERSION = 1
+LANDMARK_EXTENSION = ".alt"
+# number of landmarks per map and number of landmarks used per query (the best ones for its start and goal)
+LANDMARK_COUNT = 8
+ACTIVE_LANDMARKS = 4
+# distance of cubes that are not reachable from a landmark (the largest value of the table type)
+UNREACHABLE = {"H": 0xFFFF, "I": 0xFFFFFFFF}
+
+def landmark_filename(map_file: str) -> str:
+    """
+    Returns the filename of the landmark tables for a map file (e.g. maps/a.txt -> maps/a.txt.alt).
+
+    Args:
+        map_file: The path to the map file.
+
+    Returns:
+        The path to the landmark tables.
+    """
+    return map_file + LANDMARK_EXTENSION
+
+def distance_sweep(occupancy, width: int, source_id: int) -> array:
+    """
+    Calculates the distances from a cube to all cubes with a breadth-first sweep over the whole map.
+
+    Args:
+        occupancy: The padded occupancy buffer (see GridMap.padded_occupancy).
+        width: The width of the padded occupancy buffer.
+        source_id: The cell id of the source cube.
+
+    Returns:
+        array: The distance of each cell id (type 'I'), UNREACHABLE["I"] for obstacles and unreachable cubes.
+    """
+    unreachable = UNREACHABLE["I"]
+    offsets = (-1, 1, -width, width) # left, right, up, down
+    distances = array('I', [unreachable]) * len(occupancy)
+    distances[source_id] = 0
+    frontier = [source_id]
+    distance = 0
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for cell_id in frontier:
+            for offset in offsets:
+                neighbor_id = cell_id + offset
+                if not occupancy[neighbor_id] and distances[neighbor_id] == unreachable:
+                    distances[neighbor_id] = distance
+                    next_frontier.append(neighbor_id)
+        frontier = next_frontier
+    return distances
+
+class LandmarkTable:
+    """
+    The distance tables of the ALT heuristic (A*, landmarks, triangle inequality) of a grid.
+
+    For a landmark L and every cube n, the table stores the distance d(L, n). By the triangle inequality,
+    |d(L, goal) - d(L, n)| is a lower bound of d(n, goal), so the maximum over the landmarks (and the Manhattan
+    distance) is an admissible and consistent heuristic that knows the walls of the map.
+
+    The landmarks are chosen farthest-first: the first one is the cube farthest from the start (or the first
+    free cube), each next one the cube farthest from all chosen landmarks. The sweeps of the landmarks are
+    bitset wavefronts on open maps and breadth-first sweeps on mazes (see prefers_wavefront). The tables store uint16 distances
+    (uint32 on maps with longer distances) per cell id of the padded occupancy buffer. They are saved next to
+    the map file (`<map>.alt`) with the content hash of the grid and reused as long as the grid is unchanged.
+
+    The table listens to the edits of the grid (see GridMap.add_listener). An edit marks all tables as stale, but
+    they are rebuilt lazily: every query first rebuilds one stale table (a single sweep, cheaper than a search) and
+    only uses the tables that are up to date, with the Manhattan distance as the bound until the first one is
+    rebuilt. So no query after an edit pays the whole preprocessing, and the heuristic is back to full strength
+    after LANDMARK_COUNT queries. A landmark that became an obstacle is dropped. Replacing the whole grid (e.g.
+    loading a map) loads or builds all tables again.
+
+    Attributes:
+        grid: The GridMap of the tables.
+        landmarks: The cell ids of the landmarks.
+        tables: One distance array per landmark.
+        stale: The indices of the landmarks whose tables are out of date after edits of the grid.
+        use_wavefront: True if the sweeps of the map are bitset wavefronts (see prefers_wavefront).
+        valid: False if the tables have to be loaded or built before the next query.
+        edited: True if the grid was edited since it was loaded (the tables are then not saved).
+    """
+    def __init__(self, grid):
+        """
+        Initializes the LandmarkTable and registers it as a listener of the grid.
+
+        Args:
+            grid: The GridMap to build the tables for.
+        """
+        self.grid = grid
+        self.landmarks = []
+        self.tables = []
+        self.stale = set()
+        self.use_wavefront = False
+        self.valid = False
+        self.edited = False
+        grid.add_listener(self)
+
+    def build(self, count: int = LANDMARK_COUNT) -> None:
+        """
+        Chooses the landmarks and runs one distance sweep per landmark.
+
+        Args:
+            count: The number of landmarks.
+        """
+        occupancy, width = self.grid.padded_occupancy()
+        start = self.grid.start_cube
+        seed_id = (start[1] + 1) * width + start[0] + 1 if start and not occupancy[(start[1] + 1) * width + start[0] + 1] else occupancy.find(0)
+        self.landmarks, self.tables = [], []
+        self.stale = set()
+        if seed_id == -1: # no free cube
+            self.valid = True
+            return
+        unreachable = UNREACHABLE["I"]
+        distances = distance_sweep(occupancy, width, seed_id)
+        closest = [distance if distance != unreachable else 0 for distance in distances] # distance to the closest landmark (0 == unreachable)
+        # a landmark is at most twice as far from any cube as the seed (triangle inequality)
+        self.use_wavefront = prefers_wavefront(2 * max(closest) + 1, len(occupancy), len(distances) - distances.count(unreachable))
+        for _ in range(count):
+            landmark_id = max(range(len(closest)), key=closest.__getitem__)
+            if self.landmarks and closest[landmark_id] == 0: # every reachable cube is a landmark
+                break
+            distances = self.sweep(occupancy, width, landmark_id)
+            closest = list(map(min, closest, distances)) if self.landmarks else [distance if distance != unreachable else 0 for distance in distances]
+            self.landmarks.append(landmark_id)
+            self.tables.append(distances)
+
+        longest = max((distance for table in self.tables for distance in table if distance != unreachable), default=0)
+        if longest < UNREACHABLE["H"]: # uint16 is enough
+            self.tables = [array('H', (min(distance, UNREACHABLE["H"]) for distance in table)) for table in self.tables]
+        self.valid = True
+
+    def sweep(self, occupancy, width: int, landmark_id: int) -> array:
+        """
+        Calculates the distances from a landmark with the sweep that is faster on this map.
+
+        Args:
+            occupancy: The padded occupancy buffer.
+            width: The width of the padded occupancy buffer.
+            landmark_id: The cell id of the landmark.
+
+        Returns:
+            array: The distance of each cell id (type 'I', see distance_sweep).
+        """
+        if self.use_wavefront:
+            return wavefront_distances(occupancy, width, (landmark_id,))[0]
+        return distance_sweep(occupancy, width, landmark_id)
+
+    def refresh(self) -> None:
+        """Rebuilds the table of one stale landmark (or drops the landmark if it became an obstacle)."""
+        index = min(self.stale)
+        self.stale.discard(index)
+        occupancy, width = self.grid.padded_occupancy()
+        landmark_id = self.landmarks[index]
+        if occupancy[landmark_id]:
+            del self.landmarks[index], self.tables[index]
+            self.stale = {stale if stale < index else stale - 1 for stale in self.stale}
+            return
+        distances = self.sweep(occupancy, width, landmark_id)
+        if self.tables[index].typecode == "H" and max((d for d in distances if d != UNREACHABLE["I"]), default=0) < UNREACHABLE["H"]:
+            distances = array('H', (min(distance, UNREACHABLE["H"]) for distance in distances))
+        self.tables[index] = distances
+
+    def save(self, filename: str) -> None:
+        """
+        Saves the landmarks and tables with the content hash of the grid. Errors (e.g. a read-only directory) are only logged.
+
+        Args:
+            filename: The path to the landmark file.
+        """
+        typecode = self.tables[0].typecode if self.tables else "H"
+        data = array('i', self.landmarks).tobytes() + b"".join(table.tobytes() for table in self.tables)
+        header = HEADER.pack(MAGIC, VERSION, self.grid.rows, self.grid.cols, len(self.landmarks), typecode.encode("ascii"),
+                             self.grid.content_hash(), zlib.crc32(data))
+        temp_file = f"{filename}.{os.getpid()}.tmp" # unique per process (batch workers may build the same map)
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(temp_file, filename) # replace in one step so readers never see a partial file
+            logging.debug(f"Landmark tables saved under: {filename}")
+        except OSError as error:
+            logging.debug(f"Could not write landmark tables {filename}: {error}")
+
+    def load(self, filename: str) -> bool:
+        """
+        Loads the landmarks and tables if the file exists and was built for the current content of the grid.
+
+        Args:
+            filename: The path to the landmark file.
+
+        Returns:
+            True if the tables were loaded, False if the file is missing, stale or corrupt.
+        """
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        if len(data) < HEADER.size:
+            return False
+        magic, version, rows, cols, count, typecode, content_hash, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or content_hash != self.grid.content_hash():
+            return False
+        typecode = typecode.decode("ascii")
+        cell_count = (rows + 2) * (cols + 2)
+        body = memoryview(data)[HEADER.size:]
+        table_size = cell_count * array(typecode).itemsize
+        if typecode not in UNREACHABLE or len(body) != count * 4 + count * table_size or zlib.crc32(body) != checksum:
+            logging.warning(f"Landmark tables {filename} are corrupt -> rebuild them.")
+            return False
+        landmarks = array('i')
+        landmarks.frombytes(body[:count * 4])
+        self.landmarks = landmarks.tolist()
+        self.stale = set()
+        self.tables = []
+        for i in range(count):
+            table = array(typecode)
+            table.frombytes(body[count * 4 + i * table_size:count * 4 + (i + 1) * table_size])
+            self.tables.append(table)
+        self.valid = True
+        return True
+
+    def ensure(self) -> None:
+        """Loads the tables of the map file or builds (and saves) them if the tables are not valid."""
+        if self.valid:
+            return
+        map_path = self.grid.map_path
+        if map_path is not None and self.load(landmark_filename(map_path)):
+            logging.debug(f"Loaded landmark tables of {map_path}")
+            return
+        start_time = time.perf_counter()
+        self.build()
+        logging.info(f"Built {len(self.landmarks)} landmark tables in {time.perf_counter() - start_time:.2f} s")
+        if map_path is not None and not self.edited:
+            self.save(landmark_filename(map_path))
+
+    def heuristic(self, start, goal):
+        """
+        Creates the ALT heuristic for a query, using the ACTIVE_LANDMARKS landmarks with the best bound between start and goal.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            A function (cube, goal_cube) -> lower bound of the distance from cube to the goal, like SearchEngine.heuristic.
+        """
+        self.ensure()
+        if self.stale:
+            self.refresh()
+        width = self.grid.cols + 2
+        start_id = (start[1] + 1) * width + start[0] + 1
+        goal_id = (goal[1] + 1) * width + goal[0] + 1
+        goal_x, goal_y = goal
+        # landmarks that reach the goal, the ones with the best bound for the start first
+        candidates = [(table, table[goal_id]) for index, table in enumerate(self.tables)
+                      if index not in self.stale and table[goal_id] != UNREACHABLE[table.typecode]]
+        candidates.sort(key=lambda candidate: abs(candidate[0][start_id] - candidate[1]), reverse=True)
+        active = tuple(candidates[:ACTIVE_LANDMARKS])
+
+        def landmark_heuristic(cube, goal_cube):
+            cell_id = (cube[1] + 1) * width + cube[0] + 1
+            bound = abs(cube[0] - goal_x) + abs(cube[1] - goal_y)
+            for table, goal_distance in active:
+                difference = table[cell_id] - goal_distance
+                if difference > bound:
+                    bound = difference
+                elif -difference > bound:
+                    bound = -difference
+            return bound
+
+        return landmark_heuristic
+
+    def cell_changed(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Marks all tables as stale after a cube of the grid was changed (called by the grid).
+
+        Args:
+            x: The x-coordinate of the changed cube.
+            y: The y-coordinate of the changed cube.
+            traversable: True if the cube became traversable, False if it became an obstacle.
+        """
+        self.stale = set(range(len(self.landmarks)))
+        self.edited = True
+
+    def grid_reset(self) -> None:
+        """Invalidates the tables after the whole grid was replaced (called by the grid)."""
+        self.valid = False
+        self.edited = False
+
+def main() -> None:
+    """Main function to parse the command line arguments and build the landmark tables of the maps."""
+    from .gridmap import GridMap
+    from .batch import collect_map_files
+    parser = argparse.ArgumentParser(description="Build the ALT landmark tables of maps (saved next to the maps).")
+    parser.add_argument("--maps", nargs="+", default=["maps"], help="map files and/or directories (default: maps)")
+    parser.add_argument("--force", action="store_true", help="rebuild tables that are up to date")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    for map_file in collect_map_files(args.maps):
+        grid_map = GridMap.load(map_file)
+        table = grid_map.landmark_table()
+        if args.force or not table.load(landmark_filename(map_file)):
+            table.build()
+            table.save(landmark_filename(map_file))
+        print(f"{map_file}: {len(table.landmarks)} landmarks ({table.tables[0].typecode if table.tables else '-'})")
+
+if __name__ == "__main__":
+    main()
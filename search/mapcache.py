@@ -0,0 +1,83 @@
+import os
+import mmap
+import struct
+import zlib
+import logging
+
+# header: magic, version, rows, cols, start_x, start_y, goal_x, goal_y, source size, source mtime (ns), crc32 of the cells
+HEADER = struct.Struct("<5sBIIiiiiqqI")
+MAGIC = b"PFMAP"
+VERSION = 2 # 2: one byte per cell (1: bit-packed)
+CACHE_EXTENSION = ".bin"
+
+def cache_filename(map_file: str) -> str:
+    """
+    Returns the filename of the binary sidecar for a map file (e.g. maps/a.txt -> maps/a.txt.bin).
+
+    Args:
+        map_file: The path to the map file.
+
+    Returns:
+        The path to the binary sidecar.
+    """
+    return map_file + CACHE_EXTENSION # keep the extension, so a.txt and a.map get their own sidecar
+
+def write_map_cache(grid_map, map_file: str) -> None:
+    """
+    Writes the binary sidecar of a loaded map file. Errors (e.g. a read-only directory) are only logged.
+
+    Args:
+        grid_map: The GridMap that was loaded from map_file.
+        map_file: The path to the map file.
+    """
+    source = os.stat(map_file)
+    start_x, start_y = grid_map.start_cube if grid_map.start_cube else (-1, -1)
+    goal_x, goal_y = grid_map.goal_cube if grid_map.goal_cube else (-1, -1)
+    header = HEADER.pack(MAGIC, VERSION, grid_map.rows, grid_map.cols, start_x, start_y, goal_x, goal_y,
+                         source.st_size, source.st_mtime_ns, zlib.crc32(grid_map.occupancy))
+
+    cache_file = cache_filename(map_file)
+    temp_file = f"{cache_file}.{os.getpid()}.tmp" # unique per process (batch workers may load the same map)
+    try:
+        with open(temp_file, "wb") as f:
+            f.write(header)
+            f.write(grid_map.occupancy) # one byte per cell, so a reader can copy the occupancy straight from the mapping
+        os.replace(temp_file, cache_file) # replace in one step so readers never see a partial file
+        logging.debug(f"Map cache saved under: {cache_file}")
+    except OSError as error:
+        logging.debug(f"Could not write map cache {cache_file}: {error}")
+
+def read_map_cache(grid_map, map_file: str) -> bool:
+    """
+    Loads a map from its binary sidecar (memory-mapped) if it exists and matches the map file.
+
+    Args:
+        grid_map: The GridMap to load the map into.
+        map_file: The path to the map file.
+
+    Returns:
+        True if the map was loaded from the sidecar, False if the sidecar is missing, stale or corrupt.
+    """
+    cache_file = cache_filename(map_file)
+    try:
+        source = os.stat(map_file)
+        with open(cache_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if len(data) < HEADER.size:
+                return False
+            magic, version, rows, cols, start_x, start_y, goal_x, goal_y, size, mtime_ns, checksum = HEADER.unpack_from(data)
+            if magic != MAGIC or version != VERSION or size != source.st_size or mtime_ns != source.st_mtime_ns:
+                return False
+            with memoryview(data)[HEADER.size:] as cells:
+                if len(cells) != rows * cols or zlib.crc32(cells) != checksum:
+                    logging.warning(f"Map cache {cache_file} is corrupt -> reload map file.")
+                    return False
+                occupancy = bytearray(cells) # a single copy out of the mapping
+    except (OSError, ValueError):
+        return False
+
+    grid_map.rows = rows
+    grid_map.cols = cols
+    grid_map.occupancy = occupancy
+    grid_map.start_cube = (start_x, start_y) if start_x >= 0 else None
+    grid_map.goal_cube = (goal_x, goal_y) if goal_x >= 0 else None
+    return True
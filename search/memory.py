@@ -0,0 +1,212 @@
+import sys
+import struct
+from array import array
+from collections import deque
+from itertools import islice
+from .openlist import BucketQueue
+
+POINTER_SIZE = struct.calcsize("P")
+# slots per block of a deque (CPython), each block also stores two links
+DEQUE_BLOCK_SLOTS = 64
+# number of elements per container whose size is measured, the rest is extrapolated
+SAMPLE_SIZE = 32
+
+def owned_bytes(obj, owns_cubes: bool = False) -> int:
+    """
+    Calculates the bytes of an object stored in a search structure that are not shared with other structures.
+
+    Small integers (-5 to 256) are cached by the interpreter and never count. Cubes (tuples of integers) are
+    owned by the closed set, so they only count with owns_cubes; the cube inside a heap entry never counts.
+
+    Args:
+        obj: The stored object (a cube, a heap entry or an integer).
+        owns_cubes: True if the structure owns the cubes it stores.
+
+    Returns:
+        The number of bytes.
+    """
+    if type(obj) is int:
+        return 0 if -5 <= obj <= 256 else sys.getsizeof(obj)
+    if type(obj) is tuple:
+        if not owns_cubes and all(type(item) is int for item in obj): # cube
+            return 0
+        return sys.getsizeof(obj) + sum(owned_bytes(item) for item in obj if type(item) is not tuple)
+    return sys.getsizeof(obj)
+
+def sampled_bytes(elements, count: int, owns_cubes: bool = False) -> int:
+    """
+    Estimates the bytes owned by the elements of a container from the first SAMPLE_SIZE elements.
+
+    Args:
+        elements: An iterable over the elements.
+        count: The number of elements.
+        owns_cubes: True if the container owns the cubes it stores.
+
+    Returns:
+        The estimated number of bytes.
+    """
+    sample = list(islice(elements, SAMPLE_SIZE))
+    if not sample:
+        return 0
+    return sum(owned_bytes(element, owns_cubes) for element in sample) * count // len(sample)
+
+def structure_bytes(container, owns_cubes: bool = False) -> int:
+    """
+    Calculates the bytes of a closed set or parent map: the container itself plus the elements it owns.
+
+    Arrays store their elements inline and sets own their cubes. Dictionaries own their values; their keys
+    are the cubes of the closed set (or cell ids, which they own). Parent maps are passed with owns_cubes=False
+    and only store references to cubes of the closed set, so only their table counts.
+
+    Args:
+        container: The array, set or dictionary.
+        owns_cubes: True if the elements (set) or keys and values (dictionary) are owned by the container.
+
+    Returns:
+        The number of bytes.
+    """
+    size = sys.getsizeof(container)
+    if not owns_cubes or isinstance(container, array):
+        return size
+    if isinstance(container, dict):
+        return size + sampled_bytes((value for item in container.items() for value in item), 2 * len(container))
+    return size + sampled_bytes(iter(container), len(container), True)
+
+def empty_open_list_bytes(open_list) -> int:
+    """
+    Calculates the bytes of an open list without its entries.
+
+    The buckets of a BucketQueue are never removed, so their final number is their peak.
+
+    Args:
+        open_list: The queue, stack, heap, BucketQueue or array of cell ids.
+
+    Returns:
+        The number of bytes.
+    """
+    if isinstance(open_list, BucketQueue):
+        return sys.getsizeof(open_list) + sys.getsizeof(open_list.buckets) + len(open_list.buckets) * sys.getsizeof([])
+    if isinstance(open_list, array):
+        return sys.getsizeof(array(open_list.typecode))
+    return sys.getsizeof(type(open_list)())
+
+class MemoryProfile:
+    """
+    The peak memory in bytes held by the data structures of one search.
+
+    Attributes:
+        open_list: The bytes of the open list (queue, stack or heap) at its largest size.
+        closed_set: The bytes of the visited cubes and their g-scores.
+        parent_map: The bytes of the predecessors of the visited cubes.
+        path: The bytes of the returned path.
+    """
+    def __init__(self, open_list: int = 0, closed_set: int = 0, parent_map: int = 0, path: int = 0):
+        """
+        Initializes the MemoryProfile.
+
+        Args:
+            open_list: The bytes of the open list at its largest size.
+            closed_set: The bytes of the visited cubes and their g-scores.
+            parent_map: The bytes of the predecessors of the visited cubes.
+            path: The bytes of the returned path.
+        """
+        self.open_list = open_list
+        self.closed_set = closed_set
+        self.parent_map = parent_map
+        self.path = path
+
+    @property
+    def total(self) -> int:
+        """The total bytes of all structures (they are all alive when the open list peaks)."""
+        return self.open_list + self.closed_set + self.parent_map + self.path
+
+    def __repr__(self) -> str:
+        return (f"MemoryProfile(open_list={self.open_list}, closed_set={self.closed_set}, parent_map={self.parent_map}, "
+                f"path={self.path}, total={self.total})")
+
+class MemoryTracker:
+    """
+    Accounts the peak memory of a search from its data structures instead of tracing every allocation.
+
+    A search registers its structures once with track, nothing is measured while it runs. Afterwards, outside
+    of the measured runtime, measure sizes the containers with sys.getsizeof and adds the bytes of the objects
+    they own (extrapolated from a small sample). The closed set and the parent map only grow, so their final
+    size is their peak. The open list shrinks again, so its peak is calculated from the max queue size of the
+    result and the size of its entries. The cost is independent of the size of the search.
+
+    Attributes:
+        structures: The registered (open lists, closed sets, parent maps) of the current search.
+        seed_entries: The entries the open lists held when they were registered (used when they are empty at the end).
+    """
+    def __init__(self):
+        """Initializes the MemoryTracker without structures."""
+        self.structures = []
+        self.seed_entries = []
+
+    def reset(self) -> None:
+        """Forgets the structures of the previous search."""
+        self.structures = []
+        self.seed_entries = []
+
+    def track(self, open_list, closed_set, parent_map=()) -> None:
+        """
+        Registers the structures of a search (a search with several phases calls it once per phase).
+
+        Args:
+            open_list: The open list, or a tuple of open lists (e.g. both directions of a bidirectional search).
+            closed_set: The visited cubes / g-scores, or a tuple of them.
+            parent_map: The predecessors, or a tuple of them.
+        """
+        self.structures.append(tuple(structure if isinstance(structure, tuple) else (structure,)
+                                     for structure in (open_list, closed_set, parent_map)))
+        for open_list in self.structures[-1][0]:
+            if not isinstance(open_list, array): # the start entries have the shape of all later entries
+                self.seed_entries.extend(islice(open_list, SAMPLE_SIZE))
+
+    def open_list_bytes(self, max_queue_size: int) -> int:
+        """
+        Calculates the bytes of the open lists with max_queue_size entries.
+
+        The size of an entry is sampled from the entries left in the open lists, or from the entries they were
+        seeded with if the search emptied them (failed searches and goals popped last).
+
+        Args:
+            max_queue_size: The max size of the open lists during the search.
+
+        Returns:
+            The number of bytes.
+        """
+        open_lists = [open_list for open_lists, _, _ in self.structures for open_list in open_lists]
+        if not open_lists:
+            return 0
+        size = sum(empty_open_list_bytes(open_list) for open_list in open_lists) # empty containers
+        if isinstance(open_lists[0], array): # entries are stored inline
+            return size + max_queue_size * open_lists[0].itemsize
+        if isinstance(open_lists[0], deque):
+            size += -(-max_queue_size // DEQUE_BLOCK_SLOTS) * (DEQUE_BLOCK_SLOTS + 2) * POINTER_SIZE
+        else:
+            size += max_queue_size * POINTER_SIZE
+        entries = [entry for open_list in open_lists for entry in islice(open_list, SAMPLE_SIZE)]
+        if entries:
+            size += sum(owned_bytes(entry) for entry in entries) * max_queue_size // len(entries)
+        elif self.seed_entries: # encoded int entries (score * cell_count + cell_id) outgrow the small int cache of the start entry
+            size += sum(sys.getsizeof(entry) if type(entry) is int else owned_bytes(entry)
+                        for entry in self.seed_entries) * max_queue_size // len(self.seed_entries)
+        return size
+
+    def measure(self, result):
+        """
+        Calculates the memory profile of the tracked structures and the result of a search.
+
+        Args:
+            result: The SearchResult of the search.
+
+        Returns:
+            MemoryProfile: The peak bytes per structure.
+        """
+        closed_set = sum(structure_bytes(container, True) for _, closed_sets, _ in self.structures for container in closed_sets)
+        parent_map = sum(structure_bytes(container) for _, _, parent_maps in self.structures for container in parent_maps)
+        path = sys.getsizeof(result.path) + sampled_bytes(iter(result.path), len(result.path), True) if result.path else 0
+        profile = MemoryProfile(self.open_list_bytes(result.max_queue_size), closed_set, parent_map, path)
+        self.reset()
+        return profile
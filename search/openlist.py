@@ -0,0 +1,131 @@
+import heapq
+
+# names of the open list backends (see create_open_list)
+OPEN_LISTS = ("heap", "bucket")
+
+class BucketQueue:
+    """
+    A bucket queue (Dial) for open lists whose scores are small non-negative integers.
+
+    All edges of the grid have a weight of 1 and the Manhattan distance is an integer, so the f-, g- and h-scores
+    of the searches are integers bounded by the size of the map. An entry with score s is appended to bucket s
+    and pop takes an entry of the lowest non-empty bucket, so push and pop cost O(1) instead of O(log n).
+
+    Ties inside a bucket are broken LIFO: the entry pushed last is taken first. For A* this prefers the cube with
+    the largest g-score (closest to the goal) among the cubes with the same f-score. A cursor points to the lowest
+    bucket that may be non-empty; it moves back when a smaller score is pushed (e.g. the h-scores of Greedy-BeFs).
+
+    Entries are (score, cube) tuples like the entries of the heap, so the searches use both the same way.
+
+    Attributes:
+        buckets: A list of lists, bucket s holds the entries with score s.
+        cursor: The index of the lowest bucket that may be non-empty.
+        size: The number of entries.
+    """
+    __slots__ = ("buckets", "cursor", "size")
+
+    def __init__(self):
+        """Initializes an empty BucketQueue."""
+        self.buckets = []
+        self.cursor = 0
+        self.size = 0
+
+    def push(self, entry) -> None:
+        """
+        Adds an entry to the bucket of its score.
+
+        Args:
+            entry: A (score, cube) tuple.
+        """
+        score = entry[0]
+        buckets = self.buckets
+        if score >= len(buckets):
+            buckets.extend([] for _ in range(score + 1 - len(buckets)))
+        buckets[score].append(entry)
+        if score < self.cursor:
+            self.cursor = score
+        self.size += 1
+
+    def pop(self):
+        """
+        Removes and returns the entry pushed last among the entries with the lowest score.
+
+        Returns:
+            The entry.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        buckets = self.buckets
+        cursor = self.cursor
+        while not buckets[cursor]: # raises IndexError behind the last bucket
+            cursor += 1
+        self.cursor = cursor
+        self.size -= 1
+        return buckets[cursor].pop()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return (entry for bucket in self.buckets for entry in bucket)
+
+class IndexedBucketQueue(BucketQueue):
+    """
+    A BucketQueue for the integer entries (`score * scale + cell_id`) of the IndexedSearchEngine.
+
+    Attributes:
+        scale: The number of cells of the padded occupancy buffer (the factor of the score).
+    """
+    __slots__ = ("scale",)
+
+    def __init__(self, scale: int):
+        """
+        Initializes an empty IndexedBucketQueue.
+
+        Args:
+            scale: The number of cells of the padded occupancy buffer.
+        """
+        super().__init__()
+        self.scale = scale
+
+    def push(self, entry: int) -> None:
+        """
+        Adds an entry to the bucket of its score.
+
+        Args:
+            entry: An integer `score * scale + cell_id`.
+        """
+        score = entry // self.scale
+        buckets = self.buckets
+        if score >= len(buckets):
+            buckets.extend([] for _ in range(score + 1 - len(buckets)))
+        buckets[score].append(entry)
+        if score < self.cursor:
+            self.cursor = score
+        self.size += 1
+
+def create_open_list(kind: str = "heap", scale: int = None) -> tuple:
+    """
+    Creates an empty open list and its push and pop functions.
+
+    The functions take the open list as first argument (like heapq.heappush and heapq.heappop), so a search
+    binds them once and calls them the same way for every backend. The heap keeps the plain list with the
+    functions of heapq, so it costs nothing compared to using heapq directly.
+
+    Args:
+        kind: The backend, "heap" (binary heap, O(log n)) or "bucket" (BucketQueue, O(1) for integer scores).
+        scale: For integer entries (`score * scale + cell_id`) the factor of the score, None for (score, cube) tuples.
+
+    Returns:
+        tuple: The open list, its push function and its pop function.
+
+    Raises:
+        ValueError: If the backend is unknown.
+    """
+    if kind == "heap":
+        return [], heapq.heappush, heapq.heappop
+    if kind == "bucket":
+        open_list = BucketQueue() if scale is None else IndexedBucketQueue(scale)
+        return open_list, type(open_list).push, type(open_list).pop
+    raise ValueError(f"Unknown open list: {kind}")
@@ -0,0 +1,392 @@
+import os
+import zlib
+import struct
+import time
+import random
+import logging
+import argparse
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from .result import SearchResult
+
+# header: magic, version, rows, cols, content hash of the grid, number of runs, crc32 of the data
+HEADER = struct.Struct("<5sBII16sII")
+MAGIC = b"PFCPD"
+VERSION = 1
+PATH_DATABASE_EXTENSION = ".cpd"
+# the moves of the first-move tables (left, right, up, down), bit i of a move set stands for MOVES[i]
+MOVES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+# the move of each non-empty move set of a run (its lowest bit)
+RUN_MOVE = tuple((move_set & -move_set).bit_length() - 1 for move_set in range(16))
+# a run is stored as `first_target * RUN_SCALE + move`
+RUN_SCALE = 8
+# source rows per job of a parallel build
+ROWS_PER_JOB = 8
+
+def path_database_filename(map_file: str) -> str:
+    """
+    Returns the filename of the path database for a map file (e.g. maps/a.txt -> maps/a.txt.cpd).
+
+    Args:
+        map_file: The path to the map file.
+
+    Returns:
+        The path to the path database.
+    """
+    return map_file + PATH_DATABASE_EXTENSION
+
+def first_move_sets(occupancy, width: int, source_id: int) -> bytearray:
+    """
+    Calculates the optimal first moves from a cube to all cubes with a breadth-first sweep over the whole map.
+
+    A cube reached in distance d + 1 from cubes in distance d gets the union of their move sets, so the set
+    holds every first move of a shortest path (the freedom is used to get longer runs, see compress_moves).
+
+    Args:
+        occupancy: The padded occupancy buffer (see GridMap.padded_occupancy).
+        width: The width of the padded occupancy buffer.
+        source_id: The cell id of the source cube.
+
+    Returns:
+        bytearray: The move set (bit i == MOVES[i]) of each cell id, 0 for the source, obstacles and unreachable cubes.
+    """
+    offsets = (-1, 1, -width, width) # same order as MOVES
+    move_sets = bytearray(len(occupancy))
+    level = array('i', [-1]) * len(occupancy) # the distance of the cubes that were reached
+    level[source_id] = 0
+    frontier = []
+    for move, offset in enumerate(offsets):
+        neighbor_id = source_id + offset
+        if not occupancy[neighbor_id]:
+            move_sets[neighbor_id] = 1 << move
+            level[neighbor_id] = 1
+            frontier.append(neighbor_id)
+    distance = 1
+    while frontier:
+        distance += 1
+        next_frontier = []
+        for cell_id in frontier:
+            move_set = move_sets[cell_id]
+            for offset in offsets:
+                neighbor_id = cell_id + offset
+                if occupancy[neighbor_id]:
+                    continue
+                neighbor_level = level[neighbor_id]
+                if neighbor_level == -1:
+                    level[neighbor_id] = distance
+                    move_sets[neighbor_id] = move_set
+                    next_frontier.append(neighbor_id)
+                elif neighbor_level == distance: # another shortest path
+                    move_sets[neighbor_id] |= move_set
+        frontier = next_frontier
+    return move_sets
+
+def compress_moves(move_sets: bytes, runs: array) -> None:
+    """
+    Appends the runs of the first-move table of one source to runs.
+
+    The targets are numbered row by row (y * cols + x). A run covers consecutive targets that share a first move;
+    targets without a move (obstacles, unreachable cubes and the source) fit into any run. The runs are chosen
+    greedily, each one as long as the intersection of the move sets stays non-empty, which gives the fewest runs.
+    The first run always starts at target 0, so every target falls into a run.
+
+    Args:
+        move_sets: The move set of each target in row order (see first_move_sets).
+        runs: The array the runs (`first_target * RUN_SCALE + move`) are appended to.
+    """
+    current = 0 # the moves that all targets of the current run allow
+    run_start = 0
+    for target, move_set in enumerate(move_sets):
+        if not move_set or current & move_set:
+            current &= move_set or current
+            continue
+        if current:
+            runs.append(run_start * RUN_SCALE + RUN_MOVE[current])
+            run_start = target
+        current = move_set
+    if current:
+        runs.append(run_start * RUN_SCALE + RUN_MOVE[current])
+
+def build_rows(job: tuple) -> tuple:
+    """
+    Builds the runs of the sources of some rows (a job of a parallel build).
+
+    Args:
+        job: A tuple of the padded occupancy buffer, its width, the rows and cols of the grid and the range of source rows.
+
+    Returns:
+        tuple: The number of runs per source and the runs, both as array('I').
+    """
+    occupancy, width, rows, cols, first_row, last_row = job
+    run_counts, runs = array('I'), array('I')
+    row_slices = [slice((y + 1) * width + 1, (y + 1) * width + 1 + cols) for y in range(rows)]
+    for y in range(first_row, last_row):
+        for x in range(cols):
+            source_id = (y + 1) * width + x + 1
+            run_count = len(runs)
+            if not occupancy[source_id]:
+                move_sets = first_move_sets(occupancy, width, source_id)
+                compress_moves(b"".join(move_sets[row_slice] for row_slice in row_slices), runs)
+            run_counts.append(len(runs) - run_count)
+    return run_counts, runs
+
+class PathDatabase:
+    """
+    A compressed path database (CPD): the first move of a shortest path from every cube to every cube.
+
+    The first-move table of a source is run-length compressed over the targets in row order (see compress_moves),
+    all runs are kept in one array and offsets[source] points to the runs of a source. A query finds the run of the
+    target with a binary search, takes the move and continues from the next cube, so a path is extracted step
+    by step without a search. The paths are optimal (every stored move starts a shortest path).
+
+    The database is built offline with one breadth-first sweep per cube (O(n²) for n cubes, see
+    `python -m search.pathdb`) and saved next to the map file (`<map>.cpd`) with the content hash of the grid.
+    The database listens to the edits of the grid (see GridMap.add_listener); after an edit it has to be rebuilt.
+
+    Attributes:
+        grid: The GridMap of the database.
+        offsets: The index of the first run of each source (y * cols + x), plus the total number of runs.
+        runs: The runs of all sources (`first_target * RUN_SCALE + move`).
+        valid: False if the database has to be loaded or rebuilt before the next query.
+        edited: True if the grid was edited since it was loaded (the database is then not saved).
+    """
+    def __init__(self, grid):
+        """
+        Initializes the PathDatabase and registers it as a listener of the grid.
+
+        Args:
+            grid: The GridMap to build the database for.
+        """
+        self.grid = grid
+        self.offsets = array('I')
+        self.runs = array('I')
+        self.valid = False
+        self.edited = False
+        grid.add_listener(self)
+
+    def build(self, workers: int = 1) -> None:
+        """
+        Builds the first-move tables of all cubes.
+
+        Args:
+            workers: The number of worker processes (1 builds in this process).
+        """
+        occupancy, width = self.grid.padded_occupancy()
+        rows, cols = self.grid.rows, self.grid.cols
+        jobs = [(occupancy, width, rows, cols, first_row, min(first_row + ROWS_PER_JOB, rows)) for first_row in range(0, rows, ROWS_PER_JOB)]
+        self.offsets, self.runs = array('I', [0]), array('I')
+        start_time = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=workers) if workers > 1 else _NoPool() as executor:
+            for done, (run_counts, runs) in enumerate(executor.map(build_rows, jobs), 1):
+                total = self.offsets[-1]
+                for run_count in run_counts:
+                    total += run_count
+                    self.offsets.append(total)
+                self.runs.extend(runs)
+                elapsed = time.perf_counter() - start_time
+                logging.debug(f"Path database: {done}/{len(jobs)} row blocks, {elapsed:.1f} s (about {elapsed / done * (len(jobs) - done):.0f} s left)")
+        self.valid = True
+
+    def save(self, filename: str) -> None:
+        """
+        Saves the database with the content hash of the grid. Errors (e.g. a read-only directory) are only logged.
+
+        Args:
+            filename: The path to the database file.
+        """
+        data = self.offsets.tobytes() + self.runs.tobytes()
+        header = HEADER.pack(MAGIC, VERSION, self.grid.rows, self.grid.cols, self.grid.content_hash(), len(self.runs), zlib.crc32(data))
+        temp_file = f"{filename}.{os.getpid()}.tmp" # unique per process
+        try:
+            with open(temp_file, "wb") as f:
+                f.write(header)
+                f.write(data)
+            os.replace(temp_file, filename) # replace in one step so readers never see a partial file
+            logging.debug(f"Path database saved under: {filename}")
+        except OSError as error:
+            logging.debug(f"Could not write path database {filename}: {error}")
+
+    def load(self, filename: str) -> bool:
+        """
+        Loads the database if the file exists and was built for the current content of the grid.
+
+        Args:
+            filename: The path to the database file.
+
+        Returns:
+            True if the database was loaded, False if the file is missing, stale or corrupt.
+        """
+        try:
+            with open(filename, "rb") as f:
+                data = f.read()
+        except OSError:
+            return False
+        if len(data) < HEADER.size:
+            return False
+        magic, version, rows, cols, content_hash, run_count, checksum = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION or content_hash != self.grid.content_hash():
+            return False
+        body = memoryview(data)[HEADER.size:]
+        offsets_size = (rows * cols + 1) * 4
+        if len(body) != offsets_size + run_count * 4 or zlib.crc32(body) != checksum:
+            logging.warning(f"Path database {filename} is corrupt -> rebuild it.")
+            return False
+        self.offsets, self.runs = array('I'), array('I')
+        self.offsets.frombytes(body[:offsets_size])
+        self.runs.frombytes(body[offsets_size:])
+        self.valid = True
+        return True
+
+    def ensure(self, workers: int = 1) -> None:
+        """
+        Loads the database of the map file or builds (and saves) it if the database is not valid.
+
+        Args:
+            workers: The number of worker processes of a build.
+        """
+        if self.valid:
+            return
+        map_path = self.grid.map_path
+        if map_path is not None and self.load(path_database_filename(map_path)):
+            logging.debug(f"Loaded path database of {map_path}")
+            return
+        start_time = time.perf_counter()
+        self.build(workers)
+        logging.info(f"Built path database ({len(self.runs)} runs) in {time.perf_counter() - start_time:.2f} s")
+        if map_path is not None and not self.edited:
+            self.save(path_database_filename(map_path))
+
+    def size_bytes(self) -> int:
+        """
+        Gets the size of the database (offsets and runs, without the header of the file).
+
+        Returns:
+            The size in bytes.
+        """
+        return (len(self.offsets) + len(self.runs)) * 4
+
+    def first_move(self, cube, goal) -> tuple:
+        """
+        Gets the first move of a shortest path from a cube to the goal.
+
+        Args:
+            cube: The (x, y) coordinates of the cube.
+            goal: The (x, y) coordinates of the goal cube (reachable from cube and not cube itself).
+
+        Returns:
+            tuple: The move (dx, dy).
+        """
+        self.ensure()
+        cols = self.grid.cols
+        source = cube[1] * cols + cube[0]
+        target = goal[1] * cols + goal[0]
+        run = bisect_right(self.runs, target * RUN_SCALE + RUN_SCALE - 1, self.offsets[source], self.offsets[source + 1]) - 1
+        return MOVES[self.runs[run] % RUN_SCALE]
+
+    def search(self, start, goal):
+        """
+        Extracts the shortest path from the start cube to the goal cube move by move.
+
+        Args:
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+
+        Returns:
+            SearchResult: The result of the query (no cubes are visited and no queue is used).
+        """
+        start_time = time.perf_counter() # get start_time for runtime-calculation
+        self.ensure()
+        if not self.grid.component_index().connected(start, goal):
+            logging.info("No path found.")
+            return SearchResult("CPD", None, 0, 0, time.perf_counter() - start_time)
+
+        runs, offsets, cols = self.runs, self.offsets, self.grid.cols
+        target = goal[1] * cols + goal[0]
+        key = target * RUN_SCALE + RUN_SCALE - 1 # the last possible run of the target
+        x, y = start
+        path = [start]
+        while (x, y) != goal:
+            source = y * cols + x
+            dx, dy = MOVES[runs[bisect_right(runs, key, offsets[source], offsets[source + 1]) - 1] % RUN_SCALE]
+            x += dx
+            y += dy
+            path.append((x, y))
+        return SearchResult("CPD", path, 0, 0, time.perf_counter() - start_time)
+
+    def cell_changed(self, x: int, y: int, traversable: bool) -> None:
+        """
+        Invalidates the database after a cube of the grid was changed (called by the grid).
+
+        Args:
+            x: The x-coordinate of the changed cube.
+            y: The y-coordinate of the changed cube.
+            traversable: True if the cube became traversable, False if it became an obstacle.
+        """
+        self.valid = False
+        self.edited = True
+
+    def grid_reset(self) -> None:
+        """Invalidates the database after the whole grid was replaced (called by the grid)."""
+        self.valid = False
+        self.edited = False
+
+class _NoPool:
+    """Runs the jobs of a build in this process, with the interface of the ProcessPoolExecutor."""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, function, jobs):
+        return map(function, jobs)
+
+def main() -> None:
+    """Main function to parse the command line arguments, build the path databases and check them against A*."""
+    from .gridmap import GridMap
+    from .engine import SearchEngine
+    from .batch import collect_map_files
+    parser = argparse.ArgumentParser(description="Build compressed path databases of maps (saved next to the maps) and check them against A*.")
+    parser.add_argument("--maps", nargs="+", default=["maps"], help="map files and/or directories (default: maps)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes of a build (default: number of CPUs)")
+    parser.add_argument("--force", action="store_true", help="rebuild databases that are up to date")
+    parser.add_argument("--queries", type=int, default=100, help="random queries per map compared with A* (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random queries (default: 0)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    workers = args.workers or os.cpu_count() or 1
+    generator = random.Random(args.seed)
+    print(f"{'Map':<36} {'Build s':>9} {'Runs':>10} {'Size MB':>8} {'Runs/cube':>9} {'CPD ms':>8} {'A* ms':>8} {'Errors':>6}")
+    for map_file in collect_map_files(args.maps):
+        grid_map = GridMap.load(map_file)
+        database = grid_map.path_database()
+        start_time = time.perf_counter()
+        if args.force or not database.load(path_database_filename(map_file)):
+            database.build(workers)
+            database.save(path_database_filename(map_file))
+        build_time = time.perf_counter() - start_time
+
+        # random queries between free cubes: the path lengths have to match A*
+        free_cubes = [grid_map.coordinates(index) for index, cell in enumerate(grid_map.occupancy) if not cell]
+        engine = SearchEngine(grid_map)
+        cpd_time = a_star_time = 0.0
+        errors = 0
+        for _ in range(args.queries if free_cubes else 0):
+            start, goal = generator.choice(free_cubes), generator.choice(free_cubes)
+            result = database.search(start, goal)
+            expected = engine.a_star(start, goal)
+            cpd_time += result.runtime
+            a_star_time += expected.runtime
+            if result.path_length != expected.path_length:
+                errors += 1
+                logging.error(f"{map_file}: {start} -> {goal} has length {result.path_length}, A* {expected.path_length}")
+        cubes = len(free_cubes) or 1
+        queries = max(args.queries, 1)
+        print(f"{grid_map.current_map_file:<36} {build_time:>9.2f} {len(database.runs):>10} {database.size_bytes() / 2 ** 20:>8.2f} "
+              f"{len(database.runs) / cubes:>9.1f} {cpd_time / queries * 1000:>8.3f} {a_star_time / queries * 1000:>8.3f} {errors:>6}")
+
+if __name__ == "__main__":
+    main()
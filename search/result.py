@@ -0,0 +1,67 @@
+# columns of results/Stats.csv (the stats view of the ResultStore uses the same names)
+STATS_HEADER = ["Algorithm", "Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Found-Goal", "Map-Filename"]
+
+class SearchResult:
+    """
+    Holds the outcome and statistics of a single search.
+
+    The fields mirror the columns of results/Stats.csv and of the ResultStore, so a result can be
+    saved or compared directly with the results of the GUI.
+
+    Attributes:
+        algorithm: The name of the algorithm used.
+        path: A list of (x, y) tuples from start to goal, or None if no path is found.
+        visited_cubes: The number of cubes visited during the search (excluding start).
+        max_queue_size: The maximum size of the queue during the search.
+        runtime: The time taken to perform the search in seconds.
+        memory: The MemoryProfile of the search, or None if memory was not tracked.
+        counters: A dictionary with the operation counts of the search (see SearchCounters), or None if they were not counted.
+        suboptimality: The bound of an anytime search (ARA*): the path is at most this factor longer than the shortest path, else None.
+        time_to_first_solution: The time in seconds until an anytime search found its first path, else None.
+    """
+    def __init__(self, algorithm: str, path, visited_cubes: int, max_queue_size: int, runtime: float):
+        """
+        Initializes the SearchResult.
+
+        Args:
+            algorithm: The name of the algorithm used.
+            path: A list of (x, y) tuples from start to goal, or None if no path is found.
+            visited_cubes: The number of cubes visited during the search (excluding start).
+            max_queue_size: The maximum size of the queue during the search.
+            runtime: The time taken to perform the search in seconds.
+        """
+        self.algorithm = algorithm
+        self.path = path
+        self.visited_cubes = visited_cubes
+        self.max_queue_size = max_queue_size
+        self.runtime = runtime
+        self.memory = None
+        self.counters = None
+        self.suboptimality = None
+        self.time_to_first_solution = None
+
+    @property
+    def found_goal(self) -> bool:
+        """True if a path to the goal is found."""
+        return self.path is not None
+
+    @property
+    def path_length(self) -> int:
+        """The length of the found path (excluding start and goal), 0 if no path is found."""
+        return len(self.path) - 2 if self.path else 0
+
+    def to_stats_row(self, map_file) -> list:
+        """
+        Converts the result into a row of results/Stats.csv (see STATS_HEADER).
+
+        Args:
+            map_file: The name of the map file used for the search.
+
+        Returns:
+            A list with the values of the row.
+        """
+        return [self.algorithm, self.path_length, self.visited_cubes, self.max_queue_size, self.runtime, self.found_goal, map_file if map_file else 'not found']
+
+    def __repr__(self) -> str:
+        return (f"SearchResult(algorithm={self.algorithm!r}, path_length={self.path_length}, visited_cubes={self.visited_cubes}, "
+                f"max_queue_size={self.max_queue_size}, runtime={self.runtime}, found_goal={self.found_goal})")
@@ -0,0 +1,166 @@
+import os
+import csv
+import argparse
+import logging
+import time
+from .gridmap import GridMap
+from .engine import SearchEngine
+
+# columns of the per-query stats file
+SCENARIO_STATS_HEADER = ["Algorithm", "Map-Filename", "Bucket", "Start", "Goal", "Optimal-Length", "Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Found-Goal"]
+
+class ScenarioQuery:
+    """
+    A single query of a Moving AI scenario file.
+
+    Attributes:
+        bucket: The bucket of the query (queries are grouped by their optimal length).
+        map_file: The map file of the query as written in the scenario file.
+        width: The width of the map.
+        height: The height of the map.
+        start: The (x, y) coordinates of the start cube.
+        goal: The (x, y) coordinates of the goal cube.
+        optimal_length: The optimal path length given by the scenario file (octile distance of Moving AI).
+    """
+    def __init__(self, bucket: int, map_file: str, width: int, height: int, start: tuple, goal: tuple, optimal_length: float):
+        """
+        Initializes the ScenarioQuery.
+
+        Args:
+            bucket: The bucket of the query.
+            map_file: The map file of the query as written in the scenario file.
+            width: The width of the map.
+            height: The height of the map.
+            start: The (x, y) coordinates of the start cube.
+            goal: The (x, y) coordinates of the goal cube.
+            optimal_length: The optimal path length given by the scenario file.
+        """
+        self.bucket = bucket
+        self.map_file = map_file
+        self.width = width
+        self.height = height
+        self.start = start
+        self.goal = goal
+        self.optimal_length = optimal_length
+
+def load_scenario(filename: str) -> list:
+    """
+    Loads the queries of a Moving AI scenario file (.scen).
+
+    Every line after the "version" line contains: bucket, map, width, height, start x, start y,
+    goal x, goal y and the optimal length, separated by whitespace.
+
+    Args:
+        filename: The path to the scenario file.
+
+    Returns:
+        A list of ScenarioQuery objects.
+    """
+    queries = []
+    with open(filename, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 9 or parts[0] == "version":
+                continue
+            bucket, map_file, width, height, start_x, start_y, goal_x, goal_y = parts[:8]
+            queries.append(ScenarioQuery(int(bucket), map_file, int(width), int(height), (int(start_x), int(start_y)),
+                                         (int(goal_x), int(goal_y)), float(parts[8])))
+    logging.debug(f"Loaded {len(queries)} queries from: {filename}")
+    return queries
+
+def resolve_map_file(scenario_file: str, map_file: str, map_dir: str = None) -> str:
+    """
+    Finds the map file of a query, which is stored relative to the scenario file or in map_dir.
+
+    Args:
+        scenario_file: The path to the scenario file.
+        map_file: The map file as written in the scenario file.
+        map_dir: An optional directory containing the map files.
+
+    Returns:
+        The path to the map file.
+    """
+    candidates = [os.path.join(map_dir, os.path.basename(map_file))] if map_dir else []
+    candidates += [os.path.join(os.path.dirname(scenario_file), map_file), os.path.join(os.path.dirname(scenario_file), os.path.basename(map_file)), map_file]
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            return candidate.replace("\\", "/")
+    raise FileNotFoundError(f"Map file {map_file} of scenario {scenario_file} not found.")
+
+def run_scenario(scenario_file: str, algorithms: list, map_dir: str = None) -> tuple:
+    """
+    Runs all queries of a scenario file with the given algorithms.
+
+    Each map is loaded once and all of its queries are run in a batch through the headless engine.
+    Queries between unconnected cubes are rejected by the component index of the map without a search.
+
+    Args:
+        scenario_file: The path to the scenario file.
+        algorithms: A list of algorithm names (see SearchEngine.ALGORITHMS).
+        map_dir: An optional directory containing the map files.
+
+    Returns:
+        tuple: A list of per-query rows (see SCENARIO_STATS_HEADER) and a dictionary mapping each algorithm
+        to its summary (queries, search time, wall time and queries per second).
+    """
+    queries_by_map = {}
+    for query in load_scenario(scenario_file):
+        queries_by_map.setdefault(query.map_file, []).append(query)
+
+    rows = []
+    summary = {algorithm: {"queries": 0, "search_time": 0.0, "wall_time": 0.0} for algorithm in algorithms}
+    for map_file, queries in queries_by_map.items():
+        grid_map = GridMap.load(resolve_map_file(scenario_file, map_file, map_dir))
+        if (grid_map.cols, grid_map.rows) != (queries[0].width, queries[0].height):
+            logging.warning(f"Size of {map_file} ({grid_map.cols}x{grid_map.rows}) differs from scenario ({queries[0].width}x{queries[0].height}).")
+
+        for algorithm in algorithms:
+            engine = SearchEngine(grid_map, component_index=grid_map.component_index())
+            start_time = time.perf_counter()
+            for query in queries:
+                result = engine.search(algorithm, query.start, query.goal)
+                rows.append([algorithm, grid_map.current_map_file, query.bucket, f"{query.start[0]},{query.start[1]}", f"{query.goal[0]},{query.goal[1]}",
+                             query.optimal_length, result.path_length, result.visited_cubes, result.max_queue_size, result.runtime, result.found_goal])
+                summary[algorithm]["search_time"] += result.runtime
+            summary[algorithm]["wall_time"] += time.perf_counter() - start_time
+            summary[algorithm]["queries"] += len(queries)
+
+    for stats in summary.values():
+        stats["queries_per_second"] = stats["queries"] / stats["wall_time"] if stats["wall_time"] else 0.0
+    return rows, summary
+
+def write_scenario_stats(rows: list, output_file: str) -> None:
+    """
+    Appends per-query rows to a stats file, writing the header for new files.
+
+    Args:
+        rows: A list of rows (see SCENARIO_STATS_HEADER).
+        output_file: The path to the stats file.
+    """
+    write_header = not os.path.exists(output_file) or os.path.getsize(output_file) == 0
+    with open(output_file, "a", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        if write_header:
+            writer.writerow(SCENARIO_STATS_HEADER)
+        writer.writerows(rows)
+
+def main() -> None:
+    """Main function to parse the command line arguments and run the scenario files."""
+    parser = argparse.ArgumentParser(description="Run the queries of Moving AI scenario files (.scen).")
+    parser.add_argument("scenarios", nargs="+", help="scenario files")
+    parser.add_argument("--algorithms", nargs="+", default=["A*"], choices=list(SearchEngine.ALGORITHMS), help="algorithms to run (default: A*)")
+    parser.add_argument("--map-dir", default=None, help="directory containing the map files (default: next to the scenario file)")
+    parser.add_argument("--output", default="results/Scenario-Stats.csv", help="per-query stats file to append to (default: results/Scenario-Stats.csv)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    for scenario_file in args.scenarios:
+        rows, summary = run_scenario(scenario_file, args.algorithms, args.map_dir)
+        write_scenario_stats(rows, args.output)
+        for algorithm, stats in summary.items():
+            print(f"{scenario_file} {algorithm}: {stats['queries']} queries, search time {stats['search_time']:.3f} s, "
+                  f"wall time {stats['wall_time']:.3f} s, {stats['queries_per_second']:.1f} queries/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+import os
+import json
+import time
+import uuid
+import sqlite3
+import logging
+from .environment import collect_metadata
+from .counters import SearchCounters
+
+DEFAULT_DATABASE = "results/results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    started REAL NOT NULL,
+    source TEXT NOT NULL,
+    metadata TEXT NOT NULL,
+    config TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT NOT NULL REFERENCES sessions(session_id),
+    timestamp REAL NOT NULL,
+    algorithm TEXT NOT NULL,
+    map_file TEXT NOT NULL,
+    path_length INTEGER NOT NULL,
+    visited_cubes INTEGER NOT NULL,
+    max_queue_size INTEGER NOT NULL,
+    runtime REAL NOT NULL,
+    found_goal INTEGER NOT NULL,
+    memory_used INTEGER,
+    open_list INTEGER,
+    closed_set INTEGER,
+    parent_map INTEGER,
+    path_memory INTEGER,
+    config TEXT NOT NULL,
+    expansions INTEGER,
+    generated INTEGER,
+    pushes INTEGER,
+    stale_pops INTEGER,
+    reexpansions INTEGER,
+    suboptimality REAL,
+    first_solution_time REAL
+);
+CREATE INDEX IF NOT EXISTS runs_algorithm_map ON runs (algorithm, map_file);
+"""
+
+# columns added after the first version of the schema (added to the runs of older databases on open)
+ADDED_COLUMNS = {**{field: "INTEGER" for field in SearchCounters.FIELDS}, "suboptimality": "REAL", "first_solution_time": "REAL"}
+
+# the runs with the column names of results/Stats.csv and results/Memory-Consumption.csv (memory in KB), recreated on every open
+STATS_VIEW = """
+DROP VIEW IF EXISTS stats;
+CREATE VIEW stats AS SELECT
+    run_id AS "Run-Id", session_id AS "Session-Id", timestamp AS "Timestamp", algorithm AS "Algorithm",
+    path_length AS "Path-Length", visited_cubes AS "Visited-Cubes", max_queue_size AS "Max-Queue-Size",
+    runtime AS "Runtime", found_goal AS "Found-Goal", map_file AS "Map-Filename",
+    memory_used / 1024.0 AS "Memory-Used", open_list / 1024.0 AS "Open-List", closed_set / 1024.0 AS "Closed-Set",
+    parent_map / 1024.0 AS "Parent-Map", path_memory / 1024.0 AS "Path",
+    expansions AS "Expansions", generated AS "Generated", pushes AS "Pushes", stale_pops AS "Stale-Pops", reexpansions AS "Re-Expansions",
+    suboptimality AS "Suboptimality", first_solution_time AS "Time-To-First-Solution"
+FROM runs;
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (session_id, timestamp, algorithm, map_file, path_length, visited_cubes, max_queue_size, runtime, found_goal,
+                  memory_used, open_list, closed_set, parent_map, path_memory, config, expansions, generated, pushes, stale_pops, reexpansions,
+                  suboptimality, first_solution_time)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+class ResultStore:
+    """
+    A SQLite database of search results that replaces appending every run to the CSV files.
+
+    Every process that records results opens a session, which stores the machine metadata (interpreter,
+    CPU, git revision, see collect_metadata) and the configuration once. Runs are buffered in memory and
+    written in a single transaction when the buffer is full, on flush and on close. Each run has its own
+    id, a timestamp, the statistics of its SearchResult, the memory profile and operation counts (if recorded),
+    the suboptimality bound and time to first solution of anytime searches and its configuration.
+
+    The view `stats` returns the runs with the column names of results/Stats.csv, so the scripts in utils can
+    query it directly (e.g. `SELECT * FROM stats WHERE "Map-Filename" = ?`).
+
+    Attributes:
+        filename: The path to the database file.
+        buffer_size: The number of runs buffered before they are written.
+        connection: The connection to the database.
+        session_id: The id of the current session.
+        buffer: The runs not written yet.
+    """
+    def __init__(self, filename: str = DEFAULT_DATABASE, source: str = "script", config: dict = None, buffer_size: int = 64):
+        """
+        Opens (or creates) the database and starts a new session.
+
+        Args:
+            filename: The path to the database file.
+            source: The program that records the session (e.g. "gui" or "batch").
+            config: The configuration of the session (stored as JSON).
+            buffer_size: The number of runs buffered before they are written.
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.filename = filename
+        self.buffer_size = buffer_size
+        self.connection = sqlite3.connect(filename)
+        self.connection.executescript(SCHEMA)
+        # databases of older versions lack the added columns
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        for column, column_type in ADDED_COLUMNS.items():
+            if column not in columns:
+                self.connection.execute(f"ALTER TABLE runs ADD COLUMN {column} {column_type}")
+        self.connection.executescript(STATS_VIEW)
+        self.session_id = uuid.uuid4().hex
+        self.buffer = []
+        with self.connection:
+            self.connection.execute("INSERT INTO sessions VALUES (?, ?, ?, ?, ?)",
+                                    (self.session_id, time.time(), source, json.dumps(collect_metadata()), json.dumps(config or {})))
+        logging.debug(f"Started session {self.session_id} in {filename}")
+
+    def add(self, result, map_file, config: dict = None) -> None:
+        """
+        Buffers a run, the buffer is written when it is full.
+
+        Args:
+            result: The SearchResult of the run.
+            map_file: The name of the map file used for the search.
+            config: The configuration of the run (stored as JSON).
+        """
+        memory, counters = result.memory, result.counters
+        self.buffer.append((self.session_id, time.time(), result.algorithm, map_file if map_file else 'not found',
+                            result.path_length, result.visited_cubes, result.max_queue_size, result.runtime, int(result.found_goal),
+                            memory.total if memory else None, memory.open_list if memory else None, memory.closed_set if memory else None,
+                            memory.parent_map if memory else None, memory.path if memory else None, json.dumps(config or {}),
+                            *(counters[field] if counters else None for field in SearchCounters.FIELDS),
+                            result.suboptimality, result.time_to_first_solution))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all buffered runs in a single transaction."""
+        if not self.buffer:
+            return None
+        with self.connection:
+            self.connection.executemany(INSERT_RUN, self.buffer)
+        logging.debug(f"Wrote {len(self.buffer)} runs to {self.filename}")
+        self.buffer.clear()
+
+    def query(self, sql: str, parameters: tuple = ()) -> list:
+        """
+        Runs a query on the database (buffered runs are written first).
+
+        Args:
+            sql: The SQL query.
+            parameters: The parameters of the query.
+
+        Returns:
+            A list with the rows of the result.
+        """
+        self.flush()
+        return self.connection.execute(sql, parameters).fetchall()
+
+    def close(self) -> None:
+        """Writes the buffered runs and closes the database."""
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
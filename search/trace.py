@@ -0,0 +1,168 @@
+import os
+import sys
+import struct
+import logging
+from array import array
+from .engine import SearchObserver
+
+# header: magic, version, rows, cols, number of visited cubes, path length (0 == no path), length of algorithm / map name
+HEADER = struct.Struct("<5sBIIIIHH")
+MAGIC = b"PFTRC"
+VERSION = 1
+TRACE_EXTENSION = ".trace"
+
+class SearchTrace:
+    """
+    The recorded progress of a search: the visited cubes in the order the search visited them and the found path.
+
+    Cubes are stored as their index in the occupancy of the grid (`y * cols + x`) in compact integer arrays,
+    so a trace of a search on a 512x512 map takes a few hundred kilobytes.
+
+    Attributes:
+        algorithm: The name of the algorithm that was recorded.
+        rows: The number of rows of the searched grid.
+        cols: The number of columns of the searched grid.
+        map_file: The name of the searched map file (or None).
+        cells: An array with the index of each visited cube in visiting order.
+        path: An array with the indices of the cubes of the found path, or None if no path was found.
+    """
+    def __init__(self, algorithm: str, rows: int, cols: int, map_file=None, cells=None, path=None):
+        """
+        Initializes the SearchTrace.
+
+        Args:
+            algorithm: The name of the algorithm that was recorded.
+            rows: The number of rows of the searched grid.
+            cols: The number of columns of the searched grid.
+            map_file: The name of the searched map file (or None).
+            cells: An array with the index of each visited cube in visiting order.
+            path: An array with the indices of the cubes of the found path, or None if no path was found.
+        """
+        self.algorithm = algorithm
+        self.rows = rows
+        self.cols = cols
+        self.map_file = map_file
+        self.cells = cells if cells is not None else array('i')
+        self.path = path
+
+    def coordinates(self, index: int) -> tuple:
+        """
+        Converts the index of a cube into its coordinates.
+
+        Args:
+            index: The index of the cube.
+
+        Returns:
+            The (x, y) coordinates of the cube.
+        """
+        y, x = divmod(index, self.cols)
+        return x, y
+
+    def path_cubes(self):
+        """
+        Gets the path as (x, y) tuples.
+
+        Returns:
+            A list of cubes representing the path from start to goal, or None if no path was found.
+        """
+        return [self.coordinates(index) for index in self.path] if self.path is not None else None
+
+    def save(self, filename: str) -> None:
+        """
+        Saves the trace in a binary file (header, names, visited cubes and path as little-endian int32).
+
+        Args:
+            filename: The path to the trace file.
+        """
+        algorithm = self.algorithm.encode("utf-8")
+        map_file = (self.map_file or "").encode("utf-8")
+        cells = array('i', self.cells)
+        path = array('i', self.path if self.path is not None else ())
+        if sys.byteorder == "big":
+            cells.byteswap()
+            path.byteswap()
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, self.rows, self.cols, len(cells), len(path), len(algorithm), len(map_file)))
+            f.write(algorithm)
+            f.write(map_file)
+            f.write(cells.tobytes())
+            f.write(path.tobytes())
+        logging.debug(f"Saved trace with {len(cells)} visited cubes to: {filename}")
+
+    @classmethod
+    def load(cls, filename: str):
+        """
+        Loads a trace saved with save.
+
+        Args:
+            filename: The path to the trace file.
+
+        Returns:
+            SearchTrace: The loaded trace.
+
+        Raises:
+            ValueError: If the file is not a trace file of a supported version.
+        """
+        with open(filename, "rb") as f:
+            data = f.read()
+        if len(data) < HEADER.size:
+            raise ValueError(f"{filename} is not a trace file.")
+        magic, version, rows, cols, cell_count, path_count, algorithm_length, map_length = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{filename} is not a trace file (version {VERSION}).")
+        offset = HEADER.size
+        algorithm = data[offset:offset + algorithm_length].decode("utf-8")
+        offset += algorithm_length
+        map_file = data[offset:offset + map_length].decode("utf-8") or None
+        offset += map_length
+        cells = array('i', data[offset:offset + cell_count * 4])
+        offset += cell_count * 4
+        path = array('i', data[offset:offset + path_count * 4])
+        if sys.byteorder == "big":
+            cells.byteswap()
+            path.byteswap()
+        return cls(algorithm, rows, cols, map_file, cells, path if path_count else None)
+
+class TraceRecorder(SearchObserver):
+    """
+    A SearchObserver that records the visited cubes of a search into a SearchTrace instead of drawing them.
+
+    Attributes:
+        grid: The grid that is searched.
+        cells: An array with the index of each visited cube in visiting order.
+    """
+    def __init__(self, grid):
+        """
+        Initializes the TraceRecorder for a grid.
+
+        Args:
+            grid: The grid that is searched.
+        """
+        self.grid = grid
+        self.cells = array('i')
+
+    def visit(self, x: int, y: int) -> None:
+        """
+        Records a visited cube.
+
+        Args:
+            x: The x-coordinate of the visited cube.
+            y: The y-coordinate of the visited cube.
+        """
+        self.cells.append(y * self.grid.cols + x)
+
+    def trace(self, result) -> SearchTrace:
+        """
+        Creates the SearchTrace of the recorded search.
+
+        Args:
+            result: The SearchResult of the recorded search.
+
+        Returns:
+            SearchTrace: The recorded trace.
+        """
+        path = array('i', (y * self.grid.cols + x for (x, y) in result.path)) if result.path is not None else None
+        return SearchTrace(result.algorithm, self.grid.rows, self.grid.cols, self.grid.current_map_file, self.cells, path)
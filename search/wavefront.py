@@ -0,0 +1,196 @@
+import sys
+import time
+import argparse
+import logging
+from array import array
+
+# distance of cubes that are not reachable from a source (like UNREACHABLE["I"] of the landmark tables)
+UNREACHABLE = 0xFFFFFFFF
+# translation tables between occupancy bytes (0 == free) and binary digits of the free bits ('1' == free)
+_FREE_DIGITS = bytes.maketrans(b"\x00\x01", b"10")
+_FROM_DIGITS = bytes.maketrans(b"01", b"\x00\x01")
+_LANE_MASK = bytes.maketrans(b"\x00\x01", b"\x00\xff")
+# levels whose distances share their high bits (see wavefront_distances)
+BLOCK_BITS = 6
+# measured costs in bits of a wavefront level: a cube of a breadth-first sweep and the Python overhead of a level
+WAVEFRONT_BREAK_EVEN = 4000
+LEVEL_OVERHEAD_BITS = 14000
+
+def free_bits(occupancy) -> int:
+    """
+    Converts an occupancy buffer into a bitset of the free cells (bit i is set if cell i is free).
+
+    Args:
+        occupancy: A bytes-like object containing 0 / 1 per cell.
+
+    Returns:
+        The bitset as an integer.
+    """
+    if not occupancy:
+        return 0
+    return int(bytes(occupancy).translate(_FREE_DIGITS)[::-1], 2) # reversed: the last digit is bit 0
+
+def bits_to_bytes(bits: int, cell_count: int) -> bytes:
+    """
+    Converts a bitset into one byte (0 / 1) per cell (the inverse of free_bits for the free cells).
+
+    Args:
+        bits: The bitset as an integer (only the lowest cell_count bits are used).
+        cell_count: The number of cells.
+
+    Returns:
+        The bytes with 1 for the cells of the bitset.
+    """
+    if not bits:
+        return bytes(cell_count)
+    return format(bits, f"0{cell_count}b").encode("ascii")[::-1][:cell_count].translate(_FROM_DIGITS)
+
+def wavefront(occupancy, width: int, source_ids) -> tuple:
+    """
+    Floods the map from the sources and yields the cubes of every level as a bitset.
+
+    The whole frontier moves at once: its bitset is shifted by one cell (left, right) and one row (up, down)
+    and masked with the unvisited free cells, so a level costs a few operations on integers of one bit per
+    cell (in C) instead of one Python step per cube. The padding of the occupancy buffer (see
+    GridMap.padded_occupancy) keeps the shifts from wrapping around rows.
+
+    Args:
+        occupancy: The padded occupancy buffer.
+        width: The width of the padded occupancy buffer.
+        source_ids: The cell ids of the sources (obstacles are ignored).
+
+    Yields:
+        tuple: The distance (from 0 for the sources) and the bitset of the cubes first reached in that distance.
+    """
+    unvisited = free_bits(occupancy)
+    frontier = 0
+    for source_id in source_ids:
+        frontier |= 1 << source_id
+    frontier &= unvisited
+    distance = 0
+    while frontier:
+        yield distance, frontier
+        unvisited ^= frontier # the frontier is a subset of the unvisited cubes
+        frontier = ((frontier << 1) | (frontier >> 1) | (frontier << width) | (frontier >> width)) & unvisited
+        distance += 1
+
+def wavefront_distances(occupancy, width: int, source_ids) -> tuple:
+    """
+    Calculates the distances from the sources to all cubes with a wavefront (see wavefront).
+
+    The distances are kept as bit planes (plane k holds the cubes whose distance has bit k set). The low
+    BLOCK_BITS planes are updated every level; the levels of a block of 2^BLOCK_BITS levels share the high bits,
+    so the high planes are updated once per block. The planes are converted into 4 byte lanes per cube at the end.
+
+    Args:
+        occupancy: The padded occupancy buffer (see GridMap.padded_occupancy).
+        width: The width of the padded occupancy buffer.
+        source_ids: The cell ids of the sources.
+
+    Returns:
+        tuple: The distance of each cell id (array 'I', UNREACHABLE for obstacles and unreachable cubes) and the number of levels.
+    """
+    cell_count = len(occupancy)
+    low_mask = (1 << BLOCK_BITS) - 1
+    planes = [0] * 32
+    block, block_cubes = 0, 0 # the current block and its cubes
+    reached = 0
+    levels = 0
+    for distance, frontier in wavefront(occupancy, width, source_ids):
+        levels = distance + 1
+        if distance >> BLOCK_BITS != block: # the levels of a new block begin
+            reached |= _add_block(planes, block, block_cubes)
+            block, block_cubes = distance >> BLOCK_BITS, 0
+        block_cubes |= frontier
+        low, k = distance & low_mask, 0
+        while low:
+            if low & 1:
+                planes[k] |= frontier
+            low >>= 1
+            k += 1
+    reached |= _add_block(planes, block, block_cubes)
+
+    # byte j of the distance of a cube is the sum of planes 8j..8j+7 (one bit each, so the bytes never carry)
+    unreachable = int.from_bytes(bits_to_bytes(~reached & ((1 << cell_count) - 1), cell_count).translate(_LANE_MASK), "little")
+    lanes = bytearray(4 * cell_count)
+    for j in range(4):
+        lane = unreachable # 0xff in every byte of an unreachable cube
+        for k in range(8 * j, 8 * j + 8):
+            if planes[k]:
+                lane |= int.from_bytes(bits_to_bytes(planes[k], cell_count), "little") << (k - 8 * j)
+        lanes[j::4] = lane.to_bytes(cell_count, "little")
+    distances = array('I')
+    distances.frombytes(lanes) # 4 byte lanes of little-endian uint32
+    if sys.byteorder == "big":
+        distances.byteswap()
+    return distances, levels
+
+def _add_block(planes: list, block: int, block_cubes: int) -> int:
+    """
+    Adds the cubes of a block of levels to the high planes of their distance.
+
+    Args:
+        planes: The bit planes of the distances.
+        block: The high bits of the distances of the block (distance >> BLOCK_BITS).
+        block_cubes: The bitset of the cubes reached in the levels of the block.
+
+    Returns:
+        The bitset of the cubes of the block.
+    """
+    k = BLOCK_BITS
+    while block:
+        if block & 1:
+            planes[k] |= block_cubes
+        block >>= 1
+        k += 1
+    return block_cubes
+
+def prefers_wavefront(levels: int, cell_count: int, reached_cubes: int) -> bool:
+    """
+    Estimates whether a wavefront is faster than a breadth-first sweep.
+
+    A level of the wavefront costs the same for 1 and for 1,000 cubes (about cell_count + LEVEL_OVERHEAD_BITS bit
+    operations), a cube of the breadth-first sweep about WAVEFRONT_BREAK_EVEN of them. The wavefront wins on open
+    maps with wide frontiers and few levels and loses on mazes with long, narrow corridors (many levels of a few cubes).
+
+    Args:
+        levels: The (expected) number of levels of the sweep.
+        cell_count: The number of cells of the padded occupancy buffer.
+        reached_cubes: The (expected) number of cubes the sweep reaches.
+
+    Returns:
+        True if the wavefront is expected to be faster.
+    """
+    return levels * (cell_count + LEVEL_OVERHEAD_BITS) < WAVEFRONT_BREAK_EVEN * reached_cubes
+
+def main() -> None:
+    """Main function to parse the command line arguments and compare the wavefront with the breadth-first sweep on maps."""
+    from .gridmap import GridMap
+    from .batch import collect_map_files
+    from .landmarks import distance_sweep
+    parser = argparse.ArgumentParser(description="Compare the bitset wavefront with the breadth-first sweep of full-map distance transforms.")
+    parser.add_argument("--maps", nargs="+", default=["maps"], help="map files and/or directories (default: maps)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='[%(levelname)s] %(asctime)s - %(message)s')
+
+    print(f"{'Map':<36} {'Levels':>7} {'Cubes':>8} {'BFS ms':>8} {'Wave ms':>8} {'Speedup':>8} {'Choice':>8} {'Equal':>6}")
+    for map_file in collect_map_files(args.maps):
+        grid_map = GridMap.load(map_file)
+        occupancy, width = grid_map.padded_occupancy()
+        source_id = occupancy.find(0)
+        if source_id == -1:
+            continue
+        start_time = time.perf_counter()
+        expected = distance_sweep(occupancy, width, source_id)
+        sweep_time = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        distances, levels = wavefront_distances(occupancy, width, (source_id,))
+        wavefront_time = time.perf_counter() - start_time
+        reached_cubes = len(expected) - expected.count(UNREACHABLE)
+        choice = "wave" if prefers_wavefront(levels, len(occupancy), reached_cubes) else "bfs"
+        print(f"{grid_map.current_map_file:<36} {levels:>7} {reached_cubes:>8} {sweep_time * 1000:>8.1f} {wavefront_time * 1000:>8.1f} "
+              f"{sweep_time / wavefront_time:>7.2f}x {choice:>8} {str(distances == expected):>6}")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 import pandas
 import re
+import os
+import sqlite3
+
+DATABASE = "../results/results.db"
 
 def extract_map_info(filename: str):
     """
@@ -24,11 +28,34 @@ def extract_map_info(filename: str):
 
     return map_size, 0, 0 # self-made maps 512x512_yyyy_mm_dd_hh_mm_ss.txt
 
+def load_results() -> tuple:
+    """
+    Loads the stats and memory results, from the results database if it exists, otherwise from the CSV files.
+
+    Returns:
+        tuple: A DataFrame with the stats and a DataFrame with the memory results.
+    """
+    if not os.path.exists(DATABASE):
+        return pandas.read_csv("../results/Stats.csv", sep=";"), pandas.read_csv("../results/Memory-Consumption.csv", sep=";")
+    connection = sqlite3.connect(DATABASE)
+    try:
+        # counting operations slows the search down: the runtime is only averaged over runs without counters
+        df = pandas.read_sql_query(
+            """SELECT "Algorithm", "Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Found-Goal", "Map-Filename",
+                      "Suboptimality", "Time-To-First-Solution"
+               FROM stats WHERE "Expansions" IS NULL""", connection)
+        df_memory = pandas.read_sql_query(
+            """SELECT "Algorithm", "Map-Filename", "Memory-Used", "Open-List", "Closed-Set", "Parent-Map", "Path",
+                      "Expansions", "Generated", "Pushes", "Stale-Pops", "Re-Expansions"
+               FROM stats WHERE "Memory-Used" IS NOT NULL OR "Expansions" IS NOT NULL""", connection)
+    finally:
+        connection.close()
+    return df, df_memory
+
 def main() -> None:
-    """Main function to load, clean, filter, and combine metrics from CSV files."""
+    """Main function to load, clean, filter, and combine metrics from the results database (or CSV files)."""
 
-    df = pandas.read_csv("../results/Stats.csv", sep=";")
-    df_memory = pandas.read_csv("../results/Memory-Consumption.csv", sep=";")
+    df, df_memory = load_results()
 
     average_metrics = None
     average_memory_metrics = None
@@ -44,7 +71,8 @@ def main() -> None:
         )
 
         # columns for mean
-        numeric_columns = ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Found-Goal"]
+        numeric_columns = [column for column in ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Found-Goal",
+                                                 "Suboptimality", "Time-To-First-Solution"] if column in filtered_df]
         average_metrics = filtered_df.groupby(["Algorithm", "Map-Filename", "Map-Size", "Map-Number", "Space-Number"])[numeric_columns].mean().reset_index()
         average_metrics = average_metrics.sort_values(by=["Algorithm", "Map-Size", "Map-Number", "Space-Number"])
 
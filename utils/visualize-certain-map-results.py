@@ -1,8 +1,39 @@
 import pandas
 import matplotlib.pyplot as plt
 import os
+import sqlite3
 from tkinter import filedialog
 
+DATABASE = "../results/results.db"
+
+def load_map_results(map_file_name: str):
+    """
+    Loads the average metrics per algorithm on a map, from the results database if it exists, otherwise from results.csv.
+
+    Args:
+        map_file_name: The name of the map file.
+
+    Returns:
+        A DataFrame with one row per algorithm.
+    """
+    if not os.path.exists(DATABASE):
+        return pandas.read_csv("../results/results.csv", delimiter=";")
+    connection = sqlite3.connect(DATABASE)
+    try:
+        return pandas.read_sql_query(
+            """SELECT "Algorithm", "Map-Filename", AVG("Path-Length") AS "Path-Length", AVG("Visited-Cubes") AS "Visited-Cubes",
+                      AVG("Max-Queue-Size") AS "Max-Queue-Size", AVG("Runtime") AS "Runtime", AVG("Found-Goal") AS "Found-Goal",
+                      AVG("Memory-Used") AS "Memory-Used", AVG("Open-List") AS "Open-List", AVG("Closed-Set") AS "Closed-Set",
+                      AVG("Parent-Map") AS "Parent-Map", AVG("Path") AS "Path", AVG("Expansions") AS "Expansions",
+                      AVG("Generated") AS "Generated", AVG("Pushes") AS "Pushes", AVG("Stale-Pops") AS "Stale-Pops",
+                      AVG("Re-Expansions") AS "Re-Expansions", AVG("Suboptimality") AS "Suboptimality",
+                      AVG("Time-To-First-Solution") AS "Time-To-First-Solution"
+               FROM stats WHERE "Map-Filename" = ? GROUP BY "Algorithm", "Map-Filename" ORDER BY "Algorithm"
+            """,
+            connection, params=(map_file_name,))
+    finally:
+        connection.close()
+
 def plot_metrics_for_selected_map(df, map_file_name: str, metrics: list, metrics_description: list) -> None:
     """
     Plots metrics for the selected map and saves metric-plots as png-files.
@@ -50,16 +81,24 @@ def plot_metrics_for_selected_map(df, map_file_name: str, metrics: list, metrics
 def main() -> None:
     """Main function to load result data, select a map file and to plot metrics from selected map."""
 
-    df = pandas.read_csv("../results/results.csv", delimiter=";")
-
     map_file = filedialog.askopenfilename(initialdir=os.getcwd(), filetypes=[("Text files", "*.txt")])
 
     if not map_file:
         print("No map file selected. Exiting...")
         return
 
-    metrics = ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Memory-Used", "Count-Of-Memory-Allocations", "Average-Allocation-Size"]
-    metrics_description = ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime (seconds)", "Memory-Used (KB)", "Count-Of-Memory-Allocations", "Average-Allocation-Size (bytes)"]
+    df = load_map_results(map_file.split("/")[-1])
+
+    metrics = ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime", "Memory-Used", "Open-List", "Closed-Set", "Parent-Map", "Path",
+               "Expansions", "Generated", "Pushes", "Stale-Pops", "Re-Expansions", "Suboptimality", "Time-To-First-Solution",
+               "Count-Of-Memory-Allocations", "Average-Allocation-Size"]
+    metrics_description = ["Path-Length", "Visited-Cubes", "Max-Queue-Size", "Runtime (seconds)", "Memory-Used (KB)", "Open-List (KB)", "Closed-Set (KB)",
+                           "Parent-Map (KB)", "Path (KB)", "Expansions", "Generated-Successors", "Open-List-Pushes", "Stale-Pops",
+                           "Re-Expansions", "Suboptimality-Bound", "Time-To-First-Solution (seconds)", "Count-Of-Memory-Allocations",
+                           "Average-Allocation-Size (bytes)"]
+    # older results (tracemalloc) have no breakdown, newer results no allocation counts (and no memory if it was not tracked)
+    metrics, metrics_description = zip(*[(metric, description) for metric, description in zip(metrics, metrics_description)
+                                         if metric in df.columns and df[metric].notna().any()])
 
     plot_metrics_for_selected_map(df, map_file.split("/")[-1] , metrics, metrics_description)
 